@@ -5,19 +5,82 @@ Araç Bakım Kayıtları Yönetim Sistemi - Modern GUI
 PyQt6 ile geliştirilmiş modern arayüz
 """
 
+from __future__ import annotations  # pd.DataFrame tip ipuçları pandas'ı yüklemesin
+
+import time
+# Açılış süresi ölçümünün başlangıcı (BAKIM_STARTUP_TIMING=1)
+_STARTUP_T0 = time.perf_counter()
+
 import sys
 import sqlite3
-import pandas as pd
+import importlib
+import hashlib   # Güncelleme dosyası doğrulaması için
 import os
-import requests  # Güncelleme sistemi için
-import json      # JSON işlemleri için
+import re
 import shutil    # Dosya kopyalama için
-import subprocess # Sistem komutları için
-import base64    # GitHub API için base64 encoding
+import threading # Arka plan işçileri için
 from datetime import datetime
-from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-from PyQt6.QtCore import QTextStream
-from PyQt6.QtGui import QTextDocument
+from itertools import chain
+from contextlib import contextmanager
+from functools import lru_cache
+
+class _LazyModule:
+    """Modülü ilk öznitelik erişiminde içe aktaran vekil.
+    Ağır kütüphaneler (pandas, numpy, requests) açılışta değil, ilk kullanıldıkları
+    işlemde (Excel aktarımı, güncelleme kontrolü vb.) yüklenir.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+pd = _LazyModule('pandas')
+np = _LazyModule('numpy')
+requests = _LazyModule('requests')        # Güncelleme sistemi için
+json = _LazyModule('json')                # JSON işlemleri için
+subprocess = _LazyModule('subprocess')    # Sistem komutları için
+base64 = _LazyModule('base64')            # GitHub API için base64 encoding
+
+class StartupTimer:
+    """Açılış süresi raporu. BAKIM_STARTUP_TIMING=1 ortam değişkeniyle açılır;
+    ilk çizim ve verilerin hazır olması tamamlanınca süreleri konsola yazar.
+    """
+    
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = {}
+        self.reported = False
+    
+    def mark(self, name):
+        """Adımın açılıştan bu yana geçen süresini kaydet (her adım bir kez)"""
+        if not self.enabled or name in self.marks:
+            return
+        self.marks[name] = time.perf_counter() - _STARTUP_T0
+        if not self.reported and 'ilk çizim' in self.marks and 'veriler hazır' in self.marks:
+            self.reported = True
+            self.report()
+    
+    def report(self):
+        print("⏱️ Açılış süreleri:")
+        for name, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            print(f"   {name:<26} {elapsed * 1000:8.1f} ms")
+
+STARTUP_TIMER = StartupTimer(os.environ.get('BAKIM_STARTUP_TIMING') == '1')
+
+# Açılışta güncelleme kontrolü, pencere çizildikten bu kadar sonra başlar (ms)
+UPDATE_CHECK_DELAY_MS = 3000
+# Son güncelleme kontrolünden bu kadar saat geçmeden GitHub'a yeniden sorulmaz
+# (ayarlardaki "update_check_interval_hours" ile değiştirilebilir)
+UPDATE_CHECK_INTERVAL_HOURS = 24
+# Güncelleme indirmesi: release'teki EXE adı, diske yazılan parça boyutu (bayt) ve bağlantı zaman aşımı (sn)
+UPDATE_EXE_NAME = "AracBakimYonetim.exe"
+UPDATE_CHUNK_SIZE = 256 * 1024
+UPDATE_TIMEOUT = 30
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QGridLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
@@ -25,9 +88,12 @@ from PyQt6.QtWidgets import (
     QTabWidget, QGroupBox, QFrame, QSplitter, QHeaderView, QAbstractItemView,
     QFileDialog, QProgressBar, QStatusBar, QMenuBar, QMenu, QDialog,
     QDialogButtonBox, QFormLayout, QCheckBox, QScrollArea, QToolButton,
-    QRadioButton
+    QRadioButton, QTableView, QProgressDialog, QInputDialog
+)
+from PyQt6.QtCore import (
+    Qt, QDate, QTimer, pyqtSignal, QThread, QSize, QSettings, QDateTime,
+    QAbstractTableModel, QSortFilterProxyModel, QModelIndex, QObject, pyqtSlot
 )
-from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSignal, QThread, QSize, QSettings, QDateTime
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QAction, QPixmap
 
 # ---------------------- Modern Renk Paleti ----------------------
@@ -74,6 +140,82 @@ def normalize_text(value: str) -> str:
     text = ' '.join(text.split())
     return text.upper()
 
+def search_tokens(text):
+    """Arama metninin Türkçe katlanmış, küçük harfli kelimeleri"""
+    return re.findall(r'\w+', normalize_text(text).lower())
+
+def build_fts_query(text):
+    """Arama metnini Türkçe katlanmış, önek eşleşmeli FTS5 sorgusuna çevirir.
+    Örn. "34 ab" -> '"34"* "ab"*' (tüm kelimeler eşleşmeli). Boş metin için '' döner.
+    """
+    return ' '.join(f'"{token}"*' for token in search_tokens(text))
+
+def record_search_words(record):
+    """Kaydın FTS indeksindeki kelimelerinin bellek içi karşılığı: (plaka kelimeleri, tüm kelimeler).
+    Önceki arama sonucunu daraltan aramalar veritabanına gitmeden bununla süzülür.
+    """
+    plate = normalize_text(record[2]).lower()
+    plate_words = set(re.findall(r'\w+', plate))
+    plate_words.add(re.sub(r'[\s-]', '', plate))
+    words = set(plate_words)
+    for index in (3, 4, 8, 9, 10):  # kapi_no, bolge, yapilan_islem, diger, bakim_yapan
+        words.update(re.findall(r'\w+', normalize_text(record[index]).lower()))
+    return plate_words, words
+
+def words_match(tokens, words):
+    """Her arama kelimesi, kelimelerden en az birinin öneki mi? (FTS5 "kelime"* eşleşmesi)"""
+    return all(any(word.startswith(token) for word in words) for token in tokens)
+
+def _fts_fold_sql(column):
+    """FTS5'e yazılacak sütunun SQL ifadesi. unicode61 tokenizer büyük/küçük harf ve
+    aksanları (ç, ş, ğ, ö, ü, İ) kendisi katlar; yalnızca noktasız ı elle i yapılır.
+    """
+    return f"replace({column}, 'ı', 'i')"
+
+def _fts_plate_key_sql(column):
+    """Plakanın boşluksuz hali ("34AB123" aramaları için)"""
+    return f"replace(replace(replace({_fts_fold_sql(column)}, ' ', ''), '-', ''), '.', '')"
+
+# FTS5 indeksindeki sütunlar ve bakimlar tablosundan nasıl üretildikleri
+FTS_COLUMNS = [
+    ('plaka', lambda prefix: _fts_fold_sql(f'{prefix}plaka')),
+    ('plaka_key', lambda prefix: _fts_plate_key_sql(f'{prefix}plaka')),
+    ('kapi_no', lambda prefix: _fts_fold_sql(f'{prefix}kapi_no')),
+    ('bolge', lambda prefix: _fts_fold_sql(f'{prefix}bolge')),
+    ('yapilan_islem', lambda prefix: _fts_fold_sql(f'{prefix}yapilan_islem')),
+    ('diger', lambda prefix: _fts_fold_sql(f'{prefix}diger')),
+    ('bakim_yapan', lambda prefix: _fts_fold_sql(f'{prefix}bakim_yapan')),
+]
+
+# Arama sonuçlarında gösterilecek en fazla kayıt (en alakalılar)
+SEARCH_RESULT_LIMIT = 1000
+# Yazarken arama için bekleme süresi (ms)
+SEARCH_DEBOUNCE_MS = 250
+# Tablolar sayfa sayfa doldurulur; kaydırdıkça sonraki sayfa istenir
+RECORDS_PAGE_SIZE = 500
+VEHICLES_PAGE_SIZE = 200
+# DatabaseManager.query_records sıralama seçenekleri
+RECORD_ORDERS = {
+    'tarih': 'tarih_key ASC, id ASC',
+    'tarih_desc': 'tarih_key DESC, id DESC',
+    'plaka': 'plaka ASC, tarih_key ASC, id ASC',
+}
+# Bakım zamanı: sonraki bakım km'sine bu kadar km kaldıysa ya da son bakımdan
+# SERVICE_INTERVAL_DAYS gün geçtiyse araç bakıma girer
+DUE_KM_THRESHOLD = 1000
+SERVICE_INTERVAL_DAYS = 180
+# "Bu hafta bakımı gelenler" penceresi (gün)
+DUE_WITHIN_DAYS = 7
+# Araç içe aktarımında plakası zaten kayıtlı araçlar için birleştirme kuralları
+VEHICLE_MERGE_RULES = {
+    'overwrite': 'Üzerine yaz',
+    'keep': 'Mevcut bilgileri koru',
+    'fill_blanks': 'Yalnızca boş alanları doldur',
+}
+# Excel'de hiç bulunmayan sütunun hücre değeri; boş hücreden (None) farklıdır ve
+# birleştirmede kayıtlı değer her kuralda korunur
+MISSING_CELL = object()
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Excel'den gelen sütun adlarını esnek eşleştirme ile normalize eder."""
     # Desteklenen hedef adlar
@@ -145,13 +287,48 @@ def format_thousands_dot(number: int) -> str:
     except Exception:
         return str(number)
 
+# Tarihi olmayan / çözümlenemeyen kayıtların sıralama anahtarı (listenin sonuna düşer)
+MISSING_DATE_KEY = 99999999
+# Tekil tarih dönüşümlerinin önbelleği (farklı tarih metni sayısı)
+DATE_CACHE_SIZE = 8192
+# Bu sayıdan az tarih tek tek (önbellekli) çözülür; pandas yalnızca büyük toplu işlerde yüklenir
+DATE_VECTOR_MIN_ROWS = 1000
+
+def _memoized_date(function):
+    """Tarih dönüşümünü sınırlı LRU önbelleğiyle sar. Aynı birkaç bin tarih metni
+    tekrar tekrar çözülür; hash'lenemeyen değerler önbelleğe alınmadan dönüştürülür.
+    """
+    cached = lru_cache(maxsize=DATE_CACHE_SIZE, typed=True)(function)
+
+    def wrapper(value):
+        try:
+            return cached(value)
+        except TypeError:
+            return function(value)
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+def _to_datetime_each(values):
+    """Farklı biçimlerdeki değerleri tek to_datetime çağrısıyla (gün önce) çöz.
+    pandas 2 ilk değerden biçim çıkarıp diğerlerini atmasın diye her değer ayrı yorumlanır.
+    """
+    try:
+        return pd.to_datetime(values, dayfirst=True, errors='coerce', format='mixed')
+    except (TypeError, ValueError):
+        # pandas < 2.0: 'mixed' yok; biçim belirtilmezse değerler zaten tek tek çözülür
+        return pd.to_datetime(values, dayfirst=True, errors='coerce')
+
+@_memoized_date
 def normalize_date_display(value):
     """Tarihi ekranda dd.MM.yyyy göster ve doğru sıralama anahtarı döndür.
     Girdi dd.MM.yyyy veya yyyymmdd olabilir.
     Dönen: (display_str, sort_key_int)
     """
     if value in (None, ""):
-        return "-", 99999999
+        return "-", MISSING_DATE_KEY
     try:
         s = str(value).strip()
         # yyyymmdd (8 hane, sadece rakam)
@@ -171,10 +348,59 @@ def normalize_date_display(value):
                 return ts.strftime('%d.%m.%Y'), int(ts.strftime('%Y%m%d'))
         except Exception:
             pass
-        return s, 99999999
+        return s, MISSING_DATE_KEY
     except Exception:
-        return str(value), 99999999
+        return str(value), MISSING_DATE_KEY
+
+def date_sort_key(value):
+    """Tarih değerinin yyyymmdd tamsayı anahtarını döndürür (bakimlar.tarih_key)."""
+    return normalize_date_display(value)[1]
+
+def normalize_date_display_array(values):
+    """normalize_date_display'in dizi karşılığı.
+    dd.MM.yyyy ve yyyymmdd biçimleri metin işlemleriyle, kalan farklı değerler
+    tek to_datetime çağrısıyla çözülür.
+    Dönen: (görüntü metinleri listesi, yyyymmdd anahtarları int64 dizisi)
+    """
+    series = pd.Series(list(values), dtype=object)
+    if series.empty:
+        return [], np.array([], dtype=np.int64)
+    text = series.astype(str).str.strip()
+    present = series.notna() & (series != '')
+    display = pd.Series('-', index=series.index, dtype=object)
+    keys = pd.Series(MISSING_DATE_KEY, index=series.index, dtype='int64')
+    # yyyymmdd (8 hane, sadece rakam)
+    is_compact = present & text.str.fullmatch(r'\d{8}')
+    compact = text[is_compact]
+    display[is_compact] = compact.str[6:8] + '.' + compact.str[4:6] + '.' + compact.str[0:4]
+    keys[is_compact] = compact.astype('int64')
+    # dd.MM.yyyy (sonunda saat olabilir)
+    is_dotted = present & ~is_compact & text.str.match(r'^\d{2}\.\d{2}\.\d{4}')
+    dotted = text[is_dotted]
+    display[is_dotted] = dotted.str[:10]
+    keys[is_dotted] = (dotted.str[6:10] + dotted.str[3:5] + dotted.str[0:2]).astype('int64')
+    # Genel dönüştürme: farklı değerler tek seferde
+    rest = present & ~is_compact & ~is_dotted
+    if rest.any():
+        unique = text[rest].unique()
+        parsed = pd.Series(_to_datetime_each(unique), index=unique)
+        valid = parsed.notna()
+        mapped_display = pd.Series(unique, index=unique, dtype=object)
+        mapped_display[valid] = parsed[valid].dt.strftime('%d.%m.%Y')
+        mapped_keys = pd.Series(MISSING_DATE_KEY, index=unique, dtype='int64')
+        mapped_keys[valid] = parsed[valid].dt.strftime('%Y%m%d').astype('int64')
+        display[rest] = text[rest].map(mapped_display)
+        keys[rest] = text[rest].map(mapped_keys)
+    return display.tolist(), keys.to_numpy()
+
+def date_sort_keys(values):
+    """date_sort_key'in dizi karşılığı: yyyymmdd anahtarlarının listesi"""
+    values = list(values)
+    if len(values) < DATE_VECTOR_MIN_ROWS:
+        return [date_sort_key(value) for value in values]
+    return normalize_date_display_array(values)[1].tolist()
 
+@_memoized_date
 def ensure_ddmmyyyy(value):
     """Excel'den gelen tarih değerini kesin olarak dd.MM.yyyy formatına dönüştürür.
     Geçersizse None döner.
@@ -205,18 +431,720 @@ def ensure_ddmmyyyy(value):
     except Exception:
         return None
 
+def parse_km_series(series: pd.Series) -> pd.Series:
+    """parse_km'nin sütun bazlı karşılığı: tüm sütunu tek seferde tamsayıya çevirir.
+    Çözümlenemeyen hücreler None olur.
+    """
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind in ('integer', 'floating', 'mixed-integer-float', 'decimal', 'empty'):
+        numbers = pd.to_numeric(series, errors='coerce')
+    elif kind not in ('string', 'mixed', 'mixed-integer'):
+        # Beklenmeyen tipler (bool, tarih vb.) için tekil dönüşüm
+        return series.astype(object).map(parse_km).astype(object)
+    else:
+        series = series.astype(object)
+        # Metin hücreler: boşluk/nokta/virgül temizlenip sayıya çevrilir
+        cleaned = series.str.replace(r'[\s.,]', '', regex=True)
+        from_text = pd.to_numeric(cleaned.where(cleaned != ''), errors='coerce')
+        # Metin olmayan hücreler (int/float) doğrudan sayı kabul edilir
+        from_number = pd.to_numeric(series.where(cleaned.isna()), errors='coerce')
+        numbers = from_text.fillna(from_number)
+    numbers = np.trunc(numbers.astype('float64')).astype('Int64')
+    return numbers.astype(object).where(numbers.notna(), None)
+
+def ensure_ddmmyyyy_series(series: pd.Series) -> pd.Series:
+    """ensure_ddmmyyyy'nin sütun bazlı karşılığı.
+    dd.MM.yyyy ve yyyymmdd biçimleri toplu çözülür; kalan farklı değerler
+    (datetime, 2025-10-07 vb.) tek to_datetime çağrısıyla çözülür.
+    """
+    series = series.astype(object)
+    text = series.astype(str).str.strip()
+    present = series.notna() & (text != '')
+    # dd.MM.yyyy (sonunda saat olabilir)
+    is_dotted = present & text.str.match(r'^\d{2}\.\d{2}\.\d{4}') & text.str.len().between(10, 19)
+    dotted = pd.to_datetime(text.str[:10].where(is_dotted), format='%d.%m.%Y', errors='coerce')
+    # 8 haneli yyyymmdd
+    is_compact = present & text.str.fullmatch(r'\d{8}')
+    compact = pd.to_datetime(text.where(is_compact), format='%Y%m%d', errors='coerce')
+    parsed = dotted.fillna(compact)
+    result = parsed.dt.strftime('%d.%m.%Y').astype(object).where(parsed.notna(), None)
+    # Genel dönüştürme: farklı değerler tek seferde çözülür
+    rest = present & parsed.isna()
+    if rest.any():
+        unique = pd.Series(series[rest].unique(), dtype=object)
+        general = pd.Series(_to_datetime_each(unique.tolist()))
+        mapping = dict(zip(unique, general.dt.strftime('%d.%m.%Y').where(general.notna(), None)))
+        result[rest] = series[rest].map(mapping)
+    return result.where(result.notna(), None)
+
+def _text_series(series: pd.Series) -> pd.Series:
+    """str(...) if pd.notna(...) dönüşümünün sütun bazlı karşılığı."""
+    series = series.astype(object)
+    return series.astype(str).astype(object).where(series.notna(), None)
+
+def prepare_maintenance_rows(df: pd.DataFrame) -> list:
+    """Normalize edilmiş bakım DataFrame'ini DatabaseManager.add_records_bulk
+    için (s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
+    yapilan_islem, diger, bakim_yapan) satırlarına çevirir. PLAKA'sı boş
+    satırlar atlanır.
+    """
+    df = df[df['PLAKA'].notna()]
+    if df.empty:
+        return []
+
+    def column(name):
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    columns = [
+        [None] * len(df),  # S.NO
+        _text_series(df['PLAKA']),
+        _text_series(column('KAPI NUMARASI')),
+        _text_series(column('BÖLGE')),
+        ensure_ddmmyyyy_series(column('TARİH')),
+        parse_km_series(column('BAKIM ESNASINDA KM')),
+        parse_km_series(column('BİR SONRAKİ BAKIM KM')),
+        _text_series(column('YAPILAN İŞLEM')),
+        _text_series(column('DİĞER')),
+        _text_series(column('BAKIMI YAPAN')),
+    ]
+    return list(zip(*(list(c) for c in columns)))
+
+def prepare_vehicle_rows(df: pd.DataFrame) -> list:
+    """Normalize edilmiş araç DataFrame'ini DatabaseManager.upsert_araclar için
+    (arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, durum)
+    satırlarına çevirir. PLAKA'sı boş satırlar atlanır; sayı olmayan model yılı None olur.
+    Dosyada bulunmayan sütunların hücreleri MISSING_CELL olur (boş hücre None kalır).
+    """
+    if 'PLAKA' not in df.columns:
+        return []
+    plaka = _text_series(df['PLAKA']).str.strip()
+    df = df[plaka.notna() & (plaka != '')]
+    if df.empty:
+        return []
+
+    def text_column(name):
+        if name in df.columns:
+            return _text_series(df[name])
+        return [MISSING_CELL] * len(df)
+
+    if 'MODEL_YILI' in df.columns:
+        model_yili = pd.to_numeric(df['MODEL_YILI'], errors='coerce')
+        model_yili = [int(year) if pd.notna(year) else None for year in model_yili]
+    else:
+        model_yili = [MISSING_CELL] * len(df)
+    columns = [
+        text_column('ARAC_MAKINE_ADI'),
+        plaka[df.index],
+        text_column('MAKINE_NO'),
+        text_column('MARKA'),
+        text_column('MODEL'),
+        model_yili,
+        text_column('HESAP_ADI'),
+        text_column('DURUM'),
+    ]
+    return list(zip(*(list(c) for c in columns)))
+
+# Akışlı içe aktarımda veritabanına tek seferde yazılan satır sayısı
+IMPORT_CHUNK_SIZE = 5000
+
+class ExcelChunkReader:
+    """Excel dosyasını sabit boyutlu DataFrame parçaları halinde okur.
+    .xlsx dosyaları openpyxl read_only modunda satır satır akıtılır; bellek kullanımı
+    dosya boyutundan bağımsızdır. .xls (veya openpyxl'in açamadığı) dosyalar pandas
+    ile okunup aynı biçimde parçalanır. Başlık satırına normalize fonksiyonu uygulanır.
+    """
+    
+    def __init__(self, file_path, normalize, chunk_size=IMPORT_CHUNK_SIZE):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.workbook = None
+        self.frame = None
+        self.total_rows = None
+        self._rows = iter(())
+        
+        header = []
+        if not file_path.lower().endswith('.xls'):
+            try:
+                from openpyxl import load_workbook
+                self.workbook = load_workbook(file_path, read_only=True, data_only=True)
+            except Exception:
+                self.workbook = None
+        if self.workbook is not None:
+            sheet = self.workbook.worksheets[0]
+            self._rows = sheet.iter_rows(values_only=True)
+            header = list(next(self._rows, None) or ())
+            if sheet.max_row:
+                self.total_rows = max(sheet.max_row - 1, 0)
+        else:
+            self.frame = pd.read_excel(file_path)
+            header = list(self.frame.columns)
+            self.total_rows = len(self.frame)
+        
+        # Boş ve tekrar eden başlıkları pandas gibi adlandır (Unnamed: n, AD.1)
+        names = []
+        for index, name in enumerate(header):
+            name = f"Unnamed: {index}" if name is None else str(name)
+            base, suffix = name, 1
+            while name in names:
+                name = f"{base}.{suffix}"
+                suffix += 1
+            names.append(name)
+        self.columns = list(normalize(pd.DataFrame(columns=names)).columns)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Dosya tutamacını serbest bırak"""
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+    
+    def __iter__(self):
+        if self.frame is not None:
+            frame = self.frame.set_axis(self.columns, axis=1)
+            for start in range(0, len(frame), self.chunk_size):
+                yield frame.iloc[start:start + self.chunk_size]
+            return
+        
+        width = len(self.columns)
+        batch = []
+        for row in self._rows:
+            # Tamamen boş satırları atla
+            if all(value is None for value in row):
+                continue
+            row = tuple(row[:width])
+            if len(row) < width:
+                row += (None,) * (width - len(row))
+            batch.append(row)
+            if len(batch) >= self.chunk_size:
+                yield pd.DataFrame(batch, columns=self.columns, dtype=object)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=self.columns, dtype=object)
+
+# write_only modunda sütun genişlikleri ilk satırdan önce yazılmak zorunda;
+# genişlikler başlık ve bu kadar satırlık tampondan hesaplanır
+EXPORT_WIDTH_SAMPLE_ROWS = 1000
+
+def export_rows_to_excel(file_path, sheet_title, headers, rows, widths=None, max_width=50, extra_sheets=()):
+    """Satırları openpyxl write_only çalışma kitabına akıtarak yazar.
+    rows herhangi bir iterable olabilir (ör. sqlite cursor); bellekte yalnızca genişlik
+    tamponu tutulur. widths verilmezse sütun genişlikleri satırlar okunurken izlenir.
+    extra_sheets: ek sayfalar için (sayfa adı, başlıklar, satırlar) demetleri.
+    İlk sayfaya yazılan veri satırı sayısını döndürür.
+    """
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    count = _write_sheet(workbook, sheet_title, headers, rows, widths, max_width)
+    for title, sheet_headers, sheet_rows in extra_sheets:
+        _write_sheet(workbook, title, sheet_headers, sheet_rows, None, max_width)
+    workbook.save(file_path)
+    return count
+
+def _write_sheet(workbook, sheet_title, headers, rows, widths, max_width):
+    """export_rows_to_excel için tek sayfayı yaz; yazılan veri satırı sayısını döndür"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
+    sheet = workbook.create_sheet(sheet_title)
+    rows = iter(rows)
+    
+    buffered = []
+    if widths is None:
+        lengths = [len(str(header)) for header in headers]
+        for row in rows:
+            buffered.append(row)
+            for index, value in enumerate(row):
+                if value is not None and len(str(value)) > lengths[index]:
+                    lengths[index] = len(str(value))
+            if len(buffered) >= EXPORT_WIDTH_SAMPLE_ROWS:
+                break
+        widths = [min(length + 2, max_width) for length in lengths]
+    for index, width in enumerate(widths, 1):
+        sheet.column_dimensions[get_column_letter(index)].width = width
+    
+    header_font = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.font = header_font
+        header_cells.append(cell)
+    sheet.append(header_cells)
+    
+    count = 0
+    for row in buffered:
+        sheet.append(row)
+        count += 1
+    buffered.clear()
+    for row in rows:
+        sheet.append(row)
+        count += 1
+    return count
+
+# Bakım kaydı satırının sütunları: (0)id ... (12)tarih_key, (13)bağlı aracın santiye_id'si.
+# bakimlar tablosu "b" takma adıyla sorgulanmalıdır
+RECORD_COLUMNS = '''b.id, b.s_no, b.plaka, b.kapi_no, b.bolge, b.tarih, b.bakim_km, b.sonraki_bakim_km,
+                       b.yapilan_islem, b.diger, b.bakim_yapan, b.kayit_tarihi, b.tarih_key, b.santiye_id'''
+
+class RecordFilter:
+    """Filtre çubuğu durumunun derlenmiş hali (bölge, bakım yapan, şantiye, tarih aralığı).
+    Aynı filtre hem tablo için kayıt indeksi üzerinde vektörel maskeye (mask) hem de
+    dışa aktarım için SQL koşuluna (sql) çevrilir; iki yol aynı kuralları uygular.
+    None olan filtre devre dışıdır. Tarihi olmayan kayıtlar tarih filtresinden her zaman geçer.
+    """
+
+    FIELDS = ('bolge', 'bakim_yapan', 'santiye_id')
+    # Alanların kayıt satırındaki yeri (bkz. RECORD_COLUMNS)
+    RECORD_INDEX = {'bolge': 4, 'bakim_yapan': 10, 'santiye_id': 13}
+
+    def __init__(self, bolge=None, bakim_yapan=None, date_range=None, santiye_id=None):
+        self.bolge = bolge
+        self.bakim_yapan = bakim_yapan
+        self.date_range = tuple(date_range) if date_range is not None else None
+        self.santiye_id = santiye_id
+
+    def _key(self):
+        return (self.bolge, self.bakim_yapan, self.date_range, self.santiye_id)
+
+    @classmethod
+    def record_value(cls, record, field):
+        """Kayıt satırındaki alan değeri (sütun yoksa None)"""
+        index = cls.RECORD_INDEX[field]
+        return record[index] if len(record) > index else None
+
+    def __eq__(self, other):
+        return isinstance(other, RecordFilter) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    @property
+    def is_empty(self):
+        return self._key() == (None, None, None, None)
+
+    def field_values(self):
+        """Etkin alan filtreleri: [(alan, değer), ...]"""
+        return [(field, getattr(self, field)) for field in self.FIELDS if getattr(self, field) is not None]
+
+    def sql(self):
+        """bakimlar için (WHERE koşulu, parametreler); filtre boşsa ('', [])"""
+        conditions = []
+        params = []
+        if self.date_range is not None:
+            # tarih_key >= başlangıç, (tarih_key, id) indeksinde sıralı taramaya izin verir;
+            # tarihsiz kayıtların anahtarı (MISSING_DATE_KEY) her zaman bu aralıktadır.
+            # Tekli + ikinci koşulun ayrı indeks aramalarına (MULTI-INDEX OR + sıralama) bölünmesini önler
+            conditions.append('tarih_key >= ? AND (+tarih_key <= ? OR +tarih_key = ?)')
+            params.extend((*self.date_range, MISSING_DATE_KEY))
+        for field, value in self.field_values():
+            if field == 'santiye_id':
+                # Kayıtlar (santiye_id, tarih_key, id) indeksinden tarih sırasıyla okunur
+                conditions.append('santiye_id = ?')
+                params.append(value)
+            # Düz eşitlik (bolge, bakim_yapan) indekslerini kullanabilir; boş değer NULL'ı da kapsar
+            elif value == '':
+                conditions.append(f"({field} IS NULL OR {field} = '')")
+            else:
+                conditions.append(f"{field} = ?")
+                params.append(value)
+        return ' AND '.join(conditions), params
+
+    def matches(self, record):
+        """Tek bir DB satırı (bkz. get_all_records) filtreden geçiyor mu?"""
+        if self.date_range is not None:
+            key = RecordFilterIndex.record_key(record)
+            start, end = self.date_range
+            if key != MISSING_DATE_KEY and not start <= key <= end:
+                return False
+        return all((self.record_value(record, field) or '') == value for field, value in self.field_values())
+
+    def mask(self, index):
+        """RecordFilterIndex üzerinde kabul edilen satırların bool dizisi; filtre boşsa None"""
+        if self.is_empty:
+            return None
+        arrays = index.arrays()
+        mask = np.ones(len(index), dtype=bool)
+        if self.date_range is not None:
+            keys = arrays['tarih_key']
+            start, end = self.date_range
+            mask &= (keys == MISSING_DATE_KEY) | ((keys >= start) & (keys <= end))
+        for field, value in self.field_values():
+            code = index.categories[field].get(value)
+            if code is None:
+                # Bu değer hiçbir kayıtta yok
+                return np.zeros(len(index), dtype=bool)
+            mask &= arrays[field] == code
+        return mask
+
+class RecordFilterIndex:
+    """Filtrelenen alanların kayıtlar yüklenirken bir kez hesaplanan anahtarları.
+    Tarih yyyymmdd tamsayısı, bölge, bakım yapan ve şantiye değer -> kod sözlüğüyle tamsayı
+    olarak tutulur; NumPy dizileri ilk filtrede oluşturulup sonraki filtrelerde kullanılır.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.tarih_keys = []
+        self.codes = {field: [] for field in RecordFilter.FIELDS}
+        self.categories = {field: {} for field in RecordFilter.FIELDS}
+        self._arrays = None
+        # Her değişiklikte artar; önbelleğe alınmış maskeler bununla geçersiz sayılır
+        self.version = 0
+
+    def __len__(self):
+        return len(self.tarih_keys)
+
+    def _encode(self, field, value):
+        categories = self.categories[field]
+        return categories.setdefault(value or '', len(categories))
+
+    @staticmethod
+    def record_key(record):
+        """Kaydın tarih_key değeri (sütun yoksa tarihten hesaplanır)"""
+        return record[12] if len(record) > 12 and record[12] is not None else date_sort_key(record[5])
+    
+    def _changed(self):
+        self._arrays = None
+        self.version += 1
+    
+    def extend(self, records):
+        """DB satırlarının (bkz. get_all_records) anahtarlarını ekle"""
+        self.tarih_keys.extend(self.record_key(r) for r in records)
+        for field in RecordFilter.FIELDS:
+            self.codes[field].extend(self._encode(field, RecordFilter.record_value(r, field)) for r in records)
+        self._changed()
+    
+    def insert(self, row, record):
+        """Kaydın anahtarlarını verilen satıra ekle"""
+        self.tarih_keys.insert(row, self.record_key(record))
+        for field in RecordFilter.FIELDS:
+            self.codes[field].insert(row, self._encode(field, RecordFilter.record_value(record, field)))
+        self._changed()
+    
+    def update(self, row, record):
+        """Satırın anahtarlarını güncellenen kayıttan yeniden hesapla"""
+        self.tarih_keys[row] = self.record_key(record)
+        for field in RecordFilter.FIELDS:
+            self.codes[field][row] = self._encode(field, RecordFilter.record_value(record, field))
+        self._changed()
+    
+    def remove(self, row):
+        del self.tarih_keys[row]
+        for field in RecordFilter.FIELDS:
+            del self.codes[field][row]
+        self._changed()
+
+    def arrays(self):
+        """Sütun dizileri: {'tarih_key': int64, alan: int32 kodlar}"""
+        if self._arrays is None:
+            self._arrays = {'tarih_key': np.array(self.tarih_keys, dtype=np.int64)}
+            for field in RecordFilter.FIELDS:
+                self._arrays[field] = np.array(self.codes[field], dtype=np.int32)
+        return self._arrays
+
+# Bağlantı ayarları: WAL'da synchronous=NORMAL her commit'te fsync yapmaz,
+# cache_size negatifse KiB cinsindendir
+DB_PRAGMAS = {
+    'synchronous': 'NORMAL',
+    'cache_size': -20000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+class ConnectionManager:
+    """SQLite bağlantı yöneticisi.
+    Veritabanını WAL modunda açar ve her thread'e kendi bağlantısını verir; böylece
+    okuyucular yazıcıyı beklemez. Yazma işlemleri transaction() ile tek yazıcıya
+    sıralanır.
+    """
+    
+    def __init__(self, db_name, pragmas=None, busy_timeout=5.0):
+        self.db_name = db_name
+        self.pragmas = dict(DB_PRAGMAS, **(pragmas or {}))
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self.journal_mode = None
+    
+    def connection(self):
+        """Çağıran thread'in bağlantısını döndür (yoksa aç)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Bağlantı yalnızca açan thread'de kullanılır; close() kapanışta ana thread'den çağrılabilsin
+            conn = sqlite3.connect(self.db_name, timeout=self.busy_timeout, check_same_thread=False)
+            mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()
+            self.journal_mode = mode[0] if mode else None
+            for name, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Yazma transaction'ı: tek yazıcı kilidi altında BEGIN IMMEDIATE ... COMMIT.
+        Hata olursa geri alır ve hatayı yeniden fırlatır. İç içe kullanılabilir.
+        """
+        conn = self.connection()
+        with self._write_lock:
+            if self._local.depth == 0:
+                if conn.in_transaction:
+                    conn.commit()
+                conn.execute("BEGIN IMMEDIATE")
+            self._local.depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._local.depth -= 1
+                if self._local.depth == 0:
+                    conn.rollback()
+                raise
+            else:
+                self._local.depth -= 1
+                if self._local.depth == 0:
+                    conn.commit()
+    
+    def close(self):
+        """Açık tüm bağlantıları kapat"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+def date_key_days(keys):
+    """yyyymmdd anahtar dizisini 1970'ten bu yana gün sayısına (int64) çevir"""
+    keys = np.asarray(keys, dtype=np.int64)
+    months = (keys // 10000 - 1970) * 12 + (keys // 100 % 100 - 1)
+    return (months.astype('datetime64[M]').astype('datetime64[D]') + (keys % 100 - 1)).astype(np.int64)
+
+def format_day(day):
+    """date_key_days gün sayısını dd.MM.yyyy metnine çevir"""
+    year, month, day = str(np.datetime64(int(day), 'D')).split('-')
+    return f"{day}.{month}.{year}"
+
+class KmForecaster:
+    """Plakaların km geçmişinden günlük km kullanımını öğrenip sonraki bakım tarihini tahmin eder.
+    Her plaka için (gün, km) noktalarının en küçük kareler toplamları (n, Σx, Σy, Σx², Σxy) ve
+    son okuma NumPy dizilerinde tutulur; tüm araçların eğimi tek vektörel işlemle hesaplanır.
+    Yeni kayıt toplamlara eklenir (add); güncellenen / silinen kayıtların plakaları geçmişlerinden
+    yeniden kurulur (refit). Geçmiş satırları: (id, plaka, tarih_key, bakim_km), bkz. get_km_history.
+    """
+    
+    def __init__(self, history=()):
+        self.rows = {}            # plaka -> dizi satırı
+        self.record_plates = {}   # kayıt id -> plaka (güncelleme / silmede etkilenen plakalar için)
+        self._sums = np.zeros((0, 5))
+        self._last = np.zeros((0, 2))   # son okuma: (gün, km)
+        self.fit(history)
+    
+    def _row(self, plaka):
+        row = self.rows.get(plaka)
+        if row is None:
+            row = self.rows[plaka] = len(self.rows)
+            self._sums = np.vstack([self._sums, np.zeros((1, 5))])
+            self._last = np.vstack([self._last, [[-np.inf, np.nan]]])
+        return row
+    
+    def fit(self, history):
+        """Tüm geçmişi tek seferde yükle (bincount ile plaka başına toplamlar)"""
+        history = list(history)
+        self.rows = {}
+        self.record_plates = {record_id: plaka for record_id, plaka, _, _ in history}
+        if not history:
+            self._sums = np.zeros((0, 5))
+            self._last = np.zeros((0, 2))
+            return
+        _, plates, keys, kms = zip(*history)
+        names, codes = np.unique(np.array(plates, dtype=object), return_inverse=True)
+        self.rows = {plaka: row for row, plaka in enumerate(names)}
+        days = date_key_days(keys).astype(np.float64)
+        kms = np.asarray(kms, dtype=np.float64)
+        count = len(names)
+        self._sums = np.column_stack([
+            np.bincount(codes, minlength=count),
+            np.bincount(codes, days, count),
+            np.bincount(codes, kms, count),
+            np.bincount(codes, days * days, count),
+            np.bincount(codes, days * kms, count),
+        ]).astype(np.float64)
+        # Son okuma: plaka içinde (gün, km) sırasının sonuncusu
+        order = np.lexsort((kms, days, codes))
+        last = order[np.r_[codes[order][1:] != codes[order][:-1], True]]
+        self._last = np.column_stack([days[last], kms[last]])
+    
+    def add(self, record_id, plaka, tarih_key, km):
+        """Tek okumayı plakanın toplamlarına ekle (yeniden hesaplama gerekmez)"""
+        # get_km_history ile aynı koşul: tarihli ve km'si pozitif tamsayı olan kayıtlar
+        if tarih_key is None or tarih_key >= MISSING_DATE_KEY or not isinstance(km, int) or km <= 0:
+            return
+        day = float(date_key_days([tarih_key])[0])
+        row = self._row(plaka)
+        self._sums[row] += (1, day, km, day * day, day * km)
+        if (day, km) >= tuple(self._last[row]):
+            self._last[row] = (day, km)
+        self.record_plates[record_id] = plaka
+    
+    def plates_of(self, record_ids):
+        """Kayıtların katkıda bulunduğu plakalar"""
+        return {self.record_plates[record_id] for record_id in record_ids if record_id in self.record_plates}
+    
+    def refit(self, plates, history):
+        """Plakaların toplamlarını sıfırlayıp verilen geçmişten yeniden kur"""
+        for plaka in plates:
+            row = self.rows.get(plaka)
+            if row is not None:
+                self._sums[row] = 0
+                self._last[row] = (-np.inf, np.nan)
+        self.record_plates = {record_id: plaka for record_id, plaka in self.record_plates.items()
+                              if plaka not in plates}
+        for record in history:
+            self.add(*record)
+    
+    def rates(self):
+        """Plaka satırlarına göre günlük km hızı (km/gün); en az iki farklı günde okuma yoksa ya da
+        km artmıyorsa NaN
+        """
+        n, sx, sy, sxx, sxy = self._sums.T
+        denominator = n * sxx - sx * sx
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (n * sxy - sx * sy) / denominator
+        return np.where((n >= 2) & (denominator > 0) & (slope > 0), slope, np.nan)
+    
+    def forecast(self, plates, targets, today):
+        """Plakaların hedef km'ye (sonraki_bakim_km) ulaşacağı günü tahmin et.
+        targets: plakalarla aynı sırada hedef km (None olabilir); today: date_key_days günü.
+        Dönen: plaka başına (günlük_km, bugünkü tahmini km, tahmini gün, kalan gün) demetleri;
+        tahmin yapılamayan alanlar None.
+        """
+        rows = np.array([self.rows.get(plaka, -1) for plaka in plates], dtype=np.int64)
+        known = rows >= 0
+        rate = np.full(len(rows), np.nan)
+        last_day = np.full(len(rows), np.nan)
+        last_km = np.full(len(rows), np.nan)
+        rate[known] = self.rates()[rows[known]]
+        last_day[known] = self._last[rows[known], 0]
+        last_km[known] = self._last[rows[known], 1]
+        target = np.array([t if t else np.nan for t in targets], dtype=np.float64)
+        with np.errstate(invalid='ignore'):
+            estimated_km = last_km + rate * np.maximum(today - last_day, 0)
+            # Hedef son okumada zaten geçildiyse bakım günü son okuma günüdür
+            due_day = np.floor(last_day + np.maximum(target - last_km, 0) / rate)
+        result = []
+        for values in zip(rate, estimated_km, due_day, due_day - today):
+            result.append(tuple(float(value) if np.isfinite(value) else None for value in values))
+        return result
+
+class ChangeEvent:
+    """DatabaseManager'ın yazma işlemlerinden sonra yayınladığı değişiklik bildirimi.
+    table: 'bakimlar' veya 'araclar'; action: 'insert', 'update' veya 'delete';
+    ids: etkilenen satır id'leri, None ise hangi satırların etkilendiği bilinmiyor (toplu işlem).
+    fields: güncellemede değişebilen sütunlar, None ise herhangi bir sütun (ekleme / silme dahil).
+    """
+    
+    def __init__(self, table, action, ids=None, fields=None):
+        self.table = table
+        self.action = action
+        self.ids = tuple(ids) if ids is not None else None
+        self.fields = frozenset(fields) if fields is not None else None
+    
+    def touches(self, *fields):
+        """Değişiklik verilen sütunlardan birini etkilemiş olabilir mi?"""
+        return self.fields is None or not self.fields.isdisjoint(fields)
+    
+    def __repr__(self):
+        return f"ChangeEvent({self.table!r}, {self.action!r}, {self.ids!r}, {self.fields!r})"
+
 class DatabaseManager:
     """Veritabanı yönetim sınıfı"""
     
-    def __init__(self, db_name="bakim_kayitlari.db"):
+    def __init__(self, db_name="bakim_kayitlari.db", pragmas=None):
         self.db_name = db_name
-        self.conn = None
+        self.connections = ConnectionManager(db_name, pragmas)
+        # Kimlik haritası: id -> satır. Tekil okumalar buradan, yazma işlemleri ilgili girdiyi siler
+        self._record_cache = {}
+        self._arac_cache = {}
+        # Değişiklik bildirimi dinleyicileri; batch() içinde olaylar biriktirilir
+        self._listeners = []
+        self._batched = None
         self.init_database()
     
+    def add_listener(self, callback):
+        """callback(ChangeEvent) her başarılı yazma işleminden sonra (yazan thread'de) çağrılır"""
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, table, action, ids=None, fields=None):
+        event = ChangeEvent(table, action, ids, fields)
+        if table == 'araclar' and event.touches('plaka', 'santiye_id'):
+            # Kayıt satırları bağlı aracın şantiyesini içerir (bkz. RECORD_COLUMNS)
+            self._record_cache.clear()
+        if self._batched is not None:
+            self._batched.append(event)
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Değişiklik bildirimi hatası: {e}")
+    
+    @contextmanager
+    def batch(self):
+        """Toplu işlemlerde olayları biriktir; çıkışta (tablo, işlem) başına tek olay yayınla"""
+        if self._batched is not None:
+            yield
+            return
+        self._batched = []
+        try:
+            yield
+        finally:
+            events, self._batched = self._batched, None
+            merged = {}
+            for event in events:
+                key = (event.table, event.action)
+                ids, fields = merged.get(key, ((), frozenset()))
+                ids = None if event.ids is None or ids is None else ids + event.ids
+                fields = None if event.fields is None or fields is None else fields | event.fields
+                merged[key] = (ids, fields)
+            for (table, action), (ids, fields) in merged.items():
+                self._notify(table, action, ids, fields)
+    
+    @property
+    def conn(self):
+        """Çağıran thread'e ait bağlantı"""
+        return self.connections.connection()
+    
+    def transaction(self):
+        """Yazma transaction'ı (bkz. ConnectionManager.transaction)"""
+        return self.connections.transaction()
+    
+    def close(self):
+        """Veritabanı bağlantılarını kapat"""
+        self.connections.close()
+    
     def init_database(self):
         """Veritabanını başlat ve tabloyu oluştur"""
         try:
-            self.conn = sqlite3.connect(self.db_name)
             cursor = self.conn.cursor()
             
             cursor.execute('''
@@ -232,7 +1160,10 @@ class DatabaseManager:
                     yapilan_islem TEXT,
                     diger TEXT,
                     bakim_yapan TEXT,
-                    kayit_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    kayit_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    tarih_key INTEGER,
+                    arac_id INTEGER REFERENCES araclar (id),
+                    santiye_id INTEGER
                 )
             ''')
             
@@ -295,8 +1226,58 @@ class DatabaseManager:
                 cols = [r[1] for r in cursor.fetchall()]
                 if 'kapi_no' not in cols:
                     cursor.execute("ALTER TABLE bakimlar ADD COLUMN kapi_no TEXT")
+                if 'tarih_key' not in cols:
+                    cursor.execute("ALTER TABLE bakimlar ADD COLUMN tarih_key INTEGER")
+                if 'arac_id' not in cols:
+                    cursor.execute("ALTER TABLE bakimlar ADD COLUMN arac_id INTEGER REFERENCES araclar (id)")
+                    # Kayıtları plakası eşleşen araca bağla - tek seferlik
+                    cursor.execute('''
+                        UPDATE bakimlar SET arac_id = (SELECT id FROM araclar WHERE araclar.plaka = bakimlar.plaka)
+                    ''')
+                if 'santiye_id' not in cols:
+                    # Bağlı aracın şantiyesi kayda kopyalanır - tek seferlik; araç bağlantısı tetikleyicileri
+                    # şantiyeyi de güncel tutacak şekilde yeniden kurulur (bkz. init_vehicle_links)
+                    cursor.execute("ALTER TABLE bakimlar ADD COLUMN santiye_id INTEGER")
+                    cursor.execute('''
+                        UPDATE bakimlar SET santiye_id = (SELECT santiye_id FROM araclar WHERE araclar.id = bakimlar.arac_id)
+                        WHERE arac_id IS NOT NULL
+                    ''')
+                    for trigger in ('bakimlar_arac_ai', 'bakimlar_arac_au', 'araclar_bakim_ai',
+                                    'araclar_bakim_au', 'araclar_bakim_ad'):
+                        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
             except Exception:
                 pass
+            
+            # Sıralanabilir tarih anahtarını (yyyymmdd) eksik kayıtlar için doldur - tek seferlik
+            try:
+                cursor.execute("SELECT id, tarih FROM bakimlar WHERE tarih_key IS NULL")
+                missing = cursor.fetchall()
+                # Eksik yoksa (her açılışta) tarih dönüşümüne hiç girilmez
+                if missing:
+                    keys = date_sort_keys(tarih for _, tarih in missing)
+                    cursor.executemany("UPDATE bakimlar SET tarih_key = ? WHERE id = ?",
+                                       zip(keys, (rid for rid, _ in missing)))
+            except sqlite3.Error as e:
+                print(f"Tarih anahtarı doldurma hatası: {e}")
+            
+            # Sıralı listeleme ve araç geçmişi için indeksler
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_tarih_key ON bakimlar (tarih_key, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_plaka_tarih ON bakimlar (plaka, tarih_key)")
+            # Filtre çubuğu (bölge / bakım yapan + tarih sırası) ve seçenek listeleri (DISTINCT) için indeksler
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_bolge_tarih ON bakimlar (bolge, tarih_key, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_yapan_tarih ON bakimlar (bakim_yapan, tarih_key, id)")
+            # Araç listelerinin sayfalı (keyset) okunması için indeksler
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_araclar_santiye_plaka ON araclar (santiye_id, plaka)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_araclar_olusturma ON araclar (olusturma_tarihi, id)")
+            
+            # Kayıt - araç bağlantısı (şantiye bazlı listeleme)
+            self.init_vehicle_links(cursor)
+            
+            # Tam metin arama indeksi
+            self.fts_enabled = self.init_search_index(cursor)
+            
+            # Tetikleyicilerle güncel tutulan istatistik özetleri
+            self.init_statistics_tables(cursor)
 
             self.conn.commit()
             return True
@@ -305,42 +1286,433 @@ class DatabaseManager:
             print(f"Veritabanı hatası: {e}")
             return False
     
-    def get_all_records(self):
-        """Tüm kayıtları getir"""
+    def init_vehicle_links(self, cursor):
+        """bakimlar.arac_id / santiye_id indekslerini ve onları plakadan güncel tutan tetikleyicileri oluştur.
+        Kayıt eklenince ya da plakası değişince araca, araç eklenince / plakası değişince
+        kayıtlarına bağlanır; silinen aracın kayıtlarının bağı kalkar. Kayıt, bağlı aracın
+        santiye_id değerini de taşır; araç şantiye değiştirince kayıtları da taşınır.
+        """
         try:
-            cursor = self.conn.cursor()
+            # Tetikleyiciler aracın kayıtlarını arac_id ile bulur
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_arac_tarih ON bakimlar (arac_id, tarih_key, id)")
+            # Şantiye kayıtları tek indeksten tarih sırasıyla okunur (sıralama adımı olmadan)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bakimlar_santiye_tarih ON bakimlar (santiye_id, tarih_key, id)")
             cursor.execute('''
-                SELECT id, s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
-                       yapilan_islem, diger, bakim_yapan, kayit_tarihi
-                FROM bakimlar
-                ORDER BY
-                    CASE WHEN tarih IS NULL OR tarih = '' THEN 1 ELSE 0 END ASC,
-                    CASE
-                        WHEN length(tarih) = 8 AND tarih GLOB '[0-9]*' THEN tarih
-                        ELSE substr(tarih, 7, 4) || substr(tarih, 4, 2) || substr(tarih, 1, 2)
-                    END ASC,
-                    id ASC
+                CREATE TRIGGER IF NOT EXISTS bakimlar_arac_ai AFTER INSERT ON bakimlar
+                WHEN new.arac_id IS NULL AND EXISTS (SELECT 1 FROM araclar WHERE plaka = new.plaka) BEGIN
+                    UPDATE bakimlar SET (arac_id, santiye_id) = (SELECT id, santiye_id FROM araclar WHERE plaka = new.plaka)
+                    WHERE id = new.id;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS bakimlar_arac_au AFTER UPDATE OF plaka ON bakimlar
+                WHEN new.plaka IS NOT old.plaka BEGIN
+                    UPDATE bakimlar SET (arac_id, santiye_id) = (SELECT id, santiye_id FROM araclar WHERE plaka = new.plaka)
+                    WHERE id = new.id;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS araclar_bakim_ai AFTER INSERT ON araclar BEGIN
+                    UPDATE bakimlar SET arac_id = new.id, santiye_id = new.santiye_id WHERE plaka = new.plaka;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS araclar_bakim_au AFTER UPDATE OF plaka ON araclar
+                WHEN new.plaka IS NOT old.plaka BEGIN
+                    UPDATE bakimlar SET arac_id = NULL, santiye_id = NULL WHERE arac_id = old.id;
+                    UPDATE bakimlar SET arac_id = new.id, santiye_id = new.santiye_id WHERE plaka = new.plaka;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS araclar_santiye_au AFTER UPDATE OF santiye_id ON araclar
+                WHEN new.santiye_id IS NOT old.santiye_id BEGIN
+                    UPDATE bakimlar SET santiye_id = new.santiye_id WHERE arac_id = new.id;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS araclar_bakim_ad AFTER DELETE ON araclar BEGIN
+                    UPDATE bakimlar SET arac_id = NULL, santiye_id = NULL WHERE arac_id = old.id;
+                END
+            ''')
+        except sqlite3.Error as e:
+            print(f"Araç bağlantısı oluşturma hatası: {e}")
+    
+    def init_search_index(self, cursor):
+        """FTS5 arama indeksini ve onu güncel tutan tetikleyicileri oluştur.
+        SQLite FTS5 desteklemiyorsa False döner (arama LIKE ile yapılır).
+        """
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bakimlar_fts'")
+            exists = cursor.fetchone() is not None
+            names = ', '.join(name for name, _ in FTS_COLUMNS)
+            new_values = ', '.join(expr('new.') for _, expr in FTS_COLUMNS)
+            old_values = ', '.join(expr('old.') for _, expr in FTS_COLUMNS)
+            
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS bakimlar_fts USING fts5(
+                    {names}, content='', tokenize='unicode61 remove_diacritics 2'
+                )
             ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS bakimlar_fts_ai AFTER INSERT ON bakimlar BEGIN
+                    INSERT INTO bakimlar_fts (rowid, {names}) VALUES (new.id, {new_values});
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS bakimlar_fts_ad AFTER DELETE ON bakimlar BEGIN
+                    INSERT INTO bakimlar_fts (bakimlar_fts, rowid, {names}) VALUES ('delete', old.id, {old_values});
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS bakimlar_fts_au
+                AFTER UPDATE OF plaka, kapi_no, bolge, yapilan_islem, diger, bakim_yapan ON bakimlar BEGIN
+                    INSERT INTO bakimlar_fts (bakimlar_fts, rowid, {names}) VALUES ('delete', old.id, {old_values});
+                    INSERT INTO bakimlar_fts (rowid, {names}) VALUES (new.id, {new_values});
+                END
+            ''')
+            
+            if not exists:
+                # Mevcut kayıtları tek seferde indeksle
+                row_values = ', '.join(expr('') for _, expr in FTS_COLUMNS)
+                cursor.execute(f"INSERT INTO bakimlar_fts (rowid, {names}) SELECT id, {row_values} FROM bakimlar")
+            return True
+        except sqlite3.Error as e:
+            print(f"Arama indeksi oluşturma hatası: {e}")
+            return False
+    
+    def init_statistics_tables(self, cursor):
+        """Panel istatistikleri için özet tablolarını ve tetikleyicileri oluştur.
+        bakim_sayaclari: toplam kayıt ve farklı araç sayısı
+        plaka_ozet: plaka başına bakım sayısı, son (tarihli) bakımın tarih_key değeri ve
+            son bakım kaydının id, tarih, bakım km ve sonraki bakım km değerleri
+        Her yazma işleminde yalnızca ilgili satırlar güncellenir; istatistik okumak bakimlar'ı taramaz.
+        """
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'plaka_ozet'")
+            exists = cursor.fetchone() is not None
+            if exists:
+                # Son bakım sütunlarından önceki şema: özet tablo ve tetikleyiciler yeniden kurulur
+                cursor.execute("PRAGMA table_info(plaka_ozet)")
+                if 'son_bakim_id' not in [r[1] for r in cursor.fetchall()]:
+                    for trigger in ('bakimlar_ozet_ai', 'bakimlar_ozet_ad', 'bakimlar_ozet_au',
+                                    'plaka_ozet_ai', 'plaka_ozet_ad'):
+                        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                    cursor.execute("DROP TABLE plaka_ozet")
+                    exists = False
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS bakim_sayaclari (
+                    ad TEXT PRIMARY KEY,
+                    deger INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS plaka_ozet (
+                    plaka TEXT PRIMARY KEY,
+                    bakim_sayisi INTEGER NOT NULL DEFAULT 0,
+                    son_tarih_key INTEGER,
+                    son_bakim_id INTEGER,
+                    son_tarih TEXT,
+                    son_bakim_km INTEGER,
+                    son_sonraki_bakim_km INTEGER
+                )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_plaka_ozet_sayi ON plaka_ozet (bakim_sayisi)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_plaka_ozet_son_tarih ON plaka_ozet (son_tarih_key)")
+            
+            # Yeni kayıt: plaka satırını oluştur/artır, son tarihi ilerlet
+            insert_new = f'''
+                INSERT INTO plaka_ozet (plaka, bakim_sayisi, son_tarih_key)
+                VALUES (new.plaka, 1, CASE WHEN new.tarih_key < {MISSING_DATE_KEY} THEN new.tarih_key END)
+                ON CONFLICT (plaka) DO UPDATE SET
+                    bakim_sayisi = bakim_sayisi + 1,
+                    son_tarih_key = CASE WHEN excluded.son_tarih_key > COALESCE(son_tarih_key, 0)
+                                         THEN excluded.son_tarih_key ELSE son_tarih_key END;
+            '''
+            # Silinen kayıt: sayıyı azalt, son tarih o kayıtsa (plaka, tarih_key) indeksiyle yeniden bul
+            remove_old = f'''
+                UPDATE plaka_ozet SET
+                    bakim_sayisi = bakim_sayisi - 1,
+                    son_tarih_key = CASE WHEN old.tarih_key = son_tarih_key
+                        THEN (SELECT MAX(tarih_key) FROM bakimlar
+                              WHERE plaka = old.plaka AND tarih_key < {MISSING_DATE_KEY})
+                        ELSE son_tarih_key END
+                WHERE plaka = old.plaka;
+                DELETE FROM plaka_ozet WHERE plaka = old.plaka AND bakim_sayisi <= 0;
+            '''
+            
+            def refresh_latest(plaka):
+                # Son bakım: en yeni tarihli kayıt, tarihli kayıt yoksa en son eklenen.
+                # İkisi de (plaka, tarih_key) indeksinde tek aramadır
+                return f'''
+                UPDATE plaka_ozet SET son_bakim_id = COALESCE(
+                    (SELECT id FROM bakimlar WHERE plaka = {plaka} AND tarih_key < {MISSING_DATE_KEY}
+                     ORDER BY tarih_key DESC, id DESC LIMIT 1),
+                    (SELECT MAX(id) FROM bakimlar WHERE plaka = {plaka}))
+                WHERE plaka = {plaka};
+                UPDATE plaka_ozet SET (son_tarih, son_bakim_km, son_sonraki_bakim_km) = (
+                    SELECT tarih, bakim_km, sonraki_bakim_km FROM bakimlar WHERE id = plaka_ozet.son_bakim_id)
+                WHERE plaka = {plaka};
+                '''
+            
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS bakimlar_ozet_ai AFTER INSERT ON bakimlar BEGIN
+                    {insert_new}
+                    {refresh_latest('new.plaka')}
+                    UPDATE bakim_sayaclari SET deger = deger + 1 WHERE ad = 'toplam_kayit';
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS bakimlar_ozet_ad AFTER DELETE ON bakimlar BEGIN
+                    {remove_old}
+                    {refresh_latest('old.plaka')}
+                    UPDATE bakim_sayaclari SET deger = deger - 1 WHERE ad = 'toplam_kayit';
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS bakimlar_ozet_au
+                AFTER UPDATE OF plaka, tarih_key, tarih, bakim_km, sonraki_bakim_km ON bakimlar BEGIN
+                    {remove_old}
+                    {insert_new}
+                    {refresh_latest('old.plaka')}
+                    {refresh_latest('new.plaka')}
+                END
+            """)
+            # Farklı araç sayısı = plaka_ozet satır sayısı
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS plaka_ozet_ai AFTER INSERT ON plaka_ozet BEGIN
+                    UPDATE bakim_sayaclari SET deger = deger + 1 WHERE ad = 'toplam_arac';
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS plaka_ozet_ad AFTER DELETE ON plaka_ozet BEGIN
+                    UPDATE bakim_sayaclari SET deger = deger - 1 WHERE ad = 'toplam_arac';
+                END
+            ''')
+            
+            if not exists:
+                # Mevcut kayıtlardan özetleri tek seferde oluştur
+                cursor.execute(f'''
+                    INSERT INTO plaka_ozet (plaka, bakim_sayisi, son_tarih_key)
+                    SELECT plaka, COUNT(*), MAX(CASE WHEN tarih_key < {MISSING_DATE_KEY} THEN tarih_key END)
+                    FROM bakimlar
+                    GROUP BY plaka
+                ''')
+                for statement in refresh_latest('plaka_ozet.plaka').split(';'):
+                    if statement.strip():
+                        cursor.execute(statement)
+                cursor.execute("DELETE FROM bakim_sayaclari")
+                cursor.execute('''
+                    INSERT INTO bakim_sayaclari (ad, deger)
+                    VALUES ('toplam_kayit', (SELECT COUNT(*) FROM bakimlar)),
+                           ('toplam_arac', (SELECT COUNT(*) FROM plaka_ozet))
+                ''')
+        except sqlite3.Error as e:
+            print(f"İstatistik tabloları oluşturma hatası: {e}")
+    
+    def get_all_records(self, santiye_id=None):
+        """Tüm kayıtları getir; santiye_id verilirse yalnızca o şantiyenin araçlarının
+        kayıtları ((santiye_id, tarih_key) indeksiyle) okunur
+        """
+        conditions, params = RecordFilter(santiye_id=santiye_id).sql()
+        where = f"WHERE {conditions}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                {where}
+                ORDER BY tarih_key ASC, id ASC
+            ''', params)
             return cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Kayıt getirme hatası: {e}")
             return []
     
+    def get_records_page(self, after=None, page_size=RECORDS_PAGE_SIZE, record_filter=None):
+        """Kayıtları (tarih_key, id) sırasıyla sayfa sayfa getir (keyset sayfalama).
+        after: önceki sayfanın döndürdüğü devam anahtarı, None ise ilk sayfa.
+        record_filter: RecordFilter verilirse yalnızca eşleşen kayıtlar okunur.
+        Dönen: (kayıtlar, devam anahtarı); son sayfada devam anahtarı None olur.
+        """
+        conditions, params = (record_filter or RecordFilter()).sql()
+        conditions = [conditions] if conditions else []
+        if after:
+            conditions.append('(tarih_key, id) > (?, ?)')
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                {where}
+                ORDER BY tarih_key ASC, id ASC
+                LIMIT ?
+            ''', (*params, page_size + 1))
+            rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Kayıt getirme hatası: {e}")
+            return [], None
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, (rows[-1][12], rows[-1][0])
+    
+    def query_records(self, filters=None, order='tarih', limit=None, offset=0):
+        """Filtreye uyan kayıtları veritabanında süzerek getir.
+        filters: RecordFilter (veya aynı alanları içeren sözlük), None ise tüm kayıtlar.
+        order: RECORD_ORDERS anahtarlarından biri. limit None ise sınırsız.
+        """
+        if isinstance(filters, dict):
+            filters = RecordFilter(**filters)
+        conditions, params = (filters or RecordFilter()).sql()
+        where = f"WHERE {conditions}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                {where}
+                ORDER BY {RECORD_ORDERS[order]}
+                LIMIT ? OFFSET ?
+            ''', (*params, -1 if limit is None else limit, offset))
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Kayıt getirme hatası: {e}")
+            return []
+    
+    def get_filter_options(self):
+        """Filtre çubuğu seçenekleri: {'bolge': [...], 'bakim_yapan': [...]}.
+        Değerler (bolge, ...) / (bakim_yapan, ...) indekslerinden DISTINCT ile okunur.
+        """
+        options = {}
+        try:
+            cursor = self.conn.cursor()
+            for field in ('bolge', 'bakim_yapan'):
+                cursor.execute(f'''
+                    SELECT DISTINCT {field} FROM bakimlar
+                    WHERE {field} IS NOT NULL AND {field} != ''
+                    ORDER BY {field}
+                ''')
+                options[field] = [row[0] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Filtre seçenekleri getirme hatası: {e}")
+        return options
+    
+    def iter_records(self, date_range=None, bolge=None, bakim_yapan=None, santiye_id=None):
+        """Filtreye uyan kayıtları cursor üzerinden tek tek döndür (dışa aktarım için).
+        None olan filtreler uygulanmaz; date_range (başlangıç, bitiş) tarih_key aralığıdır.
+        Koşullar tablodaki filtreyle aynıdır (bkz. RecordFilter).
+        """
+        conditions, params = RecordFilter(bolge, bakim_yapan, date_range, santiye_id).sql()
+        where = f"WHERE {conditions}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                {where}
+                ORDER BY tarih_key ASC, id ASC
+            ''', params)
+            yield from cursor
+        except sqlite3.Error as e:
+            print(f"Kayıt getirme hatası: {e}")
+    
+    def get_record(self, record_id):
+        """Tek bir bakım kaydını id ile getir (birincil anahtar + önbellek)"""
+        if record_id in self._record_cache:
+            return self._record_cache[record_id]
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                WHERE id = ?
+            ''', (record_id,))
+            record = cursor.fetchone()
+            if record:
+                self._record_cache[record_id] = record
+            return record
+        except sqlite3.Error as e:
+            print(f"Kayıt getirme hatası: {e}")
+            return None
+    
+    def get_records(self, record_ids):
+        """Verilen id'lerdeki bakım kayıtlarını aynı sırayla getir; bulunamayanlar atlanır"""
+        found = {}
+        record_ids = list(record_ids)
+        try:
+            cursor = self.conn.cursor()
+            # SQLite parametre sınırı için parça parça sorgula
+            for start in range(0, len(record_ids), 500):
+                chunk = record_ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT {RECORD_COLUMNS}
+                    FROM bakimlar b
+                    WHERE id IN ({placeholders})
+                ''', chunk)
+                for record in cursor.fetchall():
+                    found[record[0]] = record
+        except sqlite3.Error as e:
+            print(f"Kayıt getirme hatası: {e}")
+        return [found[record_id] for record_id in record_ids if record_id in found]
+    
+    def next_s_no(self):
+        """Yeni kayıt için sıradaki S.NO (mevcut en büyük + 1)"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(s_no), 0) + 1 FROM bakimlar")
+            return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Sıra numarası hatası: {e}")
+            return None
+    
     def add_record(self, data):
         """Yeni kayıt ekle"""
         try:
             cursor = self.conn.cursor()
             cursor.execute('''
                 INSERT INTO bakimlar (s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km, 
-                                    yapilan_islem, diger, bakim_yapan)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', data)
+                                    yapilan_islem, diger, bakim_yapan, tarih_key)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', tuple(data) + (date_sort_key(data[4]),))
             self.conn.commit()
+            self._notify('bakimlar', 'insert', [cursor.lastrowid])
             return cursor.lastrowid
         except sqlite3.Error as e:
             print(f"Kayıt ekleme hatası: {e}")
             return None
     
+    def add_records_bulk(self, rows):
+        """Birden çok kaydı tek transaction içinde ekle.
+        rows: add_record ile aynı sıradaki veri demetleri. Eklenen kayıt sayısını döndürür;
+        hata olursa hiçbir satır yazılmaz.
+        """
+        rows = list(rows)
+        keys = date_sort_keys(row[4] for row in rows)
+        try:
+            with self.transaction() as conn:
+                # AUTOINCREMENT: tek yazıcı altında eklenen id'ler son verilen id'den itibaren ardışıktır
+                # (sondaki kayıtlar silinmişse son verilen id sqlite_sequence'tadır)
+                last_id = conn.execute('''
+                    SELECT MAX(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'bakimlar'), 0),
+                               COALESCE(MAX(id), 0))
+                    FROM bakimlar
+                ''').fetchone()[0]
+                cursor = conn.executemany('''
+                    INSERT INTO bakimlar (s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km, 
+                                        yapilan_islem, diger, bakim_yapan, tarih_key)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (tuple(row) + (key,) for row, key in zip(rows, keys)))
+            if cursor.rowcount > 0:
+                self._notify('bakimlar', 'insert', range(last_id + 1, last_id + 1 + cursor.rowcount))
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Toplu kayıt ekleme hatası: {e}")
+            return 0
+    
     def update_record(self, record_id, data):
         """Kayıt güncelle"""
         try:
@@ -348,10 +1720,13 @@ class DatabaseManager:
             cursor.execute('''
                 UPDATE bakimlar 
                 SET s_no = ?, plaka = ?, kapi_no = ?, bolge = ?, tarih = ?, bakim_km = ?, 
-                    sonraki_bakim_km = ?, yapilan_islem = ?, diger = ?, bakim_yapan = ?
+                    sonraki_bakim_km = ?, yapilan_islem = ?, diger = ?, bakim_yapan = ?,
+                    tarih_key = ?
                 WHERE id = ?
-            ''', data + (record_id,))
+            ''', tuple(data) + (date_sort_key(data[4]), record_id))
             self.conn.commit()
+            self._record_cache.pop(record_id, None)
+            self._notify('bakimlar', 'update', [record_id])
             return True
         except sqlite3.Error as e:
             print(f"Kayıt güncelleme hatası: {e}")
@@ -363,6 +1738,8 @@ class DatabaseManager:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM bakimlar WHERE id = ?", (record_id,))
             self.conn.commit()
+            self._record_cache.pop(record_id, None)
+            self._notify('bakimlar', 'delete', [record_id])
             return True
         except sqlite3.Error as e:
             print(f"Kayıt silme hatası: {e}")
@@ -371,101 +1748,169 @@ class DatabaseManager:
     def delete_all(self):
         """Tüm kayıtları sil"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM bakimlar")
-            self.conn.commit()
+            with self.transaction() as conn:
+                conn.execute("DELETE FROM bakimlar")
+            self._record_cache.clear()
+            self._notify('bakimlar', 'delete')
             return True
         except sqlite3.Error as e:
             print(f"Toplu silme hatası: {e}")
             return False
     
-    def search_records(self, plaka):
-        """Plaka ile ara"""
+    def search_records(self, text, limit=SEARCH_RESULT_LIMIT, cancel=None):
+        """Plaka, kapı no, bölge, işlem, not ve bakım yapan alanlarında ara.
+        FTS5 indeksiyle önek eşleşmeli arar. Sıralama: önce plakada eşleşenler, sonra
+        diğer alanlarda eşleşenler; her grup içinde tarihi en yeni kayıt önce, tarihsizler
+        en sonda (tarih_key = MISSING_DATE_KEY, tarih_key DESC, id DESC).
+        FTS5 yoksa plaka içinde geçen metin (LIKE) aynı sırayla aranır.
+        cancel: True döndürdüğünde çalışan sorguyu yarıda kesen fonksiyon; kesilirse None döner.
+        """
+        if cancel is not None:
+            # SQLite her 1000 sanal makine adımında sorar; sıfırdan farklı dönüş sorguyu keser
+            self.conn.set_progress_handler(lambda: 1 if cancel() else 0, 1000)
+            try:
+                return self.search_records(text, limit)
+            finally:
+                self.conn.set_progress_handler(None, 0)
+        limit = -1 if limit is None else limit
         try:
             cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
-                       yapilan_islem, diger, bakim_yapan, kayit_tarihi
-                FROM bakimlar
-                WHERE plaka LIKE ?
-                ORDER BY
-                    CASE WHEN tarih IS NULL OR tarih = '' THEN 1 ELSE 0 END ASC,
-                    CASE
-                        WHEN length(tarih) = 8 AND tarih GLOB '[0-9]*' THEN tarih
-                        ELSE substr(tarih, 7, 4) || substr(tarih, 4, 2) || substr(tarih, 1, 2)
-                    END ASC,
-                    id ASC
-            ''', (f'%{plaka}%',))
+            if getattr(self, 'fts_enabled', False):
+                query = build_fts_query(text)
+                if not query:
+                    return []
+                records = []
+                seen = set()
+                for match in (f'{{plaka plaka_key}} : ({query})', query):
+                    for record in self._search_matches(cursor, match, limit):
+                        if record[0] not in seen:
+                            seen.add(record[0])
+                            records.append(record)
+                    if 0 <= limit <= len(records):
+                        return records[:limit]
+                return records
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b
+                WHERE b.plaka LIKE ?
+                ORDER BY b.tarih_key = ?, b.tarih_key DESC, b.id DESC
+                LIMIT ?
+            ''', (f'%{text}%', MISSING_DATE_KEY, limit))
             return cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            if str(e) == 'interrupted':
+                return None
+            print(f"Arama hatası: {e}")
+            return []
         except sqlite3.Error as e:
             print(f"Arama hatası: {e}")
             return []
     
+    def _search_matches(self, cursor, match, limit):
+        """Tek bir FTS5 MATCH ifadesinin ilk limit eşleşmesi (search_records sırasıyla).
+        Az eşleşmede eşleşen satırlar okunup sıralanır. Çok eşleşmede bu, eşleşmelerin
+        tümünü sıralamak demektir; onun yerine (tarih_key, id) indeksi sırayla yürünür ve
+        limit dolunca durulur (önce tarihli, sonra tarihsiz kayıtlar).
+        Eşik: yürüyüş ~limit * toplam / eşleşme indeks girdisi okur, sıralama ~eşleşme
+        kadar satır; eşleşme² >= limit * toplam / 4 olunca yürüyüş daha ucuzdur.
+        """
+        walk = False
+        if limit >= 0:
+            cursor.execute("SELECT deger FROM bakim_sayaclari WHERE ad = 'toplam_kayit'")
+            row = cursor.fetchone()
+            threshold = max(limit, int((limit * (row[0] if row else 0) / 4) ** 0.5))
+            # Sayım eşikte kesilir; yalnızca eşiğin aşılıp aşılmadığı önemlidir
+            cursor.execute('''
+                SELECT COUNT(*) FROM (SELECT rowid FROM bakimlar_fts WHERE bakimlar_fts MATCH ? LIMIT ?)
+            ''', (match, threshold))
+            walk = cursor.fetchone()[0] >= threshold
+        if not walk:
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar_fts
+                JOIN bakimlar b ON b.id = bakimlar_fts.rowid
+                WHERE bakimlar_fts MATCH ?
+                ORDER BY b.tarih_key = ?, b.tarih_key DESC, b.id DESC
+                LIMIT ?
+            ''', (match, MISSING_DATE_KEY, limit))
+            return cursor.fetchall()
+        records = []
+        for condition in ('b.tarih_key < ?', 'b.tarih_key >= ?'):
+            cursor.execute(f'''
+                SELECT {RECORD_COLUMNS}
+                FROM bakimlar b INDEXED BY idx_bakimlar_tarih_key
+                WHERE {condition}
+                  AND b.id IN (SELECT rowid FROM bakimlar_fts WHERE bakimlar_fts MATCH ?)
+                ORDER BY b.tarih_key DESC, b.id DESC
+                LIMIT ?
+            ''', (MISSING_DATE_KEY, match, limit - len(records)))
+            records.extend(cursor.fetchall())
+            if len(records) >= limit:
+                break
+        return records
+    
     def get_vehicle_maintenance_records(self, plaka):
         """Belirli bir araç için bakım kayıtlarını getir"""
         try:
             cursor = self.conn.cursor()
+            # Tarihli kayıtlar yeniden eskiye, tarihsizler en sonda - (plaka, tarih_key) indeksi üzerinden
             cursor.execute('''
                 SELECT id, s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
                        yapilan_islem, diger, bakim_yapan, kayit_tarihi
                 FROM bakimlar
-                WHERE plaka = ?
-                ORDER BY
-                    CASE WHEN tarih IS NULL OR tarih = '' THEN 1 ELSE 0 END ASC,
-                    CASE
-                        WHEN length(tarih) = 8 AND tarih GLOB '[0-9]*' THEN tarih
-                        ELSE substr(tarih, 7, 4) || substr(tarih, 4, 2) || substr(tarih, 1, 2)
-                    END DESC,
-                    id DESC
-            ''', (plaka,))
-            return cursor.fetchall()
+                WHERE plaka = ? AND tarih_key < ?
+                ORDER BY tarih_key DESC, id DESC
+            ''', (plaka, MISSING_DATE_KEY))
+            records = cursor.fetchall()
+            cursor.execute('''
+                SELECT id, s_no, plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
+                       yapilan_islem, diger, bakim_yapan, kayit_tarihi
+                FROM bakimlar
+                WHERE plaka = ? AND tarih_key >= ?
+                ORDER BY tarih_key DESC, id DESC
+            ''', (plaka, MISSING_DATE_KEY))
+            return records + cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Araç bakım kayıtları getirme hatası: {e}")
             return []
 
-    def get_statistics(self):
-        """İstatistikleri getir"""
+    def get_statistics(self, santiye_id=None):
+        """İstatistikleri getir (özet tablolarından, bakimlar taranmaz).
+        santiye_id verilirse yalnızca o şantiyenin araçlarının özetleri toplanır.
+        """
         try:
             cursor = self.conn.cursor()
-            
-            # Toplam kayıt sayısı
-            cursor.execute("SELECT COUNT(*) FROM bakimlar")
-            toplam_kayit = cursor.fetchone()[0]
-            
-            # Toplam araç sayısı
-            cursor.execute("SELECT COUNT(DISTINCT plaka) FROM bakimlar")
-            toplam_arac = cursor.fetchone()[0]
+            if santiye_id is None:
+                source, params = 'plaka_ozet', ()
+                # Toplam kayıt ve araç sayısı
+                cursor.execute("SELECT ad, deger FROM bakim_sayaclari")
+                sayaclar = dict(cursor.fetchall())
+            else:
+                # Şantiyenin araçları (santiye_id, plaka) indeksinden, özetleri plaka ile okunur
+                source = '''(SELECT plaka_ozet.* FROM araclar
+                             JOIN plaka_ozet ON plaka_ozet.plaka = araclar.plaka
+                             WHERE araclar.santiye_id = ?)'''
+                params = (santiye_id,)
+                cursor.execute(f"SELECT COALESCE(SUM(bakim_sayisi), 0), COUNT(*) FROM {source}", params)
+                sayaclar = dict(zip(('toplam_kayit', 'toplam_arac'), cursor.fetchone()))
             
             # En çok bakım yapılan araç
-            cursor.execute('''
-                SELECT plaka, COUNT(*) as bakim_sayisi 
-                FROM bakimlar 
-                GROUP BY plaka 
+            cursor.execute(f'''
+                SELECT plaka, bakim_sayisi 
+                FROM {source} 
                 ORDER BY bakim_sayisi DESC 
                 LIMIT 1
-            ''')
+            ''', params)
             en_cok_bakim = cursor.fetchone()
             
-            # En son bakım tarihi - tarih formatını düzelt
-            cursor.execute("""
-                SELECT tarih FROM bakimlar 
-                WHERE tarih IS NOT NULL AND tarih != ''
-                ORDER BY 
-                    CASE 
-                        WHEN length(tarih) = 8 AND tarih GLOB '[0-9]*' THEN 
-                            substr(tarih, 5, 4) || '-' || substr(tarih, 3, 2) || '-' || substr(tarih, 1, 2)
-                        WHEN length(tarih) = 10 AND tarih LIKE '%.%.%' THEN
-                            substr(tarih, 7, 4) || '-' || substr(tarih, 4, 2) || '-' || substr(tarih, 1, 2)
-                        ELSE tarih
-                    END DESC
-                LIMIT 1
-            """)
-            son_bakim = cursor.fetchone()
-            son_bakim = son_bakim[0] if son_bakim else None
+            # En son bakım tarihi (yyyymmdd -> dd.MM.yyyy)
+            cursor.execute(f"SELECT MAX(son_tarih_key) FROM {source}", params)
+            son_key = cursor.fetchone()[0]
+            son_bakim = f"{son_key % 100:02d}.{son_key // 100 % 100:02d}.{son_key // 10000}" if son_key else None
             
             return {
-                'toplam_kayit': toplam_kayit,
-                'toplam_arac': toplam_arac,
+                'toplam_kayit': sayaclar.get('toplam_kayit', 0),
+                'toplam_arac': sayaclar.get('toplam_arac', 0),
                 'en_cok_bakim': en_cok_bakim,
                 'son_bakim': son_bakim
             }
@@ -473,6 +1918,92 @@ class DatabaseManager:
             print(f"İstatistik hatası: {e}")
             return {}
     
+    def get_km_history(self, plakalar=None):
+        """Km tahmini için tarihli ve km'si olan bakımlar: (id, plaka, tarih_key, bakim_km) satırları.
+        plakalar verilirse yalnızca o plakalar ((plaka, tarih_key) indeksiyle) okunur.
+        """
+        condition = f"tarih_key < {MISSING_DATE_KEY} AND typeof(bakim_km) = 'integer' AND bakim_km > 0"
+        try:
+            cursor = self.conn.cursor()
+            if plakalar is None:
+                cursor.execute(f"SELECT id, plaka, tarih_key, bakim_km FROM bakimlar WHERE {condition}")
+                return cursor.fetchall()
+            rows = []
+            plakalar = list(plakalar)
+            for start in range(0, len(plakalar), 500):
+                chunk = plakalar[start:start + 500]
+                cursor.execute(f'''
+                    SELECT id, plaka, tarih_key, bakim_km FROM bakimlar
+                    WHERE plaka IN ({', '.join('?' * len(chunk))}) AND {condition}
+                ''', chunk)
+                rows.extend(cursor.fetchall())
+            return rows
+        except sqlite3.Error as e:
+            print(f"Km geçmişi getirme hatası: {e}")
+            return []
+    
+    def get_latest_maintenance(self, plaka):
+        """Plakanın bakım özeti (plaka_ozet'ten tek okuma):
+        (bakim_sayisi, son_tarih, son_bakim_km, son_sonraki_bakim_km, son_bakim_id); kaydı yoksa None
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT bakim_sayisi, son_tarih, son_bakim_km, son_sonraki_bakim_km, son_bakim_id
+                FROM plaka_ozet
+                WHERE plaka = ?
+            ''', (plaka,))
+            return cursor.fetchone()
+        except sqlite3.Error as e:
+            print(f"Son bakım getirme hatası: {e}")
+            return None
+    
+    def get_due_services(self, santiye_id=None, km_threshold=None, within_days=None, today=None, limit=None):
+        """Araçları son bakımlarına göre bakım önceliğiyle sırala (plaka_ozet'ten, geçmiş taranmaz).
+        kalan_km: son bakımdaki sonraki bakım km'si ile bakım km'si arasındaki fark
+        kalan_gun: son bakımdan SERVICE_INTERVAL_DAYS gün dolana kadar kalan gün (today: datetime.date)
+        km_threshold / within_days verilirse yalnızca sınıra giren araçlar döner (biri yeterli);
+        verilmezse şantiyedeki tüm araçlar sıralanır, bakım kaydı olmayanlar sona düşer.
+        Dönen: (arac_id, plaka, arac_makine_adi, son_tarih, son_bakim_km, son_sonraki_bakim_km,
+                bakim_sayisi, kalan_km, kalan_gun) satırları; önce kalan_km, sonra kalan_gun artan.
+        """
+        conditions = []
+        params = [SERVICE_INTERVAL_DAYS, (today or datetime.now().date()).isoformat()]
+        if santiye_id is not None:
+            conditions.append("a.santiye_id = ?")
+            params.append(santiye_id)
+        due = []
+        if km_threshold is not None:
+            due.append("kalan_km <= ?")
+            params.append(km_threshold)
+        if within_days is not None:
+            due.append("kalan_gun <= ?")
+            params.append(within_days)
+        if due:
+            conditions.append(f"({' OR '.join(due)})")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT a.id, a.plaka, a.arac_makine_adi, o.son_tarih, o.son_bakim_km, o.son_sonraki_bakim_km,
+                       COALESCE(o.bakim_sayisi, 0),
+                       CASE WHEN typeof(o.son_bakim_km) = 'integer' AND typeof(o.son_sonraki_bakim_km) = 'integer'
+                                 AND o.son_bakim_km > 0 AND o.son_sonraki_bakim_km > 0
+                            THEN o.son_sonraki_bakim_km - o.son_bakim_km END AS kalan_km,
+                       ? - CAST(julianday(?) - julianday(printf('%04d-%02d-%02d', o.son_tarih_key / 10000,
+                                                                  o.son_tarih_key / 100 % 100,
+                                                                  o.son_tarih_key % 100)) AS INTEGER) AS kalan_gun
+                FROM araclar a
+                LEFT JOIN plaka_ozet o ON o.plaka = a.plaka
+                {where}
+                ORDER BY kalan_km IS NULL, kalan_km, kalan_gun IS NULL, kalan_gun, a.plaka
+                LIMIT ?
+            ''', (*params, -1 if limit is None else limit))
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Bakım zamanı sorgu hatası: {e}")
+            return []
+    
     # Şantiye yönetimi metodları
     def get_all_santiyeler(self):
         """Tüm şantiyeleri getir"""
@@ -532,6 +2063,88 @@ class DatabaseManager:
             return False, f"Şantiye silinirken hata oluştu: {e}"
     
     # Araç yönetimi metodları
+    def get_arac(self, arac_id):
+        """Tek bir aracı id ile getir (birincil anahtar + önbellek)"""
+        if arac_id in self._arac_cache:
+            return self._arac_cache[arac_id]
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM araclar WHERE id = ?", (arac_id,))
+            arac = cursor.fetchone()
+            if arac:
+                self._arac_cache[arac_id] = arac
+            return arac
+        except sqlite3.Error as e:
+            print(f"Araç getirme hatası: {e}")
+            return None
+    
+    def get_araclar(self, arac_ids):
+        """Verilen id'lerdeki araçları aynı sırayla getir; bulunamayanlar atlanır"""
+        missing = [arac_id for arac_id in dict.fromkeys(arac_ids) if arac_id not in self._arac_cache]
+        try:
+            cursor = self.conn.cursor()
+            # SQLite parametre sınırı için parça parça sorgula
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f"SELECT * FROM araclar WHERE id IN ({placeholders})", chunk)
+                for arac in cursor.fetchall():
+                    self._arac_cache[arac[0]] = arac
+        except sqlite3.Error as e:
+            print(f"Araç getirme hatası: {e}")
+        return [self._arac_cache[arac_id] for arac_id in arac_ids if arac_id in self._arac_cache]
+    
+    def update_arac(self, arac_id, arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi):
+        """Araç bilgilerini güncelle"""
+        try:
+            cursor = self.conn.cursor()
+            # Plaka değişmediyse bildirim onu içermez (kayıtların araç bağı değişmez)
+            old = cursor.execute("SELECT plaka FROM araclar WHERE id = ?", (arac_id,)).fetchone()
+            cursor.execute('''
+                UPDATE araclar SET 
+                arac_makine_adi = ?, plaka = ?, makine_no = ?, 
+                marka = ?, model = ?, model_yili = ?, hesap_adi = ?
+                WHERE id = ?
+            ''', (arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, arac_id))
+            self.conn.commit()
+            self._arac_cache.pop(arac_id, None)
+            fields = ['arac_makine_adi', 'makine_no', 'marka', 'model', 'model_yili', 'hesap_adi']
+            if old is None or old[0] != plaka:
+                fields.append('plaka')
+            self._notify('araclar', 'update', [arac_id], fields)
+            return True
+        except sqlite3.Error as e:
+            print(f"Araç güncelleme hatası: {e}")
+            return False
+    
+    def delete_arac(self, arac_id):
+        """Araç sil"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM araclar WHERE id = ?", (arac_id,))
+            self.conn.commit()
+            self._arac_cache.pop(arac_id, None)
+            self._notify('araclar', 'delete', [arac_id])
+            return True
+        except sqlite3.Error as e:
+            print(f"Araç silme hatası: {e}")
+            return False
+    
+    def delete_araclar_by_santiye(self, santiye_id):
+        """Şantiyedeki tüm araçları sil"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id FROM araclar WHERE santiye_id = ?", (santiye_id,))
+            arac_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute("DELETE FROM araclar WHERE santiye_id = ?", (santiye_id,))
+            self.conn.commit()
+            self._arac_cache.clear()
+            self._notify('araclar', 'delete', arac_ids)
+            return True
+        except sqlite3.Error as e:
+            print(f"Araç silme hatası: {e}")
+            return False
+    
     def get_araclar_by_santiye(self, santiye_id):
         """Belirli şantiyedeki araçları getir"""
         try:
@@ -555,6 +2168,7 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'Sağlam', 'Aktif')
             ''', (arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id))
             self.conn.commit()
+            self._notify('araclar', 'insert', [cursor.lastrowid])
             return cursor.lastrowid
         except sqlite3.Error as e:
             print(f"Araç ekleme hatası: {e}")
@@ -569,10 +2183,112 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'Aktif')
             ''', (arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum))
             self.conn.commit()
+            self._notify('araclar', 'insert', [cursor.lastrowid])
             return cursor.lastrowid
         except sqlite3.Error as e:
-            print(f"Araç ekleme hatası: {e}")
+            print(f"Araç ekleme hatası: {e}")
+            return None
+    
+    # upsert_araclar ile birleştirilen alanlar (plaka anahtardır)
+    ARAC_MERGE_FIELDS = ('arac_makine_adi', 'makine_no', 'marka', 'model', 'model_yili',
+                         'hesap_adi', 'santiye_id', 'durum')
+    
+    @staticmethod
+    def _merge_arac(current, incoming, merge):
+        """Kayıtlı aracın alanlarını (ARAC_MERGE_FIELDS sırası) gelen değerlerle birleştir.
+        Dosyada olmayan sütunlar (MISSING_CELL) hiçbir kuralda kayıtlı değeri değiştirmez.
+        """
+        if merge == 'keep':
+            return tuple(current)
+        incoming = tuple(old if new is MISSING_CELL else new for old, new in zip(current, incoming))
+        if merge == 'fill_blanks':
+            return tuple(old if old not in (None, '') else new for old, new in zip(current, incoming))
+        # overwrite: boş hücreler de yazılır; yalnızca şantiye ve durum boşsa korunur
+        keep_if_blank = ('santiye_id', 'durum')
+        return tuple(old if new is None and field in keep_if_blank else new
+                     for field, old, new in zip(DatabaseManager.ARAC_MERGE_FIELDS, current, incoming))
+    
+    def upsert_araclar(self, rows, santiye_id=None, merge='overwrite'):
+        """Araçları plakaya göre tek transaction içinde ekle ya da güncelle.
+        rows: prepare_vehicle_rows satırları; aynı plaka birden çok kez geçerse son satır geçerlidir.
+        merge: plakası kayıtlı araçlar için kural (bkz. VEHICLE_MERGE_RULES)
+            'overwrite'   -> Excel'deki değerler yazılır, araç bu şantiyeye geçer
+            'keep'        -> kayıtlı araçlara dokunulmaz
+            'fill_blanks' -> yalnızca kayıtlı araçtaki boş alanlar doldurulur
+        Dosyada bulunmayan sütunlar (MISSING_CELL) kayıtlı araçta korunur, yeni araçta
+        boş kalır. Durumu boş olan yeni araç 'Sağlam' eklenir. Değişmeyen araçlar yazılmaz; aynı
+        dosyayı yeniden aktarmak veritabanını değiştirmez.
+        Dönen: {'inserted': [...], 'updated': [...], 'unchanged': [...]} plaka listeleri;
+        hata olursa None (hiçbir satır yazılmaz).
+        """
+        if merge not in VEHICLE_MERGE_RULES:
+            raise ValueError(f"Geçersiz birleştirme kuralı: {merge}")
+        incoming = {}
+        for arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, durum in rows:
+            incoming[plaka] = (arac_makine_adi, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum)
+        result = {'inserted': [], 'updated': [], 'unchanged': []}
+        fields = self.ARAC_MERGE_FIELDS
+        santiye_index = fields.index('santiye_id')
+        updated_ids = []
+        moved_ids = []
+        inserted_ids = []
+        try:
+            with self.transaction() as conn:
+                # Kayıtlı araçları plakaya göre oku (SQLite parametre sınırı için parça parça)
+                existing = {}
+                plates = list(incoming)
+                for start in range(0, len(plates), 500):
+                    chunk = plates[start:start + 500]
+                    cursor = conn.execute(f'''
+                        SELECT plaka, id, {', '.join(fields)}
+                        FROM araclar
+                        WHERE plaka IN ({', '.join('?' * len(chunk))})
+                    ''', chunk)
+                    for row in cursor:
+                        existing[row[0]] = (row[1], row[2:])
+                writes = []
+                for plaka, values in incoming.items():
+                    if plaka not in existing:
+                        values = tuple(None if value is MISSING_CELL else value for value in values)
+                        writes.append((plaka,) + values[:-1] + (values[-1] or 'Sağlam',))
+                        result['inserted'].append(plaka)
+                        continue
+                    arac_id, current = existing[plaka]
+                    merged = self._merge_arac(current, values, merge)
+                    if merged == tuple(current):
+                        result['unchanged'].append(plaka)
+                        continue
+                    writes.append((plaka,) + merged)
+                    result['updated'].append(plaka)
+                    # Şantiyesi değişen araçlar ayrı bildirilir (kayıtların şantiye kapsamı değişir)
+                    if merged[santiye_index] != current[santiye_index]:
+                        moved_ids.append(arac_id)
+                    else:
+                        updated_ids.append(arac_id)
+                conn.executemany(f'''
+                    INSERT INTO araclar (plaka, {', '.join(fields)}, ariza_durumu)
+                    VALUES ({', '.join('?' * (len(fields) + 1))}, 'Aktif')
+                    ON CONFLICT(plaka) DO UPDATE SET
+                        {', '.join(f'{field} = excluded.{field}' for field in fields)}
+                ''', writes)
+                inserted = result['inserted']
+                for start in range(0, len(inserted), 500):
+                    chunk = inserted[start:start + 500]
+                    inserted_ids.extend(row[0] for row in conn.execute(
+                        f"SELECT id FROM araclar WHERE plaka IN ({', '.join('?' * len(chunk))})", chunk
+                    ))
+        except sqlite3.Error as e:
+            print(f"Toplu araç aktarım hatası: {e}")
             return None
+        for arac_id in updated_ids + moved_ids:
+            self._arac_cache.pop(arac_id, None)
+        if inserted_ids:
+            self._notify('araclar', 'insert', inserted_ids)
+        if updated_ids:
+            self._notify('araclar', 'update', updated_ids, [f for f in fields if f != 'santiye_id'])
+        if moved_ids:
+            self._notify('araclar', 'update', moved_ids, fields)
+        return result
     
     def update_arac_durum(self, arac_id, durum, ariza_durumu=None):
         """Araç durumunu güncelle"""
@@ -591,6 +2307,8 @@ class DatabaseManager:
                     WHERE id = ?
                 ''', (durum, arac_id))
             self.conn.commit()
+            self._arac_cache.pop(arac_id, None)
+            self._notify('araclar', 'update', [arac_id], ('durum', 'ariza_durumu'))
             return True
         except sqlite3.Error as e:
             print(f"Araç güncelleme hatası: {e}")
@@ -614,6 +2332,8 @@ class DatabaseManager:
                     SET durum = 'Sağlam', ariza_durumu = 'Aktif'
                 ''')
             self.conn.commit()
+            self._arac_cache.clear()
+            self._notify('araclar', 'update', fields=('durum', 'ariza_durumu'))
             return cursor.rowcount
         except sqlite3.Error as e:
             print(f"Araç durum düzeltme hatası: {e}")
@@ -631,19 +2351,631 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Araç listesi getirme hatası: {e}")
             return []
+    
+    def get_araclar_page(self, santiye_id=None, saglam=None, after=None, page_size=VEHICLES_PAGE_SIZE):
+        """Araçları sayfa sayfa getir (keyset sayfalama).
+        Şantiye verilirse plakaya göre, verilmezse en yeni kayıttan başlayarak
+        (olusturma_tarihi, id) sırasıyla listelenir. saglam True/False ise yalnızca
+        durumu 'Sağlam' olan / olmayan araçlar döner.
+        Dönen: (araçlar, devam anahtarı); son sayfada devam anahtarı None olur.
+        """
+        conditions = []
+        params = []
+        if santiye_id:
+            conditions.append('santiye_id = ?')
+            params.append(santiye_id)
+        if saglam is not None:
+            conditions.append("COALESCE(durum, '') = 'Sağlam'" if saglam else "COALESCE(durum, '') != 'Sağlam'")
+        if santiye_id:
+            order = 'plaka ASC'
+            if after:
+                conditions.append('plaka > ?')
+                params.extend(after)
+        else:
+            order = 'olusturma_tarihi DESC, id DESC'
+            if after:
+                conditions.append('(olusturma_tarihi, id) < (?, ?)')
+                params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT * FROM araclar
+                {where}
+                ORDER BY {order}
+                LIMIT ?
+            ''', (*params, page_size + 1))
+            rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Araç listesi getirme hatası: {e}")
+            return [], None
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        last = rows[-1]
+        return rows, ((last[2],) if santiye_id else (last[11], last[0]))
+    
+    def count_araclar(self):
+        """Toplam araç sayısı"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM araclar")
+            return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Araç sayısı getirme hatası: {e}")
+            return 0
+    
+    def iter_araclar(self):
+        """Tüm araçları cursor üzerinden tek tek döndür (dışa aktarım için)"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT * FROM araclar 
+                ORDER BY olusturma_tarihi DESC
+            ''')
+            yield from cursor
+        except sqlite3.Error as e:
+            print(f"Araç listesi getirme hatası: {e}")
+
+def parse_display_km(value):
+    """Tablo için KM değerini tamsayıya çevirir; boş/0/negatif değerler None döner."""
+    if isinstance(value, (int, float)):
+        numeric = int(value)
+    else:
+        try:
+            numeric = int(str(value).replace(" ", "").replace(".", "").replace(",", "")) if value not in (None, "", "-") else None
+        except Exception:
+            numeric = None
+    if numeric is None or numeric <= 0:
+        return None
+    return numeric
+
+class MaintenanceTableModel(QAbstractTableModel):
+    """Bakım kayıtları için sanal tablo modeli.
+    Kayıtlar sütun bazlı listelerde tutulur; görüntü metni, sıralama anahtarı
+    ve renklendirme yalnızca görünen hücreler için data() içinde hesaplanır.
+    """
+    
+    HEADERS = [
+        "Sıra", "ID", "PLAKA", "KAPI NO", "BÖLGE", "TARİH",
+        "BAKIM KM", "SONRAKI KM", "YAPILAN İŞLEM", "DİĞER", "BAKIMI YAPAN"
+    ]
+    # Sıralama için kullanılan rol (tarih -> yyyymmdd, KM -> sayı)
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+    # Sonraki bakıma bu kadar km veya daha az kaldıysa satır vurgulanır
+    DUE_KM_THRESHOLD = DUE_KM_THRESHOLD
+    DUE_COLOR = QColor('#fff3cd')  # soft yellow
+    
+    # UI sütunu -> sütun deposundaki alan
+    # DB: (0)id,(1)s_no,(2)plaka,(3)kapi_no,(4)bolge,(5)tarih,(6)bakim_km,(7)sonraki_km,(8)yapilan,(9)diger,(10)bakim_yapan,(11)kayit_tarihi,(12)tarih_key
+    COLUMN_FIELDS = {
+        2: 'plaka', 3: 'kapi_no', 4: 'bolge', 5: 'tarih', 6: 'bakim_km',
+        7: 'sonraki_bakim_km', 8: 'yapilan_islem', 9: 'diger', 10: 'bakim_yapan'
+    }
+    # DB satırındaki 2..10 numaralı alanlar
+    RECORD_FIELDS = ('plaka', 'kapi_no', 'bolge', 'tarih', 'bakim_km',
+                     'sonraki_bakim_km', 'yapilan_islem', 'diger', 'bakim_yapan')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Sonraki sayfayı isteyen fonksiyon: fetch_page(devam_anahtarı)
+        self.fetch_page = None
+        self._clear_columns()
+    
+    def _clear_columns(self):
+        self.ids = []
+        self.columns = {field: [] for field in self.COLUMN_FIELDS.values()}
+        # Kayıtların veritabanından hangi filtreyle okunduğu (None: arama sonucu gibi sorgu dışı liste)
+        self.query_filter = None
+        # Filtre anahtarları (tarih_key, bölge/bakım yapan kodları) yüklemede bir kez hesaplanır
+        self.filter_index = RecordFilterIndex()
+        self.next_page = None   # devam anahtarı (None = tüm kayıtlar yüklü)
+        self.fetching = False
+    
+    def _extend_columns(self, records):
+        self.ids.extend(r[0] for r in records)
+        for db_index, field in enumerate(self.RECORD_FIELDS, start=2):
+            self.columns[field].extend(r[db_index] for r in records)
+        self.filter_index.extend(records)
+    
+    @property
+    def tarih_keys(self):
+        return self.filter_index.tarih_keys
+    
+    def set_records(self, records, next_page=None, query_filter=None):
+        """Kayıt listesini sütun deposuna aktar; next_page verilirse kalan kayıtlar kaydırdıkça istenir"""
+        self.beginResetModel()
+        self._clear_columns()
+        self._extend_columns(records)
+        self.next_page = next_page
+        self.query_filter = query_filter
+        self.endResetModel()
+    
+    def append_records(self, records, next_page=None):
+        """Gelen sayfayı tablonun sonuna ekle"""
+        self.fetching = False
+        if records:
+            start = len(self.ids)
+            self.beginInsertRows(QModelIndex(), start, start + len(records) - 1)
+            self._extend_columns(records)
+            self.endInsertRows()
+        self.next_page = next_page
+    
+    def _record_values(self, record):
+        return {field: record[db_index] for db_index, field in enumerate(self.RECORD_FIELDS, start=2)}
+    
+    def _insert_position(self, key):
+        """(tarih_key, id) sırasında anahtarın ekleneceği satır"""
+        low, high = 0, len(self.ids)
+        while low < high:
+            middle = (low + high) // 2
+            if (self.tarih_keys[middle], self.ids[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def row_of(self, record_id):
+        """Kaydın satırı (yüklü değilse None)"""
+        try:
+            return self.ids.index(record_id)
+        except ValueError:
+            return None
+    
+    def insert_records(self, records):
+        """Yeni eklenen kayıtları (tarih_key, id) sırasındaki yerlerine ekle.
+        Arama sonucu gösteriliyorsa ya da kayıt henüz yüklenmemiş sayfalara düşüyorsa eklenmez.
+        """
+        if self.query_filter is None:
+            return
+        for record in records:
+            if not self.query_filter.matches(record):
+                continue
+            key = (RecordFilterIndex.record_key(record), record[0])
+            if self.next_page is not None and key > tuple(self.next_page):
+                continue  # sonraki sayfalarla gelecek
+            row = self._insert_position(key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.ids.insert(row, record[0])
+            for field, value in self._record_values(record).items():
+                self.columns[field].insert(row, value)
+            self.filter_index.insert(row, record)
+            self.endInsertRows()
+    
+    def update_record(self, record):
+        """Yüklü kaydı yerinde güncelle; tarihi değiştiyse sıradaki yerine taşı.
+        Yüklü değilse ama artık filtreye uyuyorsa eklenir.
+        """
+        row = self.row_of(record[0])
+        if row is None:
+            self.insert_records([record])
+            return
+        if self.query_filter is not None and (not self.query_filter.matches(record)
+                                              or RecordFilterIndex.record_key(record) != self.tarih_keys[row]):
+            self.remove_records([record[0]])
+            self.insert_records([record])
+            return
+        for field, value in self._record_values(record).items():
+            self.columns[field][row] = value
+        self.filter_index.update(row, record)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def remove_records(self, record_ids):
+        """Silinen kayıtları tablodan çıkar"""
+        for record_id in record_ids:
+            row = self.row_of(record_id)
+            if row is None:
+                continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.ids[row]
+            for values in self.columns.values():
+                del values[row]
+            self.filter_index.remove(row)
+            self.endRemoveRows()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.next_page is not None and not self.fetching and self.fetch_page is not None
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        # Sayfa arka planda okunur ve append_records ile eklenir
+        self.fetching = True
+        self.fetch_page(self.next_page, self.query_filter)
+    
+    def record_id(self, row):
+        """Satırdaki kaydın veritabanı ID'si"""
+        if 0 <= row < len(self.ids):
+            return self.ids[row]
+        return None
+    
+    def is_due(self, row):
+        """Sonraki bakım KM'si yaklaşmış mı?"""
+        current_km = parse_display_km(self.columns['bakim_km'][row])
+        next_km = parse_display_km(self.columns['sonraki_bakim_km'][row])
+        return bool(current_km and next_km and next_km - current_km <= self.DUE_KM_THRESHOLD)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # Görüntüleme tutarlılığı için hücreler düzenlenemez
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def display_value(self, row, col):
+        """Hücrenin ekranda görünen metni"""
+        if col == 0:
+            return str(row + 1)
+        if col == 1:
+            return str(self.ids[row])
+        value = self.columns[self.COLUMN_FIELDS[col]][row]
+        if col in (6, 7):
+            numeric = parse_display_km(value)
+            return format_thousands_dot(numeric) if numeric is not None else "-"
+        if col == 5:
+            return normalize_date_display(value)[0]
+        return str(value) if value not in (None, "") else "-"
+    
+    def sort_value(self, row, col):
+        """Hücrenin sıralama anahtarı"""
+        if col in (0, 1):
+            return row if col == 0 else self.ids[row]
+        if col == 5:
+            return self.tarih_keys[row]
+        if col in (6, 7):
+            return parse_display_km(self.columns[self.COLUMN_FIELDS[col]][row]) or 0
+        return self.display_value(row, col)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.display_value(row, col)
+        if role == self.SORT_ROLE:
+            return self.sort_value(row, col)
+        if role == Qt.ItemDataRole.UserRole:
+            return self.ids[row]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Sütun hizalamaları
+            if col in (0, 2, 3, 4, 5):
+                return int(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
+            if col in (6, 7):
+                return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        if role == Qt.ItemDataRole.ToolTipRole and col in (8, 9):
+            # Uzun metinler için tooltip
+            text = self.display_value(row, col)
+            return text if text != "-" else None
+        if role == Qt.ItemDataRole.BackgroundRole and self.is_due(row):
+            return self.DUE_COLOR
+        return None
+
+class MaintenanceFilterProxyModel(QSortFilterProxyModel):
+    """Bakım tablosu için filtreleme ve sıralama katmanı.
+    Filtre değiştiğinde kabul maskesi RecordFilter.mask ile tek seferde hesaplanır;
+    filterAcceptsRow yalnızca maskeye bakar.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.record_filter = RecordFilter()
+        self._mask = None
+        self._mask_source = None   # maskenin hesaplandığı (RecordFilterIndex, sürüm)
+        self.setSortRole(MaintenanceTableModel.SORT_ROLE)
+    
+    def set_filters(self, bolge=None, bakim_yapan=None, date_range=None, santiye_id=None):
+        """Filtreleri ayarla; None olan filtre devre dışıdır. date_range: (start_key, end_key)"""
+        record_filter = RecordFilter(bolge, bakim_yapan, date_range, santiye_id)
+        if record_filter == self.record_filter:
+            return
+        self.record_filter = record_filter
+        self._mask = None
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.record_filter.is_empty:
+            return True
+        # Kayıtlar değiştiyse (yeni sayfa, ekleme, silme, güncelleme) maske yeniden hesaplanır
+        index = self.sourceModel().filter_index
+        if self._mask is None or self._mask_source != (id(index), index.version):
+            self._mask = self.record_filter.mask(index)
+            self._mask_source = (id(index), index.version)
+        return bool(self._mask[source_row])
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Sıra sütunu görünen satır numarasını gösterir
+        if index.isValid() and index.column() == 0 and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return str(index.row() + 1)
+        return super().data(index, role)
+
+class DatabaseWorker(QObject):
+    """DatabaseManager sorgularını arayüz thread'i dışında çalıştıran işçi.
+    Aynı DatabaseManager'ı paylaşır; ConnectionManager işçi thread'ine kendi (WAL
+    okuyucu) bağlantısını verir. Aynı türden art arda gelen istekler tek sorguda
+    birleştirilir ve sonuç result_ready sinyali ile iletilir; hata olursa failed gelir.
+    """
+    
+    result_ready = pyqtSignal(str, int, object)  # istek türü, istek no, sonuç
+    failed = pyqtSignal(str, int, str)           # istek türü, istek no, hata mesajı
+    _wake = pyqtSignal()
+    
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self._lock = threading.Lock()
+        self._pending = {}      # tür -> (istek no, argümanlar)
+        self._scheduled = False
+        self._seq = 0
+        self._latest = {}       # tür -> en son istenen istek no
+        self._wake.connect(self._process)
+    
+    def request(self, kind, *args):
+        """Sorgu isteği kuyruğa al; bekleyen aynı türden istek varsa yerine geçer"""
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._pending[kind] = (seq, args)
+            self._latest[kind] = seq
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+        return seq
+    
+    def is_current(self, kind, seq):
+        """Sonuç, bu tür için en son yapılan isteğe mi ait?"""
+        return self._latest.get(kind) == seq
+    
+    @pyqtSlot()
+    def _process(self):
+        """Bekleyen istekleri (işçi thread'inde) çalıştır"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._scheduled = False
+        for kind, (seq, args) in pending.items():
+            try:
+                result = getattr(self, f"_job_{kind}")(*args)
+            except Exception as e:
+                print(f"Arka plan sorgu hatası ({kind}): {e}")
+                self.failed.emit(kind, seq, str(e))
+                continue
+            self.result_ready.emit(kind, seq, result)
+    
+    def _job_records(self, record_filter=None, summary=True):
+        records, next_page = self.db_manager.get_records_page(record_filter=record_filter)
+        result = {
+            'filter': record_filter or RecordFilter(),
+            'records': records,
+            'next_page': next_page
+        }
+        if summary:
+            # Filtre seçenekleri, istatistikler ve sayaçlar yalnızca tam yenilemede okunur
+            result.update(self._job_summary(result['filter'].santiye_id))
+        return result
+    
+    def _job_summary(self, santiye_id=None):
+        # Özet tablolar (plaka_ozet, bakim_sayaclari) sayesinde ucuzdur
+        return {
+            'filter_options': self.db_manager.get_filter_options(),
+            'statistics': self.db_manager.get_statistics(santiye_id),
+            'total_vehicles': self.db_manager.count_araclar()
+        }
+
+    def _job_search(self, text, limit):
+        # Kuyruğa daha yeni bir arama girerse çalışan sorgu yarıda kesilir (records None döner)
+        records = self.db_manager.search_records(text, limit, cancel=lambda: 'search' in self._pending)
+        return {'text': text, 'limit': limit, 'records': records}
+    
+    def _job_records_page(self, after, record_filter=None):
+        records, next_page = self.db_manager.get_records_page(after, record_filter=record_filter)
+        return {'after': after, 'records': records, 'next_page': next_page}
+    
+    def _job_forecast(self, generation):
+        # Tüm km geçmişi okunup tahmin modeli kurulur; sonrasında model arayüz thread'inde güncellenir
+        return {'generation': generation, 'forecaster': KmForecaster(self.db_manager.get_km_history())}
+    
+    def _job_santiyeler(self):
+        return self.db_manager.get_all_santiyeler()
+    
+    def _job_vehicles(self, santiye_id=None):
+        return {
+            'santiye_id': santiye_id,
+            'active': self.db_manager.get_araclar_page(santiye_id, saglam=True),
+            'faulty': self.db_manager.get_araclar_page(santiye_id, saglam=False)
+        }
+    
+    def _job_active_vehicles_page(self, santiye_id, after):
+        return {'after': after, 'page': self.db_manager.get_araclar_page(santiye_id, saglam=True, after=after)}
+    
+    def _job_faulty_vehicles_page(self, santiye_id, after):
+        return {'after': after, 'page': self.db_manager.get_araclar_page(santiye_id, saglam=False, after=after)}
+
+class DatabaseChangeRelay(QObject):
+    """DatabaseManager değişiklik bildirimlerini (ChangeEvent) Qt sinyaline çevirir.
+    Yazma başka bir thread'de yapılsa bile sinyal arayüz thread'ine kuyrukla iletilir.
+    """
+    
+    changed = pyqtSignal(object)  # ChangeEvent
+
+class SearchPipeline(QObject):
+    """Yazarken arama hattı.
+    Metin değişiklikleri debounce_ms boyunca biriktirilir; yazma durunca tek arama yapılır.
+    Sorgu DatabaseWorker'da çalışır; daha yeni bir arama gelince bekleyen ya da çalışan eski
+    sorgu iptal edilir ve geç gelen sonuçlar atılır. Yeni metin önceki (eksiksiz) sonucu
+    daraltıyorsa ("34 a" -> "34 ab") veritabanına gidilmeden bellekte süzülür.
+    """
+
+    results_ready = pyqtSignal(str, object)  # arama metni, kayıtlar
+    cleared = pyqtSignal()                   # arama kutusu boşaltıldı
+
+    def __init__(self, db_worker, debounce_ms=SEARCH_DEBOUNCE_MS, limit=SEARCH_RESULT_LIMIT, parent=None):
+        super().__init__(parent)
+        self.db_worker = db_worker
+        self.limit = limit
+        self.text = ''
+        self._shown = ''       # tabloda sonucu gösterilen metin
+        self._last = None      # [kelimeler, kayıtlar, kayıt kelimeleri] - son eksiksiz sonuç
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce_ms)
+        self.timer.timeout.connect(self.run)
+
+    def set_debounce(self, debounce_ms):
+        self.timer.setInterval(debounce_ms)
+
+    def set_text(self, text):
+        """Arama kutusundaki metin değişti; bekleme süresi yeniden başlar"""
+        self.text = (text or '').strip()
+        self.timer.start()
+
+    def invalidate(self):
+        """Veriler değişti; bellekteki sonuç artık daraltma için kullanılamaz"""
+        self._last = None
+        self._shown = None
+
+    def run(self):
+        """Bekleyen aramayı hemen çalıştır"""
+        self.timer.stop()
+        text = self.text
+        if text == self._shown:
+            return
+        if not text:
+            self._last = None
+            self._shown = ''
+            self.cleared.emit()
+            return
+        records = self._narrow(text)
+        if records is not None:
+            self._shown = text
+            self.results_ready.emit(text, records)
+            return
+        self.db_worker.request('search', text, self.limit)
+
+    def _narrow(self, text):
+        """Önceki sonuç yeni aramayı kapsıyorsa bellekte süzülmüş kayıtlar, değilse None"""
+        if self._last is None:
+            return None
+        old_tokens, records, words = self._last
+        tokens = search_tokens(text)
+        # Her eski kelime, yeni kelimelerden birinin öneki olmalı (sonuç kümesi yalnızca küçülür)
+        if not tokens or not all(any(new.startswith(old) for new in tokens) for old in old_tokens):
+            return None
+        if words is None:
+            # Kayıt kelimeleri ilk daraltmada bir kez çıkarılır
+            words = self._last[2] = [record_search_words(record) for record in records]
+        matches = [
+            (not words_match(tokens, plate_words), self._date_order(record), record)
+            for record, (plate_words, all_words) in zip(records, words)
+            if words_match(tokens, all_words)
+        ]
+        # Sıralama search_records ile aynı: önce plakada eşleşenler, sonra tarihi en yeni
+        # kayıt, tarihsizler en sonda
+        matches.sort(key=lambda item: item[:2])
+        return [record for _, _, record in matches]
+
+    @staticmethod
+    def _date_order(record):
+        """ORDER BY tarih_key = MISSING_DATE_KEY, tarih_key DESC, id DESC sıralama anahtarı"""
+        key = RecordFilterIndex.record_key(record)
+        return key == MISSING_DATE_KEY, -key, -record[0]
+
+    def handle_result(self, result):
+        """DatabaseWorker'dan gelen arama sonucu"""
+        # İptal edilen ya da kutudaki metinle artık uyuşmayan sonuçlar atılır
+        if result['records'] is None or result['text'] != self.text:
+            return
+        records = result['records']
+        self._last = None
+        if len(records) < result['limit']:
+            self._last = [search_tokens(result['text']), records, None]
+        self._shown = result['text']
+        self.results_ready.emit(result['text'], records)
 
-class ModernTableWidget(QTableWidget):
-    """Modern tablo widget'ı"""
+class ModernTableWidget(QTableView):
+    """Modern tablo widget'ı (MaintenanceTableModel + MaintenanceFilterProxyModel)"""
     
     def __init__(self):
         super().__init__()
+        self.source_model = MaintenanceTableModel(self)
+        self.proxy_model = MaintenanceFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.source_model)
+        self.setModel(self.proxy_model)
+        self._columns_sized = False
         self.setup_ui()
     
+    # İçeriğe göre genişleyen sütunlar: PLAKA, KAPI NO, BÖLGE, TARİH, BAKIM KM, SONRAKI KM, DİĞER, BAKIMI YAPAN
+    CONTENT_COLUMNS = (2, 3, 4, 5, 6, 7, 9, 10)
+    
+    def set_records(self, records, next_page=None, query_filter=None):
+        """Tabloyu verilen kayıtlarla doldur"""
+        self.source_model.set_records(records, next_page, query_filter)
+        if records and not self._columns_sized:
+            self.size_columns()
+        self.update_sorting()
+    
+    def size_columns(self):
+        """İçerik sütunlarını ilk sayfaya göre bir kez boyutlandır.
+        ResizeToContents her model sıfırlamasında tüm satırları ölçtüğü için kullanılmaz;
+        sonrasında genişlikler kullanıcı tarafından değiştirilebilir.
+        """
+        minimum = {column: self.columnWidth(column) for column in self.CONTENT_COLUMNS}
+        for column in self.CONTENT_COLUMNS:
+            self.resizeColumnToContents(column)
+            self.setColumnWidth(column, max(self.columnWidth(column), minimum[column]))
+        self._columns_sized = True
+    
+    def append_records(self, records, next_page=None):
+        """Kaydırmayla istenen sonraki sayfayı ekle"""
+        self.source_model.append_records(records, next_page)
+        self.update_sorting()
+    
+    def update_sorting(self):
+        """Başlıkla sıralamayı yalnızca tüm kayıtlar yüklüyken aç.
+        Sayfalı yüklemede yalnızca yüklü sayfalar sıralanır ve sonraki sayfalar sıranın
+        dışında eklenirdi; o sırada tablo veritabanı sırasında (tarih, id) gösterilir.
+        """
+        complete = self.source_model.next_page is None
+        if complete == self.isSortingEnabled():
+            return
+        if not complete:
+            # Önceki sıralama kaldırılır; proxy kaynak sırasına döner
+            self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.setSortingEnabled(complete)
+        self.horizontalHeader().setToolTip(
+            "" if complete else "Tüm kayıtlar yüklenince başlığa tıklayarak sıralayabilirsiniz"
+        )
+    
+    def current_record_id(self):
+        """Seçili satırın kayıt ID'si (seçim yoksa None)"""
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        source_index = self.proxy_model.mapToSource(index)
+        return self.source_model.record_id(source_index.row())
+    
     def setup_ui(self):
         """Tablo arayüzünü ayarla"""
         # Modern tema tablo
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {SECONDARY_BG};
                 color: {PRIMARY_TEXT};
                 border: 1px solid {BORDER_ACCENT};
@@ -653,16 +2985,16 @@ class ModernTableWidget(QTableWidget):
                 selection-color: {PRIMARY_TEXT};
                 font-size: 11px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 10px 8px;
                 border-bottom: 1px solid {BORDER_PRIMARY};
                 border-right: 1px solid {BORDER_PRIMARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {PRIMARY_ACCENT};
                 color: {PRIMARY_TEXT};
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background-color: {TERTIARY_BG};
             }}
             QHeaderView::section {{
@@ -698,27 +3030,14 @@ class ModernTableWidget(QTableWidget):
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setSortingEnabled(True)
         
-        # Sütun başlıkları
-        headers = [
-            "Sıra", "ID", "PLAKA", "KAPI NO", "BÖLGE", "TARİH", 
-            "BAKIM KM", "SONRAKI KM", "YAPILAN İŞLEM", "DİĞER", "BAKIMI YAPAN"
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-        
         # Sütun genişlikleri
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)  # Sıra
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)  # ID
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # PLAKA
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # KAPI NO
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # BÖLGE
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # TARİH
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # BAKIM KM
-        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)  # SONRAKI KM
+        # İçerik sütunları ilk sayfa gelince bir kez boyutlandırılır (bkz. size_columns)
+        for column in self.CONTENT_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(8, QHeaderView.ResizeMode.Stretch)           # YAPILAN İŞLEM
-        header.setSectionResizeMode(9, QHeaderView.ResizeMode.ResizeToContents)  # DİĞER
-        header.setSectionResizeMode(10, QHeaderView.ResizeMode.ResizeToContents)  # BAKIMI YAPAN
         header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.setColumnWidth(0, 50)   # Sıra
@@ -739,7 +3058,7 @@ class ModernTableWidget(QTableWidget):
         
         # Modern tema tablo
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {SECONDARY_BG};
                 color: {PRIMARY_TEXT};
                 border: 1px solid {BORDER_ACCENT};
@@ -749,16 +3068,16 @@ class ModernTableWidget(QTableWidget):
                 selection-color: {PRIMARY_TEXT};
                 font-size: 11px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 10px 8px;
                 border-bottom: 1px solid {BORDER_PRIMARY};
                 border-right: 1px solid {BORDER_PRIMARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {PRIMARY_ACCENT};
                 color: {PRIMARY_TEXT};
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background-color: {TERTIARY_BG};
             }}
             QHeaderView::section {{
@@ -788,6 +3107,161 @@ class ModernTableWidget(QTableWidget):
             }}
         """)
 
+class VehicleTableModel(QAbstractTableModel):
+    """Araç listeleri için ortak tablo modeli.
+    Aktif ve arızalı araç tabloları aynı modeli VehicleStatusProxyModel ile süzerek gösterir;
+    bir aracın durumu değişince (update_vehicle) dataChanged ile satır diğer tabloya geçer.
+    """
+
+    HEADERS = [
+        "Sıra", "Araç / Makine Adı", "Plakası", "Makine No", "Markası", "Model", "Model Yılı", "Hesap Adı", "Durum"
+    ]
+    # UI sütunu -> araç satırındaki alan
+    # arac: (0)id,(1)arac_makine_adi,(2)plaka,(3)makine_no,(4)marka,(5)model,(6)model_yili,(7)hesap_adi,(8)santiye_id,(9)durum,(10)ariza_durumu,(11)olusturma_tarihi
+    COLUMN_FIELDS = {1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 9}
+    # Sıra, Plaka, Makine No, Model Yılı ortalanır; diğerleri sola
+    CENTER_COLUMNS = (0, 2, 3, 6)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.araclar = []
+        self.rows = {}   # araç id -> satır
+
+    def set_vehicles(self, araclar):
+        """Araç listesini değiştir"""
+        self.beginResetModel()
+        self.araclar = list(araclar)
+        self.rows = {arac[0]: row for row, arac in enumerate(self.araclar)}
+        self.endResetModel()
+
+    def append_vehicles(self, araclar):
+        """Sayfayı sona ekle; zaten listede olan araçlar yerinde güncellenir"""
+        new = []
+        for arac in araclar:
+            if arac[0] in self.rows:
+                self.update_vehicle(arac)
+            else:
+                new.append(arac)
+        if not new:
+            return
+        start = len(self.araclar)
+        self.beginInsertRows(QModelIndex(), start, start + len(new) - 1)
+        for row, arac in enumerate(new, start=start):
+            self.araclar.append(arac)
+            self.rows[arac[0]] = row
+        self.endInsertRows()
+
+    def update_vehicle(self, arac):
+        """Listedeki aracı yeni satırla değiştir; araç listede yoksa False"""
+        row = self.rows.get(arac[0])
+        if row is None:
+            return False
+        self.araclar[row] = arac
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+
+    def remove_vehicle(self, arac_id):
+        """Aracı listeden çıkar"""
+        row = self.rows.get(arac_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.araclar[row]
+        self.rows = {arac[0]: index for index, arac in enumerate(self.araclar)}
+        self.endRemoveRows()
+        return True
+
+    def arac_id(self, row):
+        """Satırdaki aracın veritabanı ID'si"""
+        if 0 <= row < len(self.araclar):
+            return self.araclar[row][0]
+        return None
+
+    def is_saglam(self, row):
+        return (self.araclar[row][9] or '') == 'Sağlam'
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.araclar)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def display_value(self, row, col):
+        """Hücrenin ekranda görünen metni"""
+        if col == 0:
+            return str(row + 1)
+        value = self.araclar[row][self.COLUMN_FIELDS[col]]
+        return str(value) if value not in (None, '') else '-'
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.display_value(row, col)
+        if role == Qt.ItemDataRole.UserRole:
+            return self.araclar[row][0]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in self.CENTER_COLUMNS:
+                return int(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+class VehicleStatusProxyModel(QSortFilterProxyModel):
+    """Araç modelini duruma göre süzer: saglam=True ise 'Sağlam' olanlar, False ise diğerleri"""
+
+    def __init__(self, saglam, status_header="Durum", parent=None):
+        super().__init__(parent)
+        self.saglam = saglam
+        self.status_header = status_header
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().is_saglam(source_row) == self.saglam
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal and section == 8:
+            return self.status_header
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Sıra sütunu görünen satır numarasını gösterir
+        if index.isValid() and index.column() == 0 and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return str(index.row() + 1)
+        return super().data(index, role)
+
+class VehicleTableView(QTableView):
+    """Aktif / arızalı araç tablosu (ortak VehicleTableModel üzerinde VehicleStatusProxyModel)"""
+
+    def __init__(self, source_model, saglam, status_header):
+        super().__init__()
+        self.source_model = source_model
+        self.proxy_model = VehicleStatusProxyModel(saglam, status_header, self)
+        self.proxy_model.setSourceModel(source_model)
+        self.setModel(self.proxy_model)
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        # Otomatik satır numaralarını gizle
+        self.verticalHeader().setVisible(False)
+
+    def arac_id_at(self, row):
+        """Görünen satırdaki aracın ID'si"""
+        source_index = self.proxy_model.mapToSource(self.proxy_model.index(row, 0))
+        return self.source_model.arac_id(source_index.row()) if source_index.isValid() else None
+
 class RecordDialog(QDialog):
     """Kayıt ekleme/düzenleme dialog'u"""
     
@@ -959,18 +3433,51 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
-        self.update_manager = UpdateManager()  # Güncelleme yöneticisi
         self.settings = QSettings("OztacPetrol", "SantiyeYonetim") # Ayarlar objesi
+        # Güncelleme yöneticisi; kontroller arka planda, önbellekli yapılır
+        self.update_manager = UpdateManager(check_interval=self.settings.value(
+            "update_check_interval_hours", UPDATE_CHECK_INTERVAL_HOURS, type=float) * 3600)
+        self.update_checker = UpdateChecker(self.update_manager, self)
+        self.update_checker.result_ready.connect(self.on_update_checked)
+        # Süren güncelleme indirmesi (bkz. perform_update)
+        self.update_thread = self.update_worker = None
+        # Sorgular arka plan thread'inde çalışır, sonuçlar sinyal ile gelir
+        self.db_thread = QThread(self)
+        self.db_worker = DatabaseWorker(self.db_manager)
+        self.db_worker.moveToThread(self.db_thread)
+        self.db_worker.result_ready.connect(self.on_db_result)
+        self.db_worker.failed.connect(self.on_db_failed)
+        self.db_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_db_worker)
+        # Yazarken arama (bekleme süresi ayarlardan değiştirilebilir)
+        self.search_pipeline = SearchPipeline(
+            self.db_worker, self.settings.value("search_debounce_ms", SEARCH_DEBOUNCE_MS, type=int), parent=self
+        )
+        self.search_pipeline.results_ready.connect(self.on_search_results)
+        self.search_pipeline.cleared.connect(self.on_search_cleared)
+        # Yaklaşan bakımlar için km tahmin modeli (KmForecaster); ilk kullanımda kurulur
+        self.km_forecaster = None
+        # Bakım kaydı değiştikçe artar; model isteği sırasında değişiklik olduysa gelen model eskidir
+        self.forecast_generation = 0
+        self.pending_export_path = None
+        # Yazma işlemleri görünümleri değişiklik bildirimleriyle günceller (tam yenileme yerine)
+        self.db_changes = DatabaseChangeRelay(self)
+        self.db_changes.changed.connect(self.on_db_change)
+        self.db_manager.add_listener(self.db_changes.changed.emit)
         self.setup_ui()
         self.load_data()
         # Şantiyeleri yükle
         self.load_santiyeler()
-        # Açılışta güncelleme kontrolü (arka planda)
-        self.check_updates_on_startup()
+        # Açılışta güncelleme kontrolü (arka planda, ilk çizimi geciktirmesin)
+        QTimer.singleShot(UPDATE_CHECK_DELAY_MS, self.check_updates_on_startup)
         
         # Pencereyi tam ekran yap (monitör çözünürlüğüne göre)
         self.setup_fullscreen()
     
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        STARTUP_TIMER.mark('ilk çizim')
+    
     def setup_fullscreen(self):
         """Monitör çözünürlüğünü algıla ve tam ekran ayarla"""
         # Pencereyi tam ekran yap
@@ -1169,6 +3676,12 @@ class MainWindow(QMainWindow):
         # Araçlar sekmesi
         vehicles_panel = self.create_vehicles_panel()
         right_tabs.addTab(vehicles_panel, "Araçlar")
+        # Yaklaşan bakımlar sekmesi (tahmin modeli sekme ilk açıldığında kurulur)
+        self.upcoming_panel = self.create_upcoming_panel()
+        right_tabs.addTab(self.upcoming_panel, "Yaklaşan Bakımlar")
+        right_tabs.currentChanged.connect(
+            lambda index: self.load_upcoming() if right_tabs.widget(index) is self.upcoming_panel else None
+        )
         content_layout.addWidget(right_tabs)  # Tam genişlik
         
         main_layout.addLayout(content_layout)
@@ -1233,6 +3746,9 @@ class MainWindow(QMainWindow):
                 margin-right: 5px;
             }
         """)
+        # Seçilen şantiye bakım tablosunu ve araç listesini o şantiyeyle sınırlar
+        self.santiye_combo.currentTextChanged.connect(self.on_santiye_changed)
+        self.status_bar.addPermanentWidget(self.santiye_combo)
         # Sağ tarafa kalıcı widget'lar ekle (toplam kayıt ve link)
         self.footer_total = QLabel("Toplam kayıt: 0")
         self.footer_total.setStyleSheet('''
@@ -1557,8 +4073,9 @@ class MainWindow(QMainWindow):
         
         # Modern arama kutusu
         self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("🔍 Plaka ile ara...")
-        self.search_edit.textChanged.connect(self.search_records)
+        self.search_edit.setPlaceholderText("🔍 Plaka, bölge, işlem veya bakım yapan ile ara...")
+        # Her tuşta değil, yazma durunca ara (bkz. SearchPipeline)
+        self.search_edit.textChanged.connect(self.search_pipeline.set_text)
         self.search_edit.setFixedHeight(32)
         self.search_edit.setStyleSheet("""
             QLineEdit {
@@ -2116,11 +4633,13 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(filter_bar)
         self.table = ModernTableWidget()
+        # Kaydırdıkça sonraki kayıt sayfasını arka planda iste
+        self.table.source_model.fetch_page = self.fetch_records_page
         # Sağ tık menüsü etkinleştir
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.on_table_context_menu)
         # Çift tıklamada detay göster
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table.doubleClicked.connect(self.on_cell_double_clicked)
         layout.addWidget(self.table)
         right_panel.setLayout(layout)
         
@@ -2146,28 +4665,19 @@ class MainWindow(QMainWindow):
         menu.addAction(act_view)
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
-    def on_cell_double_clicked(self, row, col):
+    def on_cell_double_clicked(self, index):
         """Çift tıklamada yapılan işlem/detay göster"""
         # Yalnızca 'YAPILAN İŞLEM' veya 'DİĞER' sütunlarında tetikle
-        if col in (8, 9):
+        if index.column() in (8, 9):
             self.show_operation_details()
 
     def show_operation_details(self):
         """Seçili satırın 'Yapılan İşlem' ve 'Diğer' alanlarını büyük pencerede göster"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        record_id = self.table.current_record_id()
+        if record_id is None:
             return
-        item = self.table.item(current_row, 1)  # ID sütunu artık 1. sütun
-        if not item:
-            return
-        record_id = item.data(Qt.ItemDataRole.UserRole)
         # Kayıt bul
-        records = self.db_manager.get_all_records()
-        record = None
-        for r in records:
-            if r[0] == record_id:
-                record = r
-                break
+        record = self.db_manager.get_record(record_id)
         if not record:
             return
         
@@ -2340,15 +4850,38 @@ class MainWindow(QMainWindow):
 
 
     
+    def on_db_result(self, kind, seq, result):
+        """Arka plan sorgu sonucunu ilgili işleyiciye ilet"""
+        # Aynı tür için daha yeni bir istek varsa eski sonucu at
+        if not self.db_worker.is_current(kind, seq) or result is None:
+            return
+        handler = getattr(self, f"on_{kind}_loaded", None)
+        if handler:
+            handler(result)
+    
+    def on_db_failed(self, kind, seq, message):
+        """Arka plan sorgusu hata verdi; türün hata işleyicisi varsa bildir"""
+        if not self.db_worker.is_current(kind, seq):
+            return
+        handler = getattr(self, f"on_{kind}_failed", None)
+        if handler:
+            handler(message)
+    
     def load_santiyeler(self):
-        """Şantiyeleri yükle"""
+        """Şantiyeleri yükle (arka planda)"""
+        self.db_worker.request('santiyeler')
+    
+    def on_santiyeler_loaded(self, santiyeler):
+        """Şantiye listesi geldiğinde combo'yu doldur"""
         try:
-            santiyeler = self.db_manager.get_all_santiyeler()
+            # Liste yeniden doldurulurken ara seçimler tabloyu yeniden yüklemesin
+            self.santiye_combo.blockSignals(True)
             self.santiye_combo.clear()
             self.santiye_combo.addItem("Şantiye Seçiniz...")
             
             for santiye in santiyeler:
                 self.santiye_combo.addItem(santiye[1], santiye[0])  # santiye_adi, id
+            self.santiye_combo.blockSignals(False)
             
             # Varsayılan şantiye ekle (test için)
             if not santiyeler:
@@ -2358,6 +4891,9 @@ class MainWindow(QMainWindow):
             
             # Son seçilen şantiyeyi yükle
             self.load_last_santiye_selection()
+            # Seçim geri yüklenemediyse bakım tablosu tüm şantiyeleri gösterir
+            if self.santiye_combo.currentIndex() == 0:
+                self.on_santiye_changed(self.santiye_combo.currentText())
             
         except Exception as e:
             print(f"Şantiye yükleme hatası: {e}")
@@ -2388,7 +4924,13 @@ class MainWindow(QMainWindow):
             print(f"Şantiye seçimi kaydetme hatası: {e}")
     
     def on_santiye_changed(self, santiye_adi):
-        """Şantiye değiştiğinde araç listesini güncelle"""
+        """Şantiye değiştiğinde araç listesini ve bakım kayıtlarını güncelle"""
+        # Bakım tablosu yalnızca seçili şantiyenin kayıtlarını ((santiye_id, tarih_key) indeksiyle) okur
+        records_santiye_id = self.santiye_combo.currentData()
+        if records_santiye_id != getattr(self, 'records_santiye_id', None):
+            self.records_santiye_id = records_santiye_id
+            self.load_data()
+            self.refresh_upcoming()
         if santiye_adi == "Şantiye Seçiniz...":
             return
         
@@ -2400,6 +4942,123 @@ class MainWindow(QMainWindow):
             # Şantiye seçimini kaydet
             self.save_santiye_selection()
     
+    UPCOMING_HEADERS = ['PLAKA', 'ARAÇ / MAKİNE ADI', 'SON BAKIM', 'SON BAKIM KM', 'SONRAKİ BAKIM KM',
+                        'GÜNLÜK KM', 'TAHMİNİ KM', 'TAHMİNİ BAKIM TARİHİ', 'KALAN GÜN']
+    
+    def create_upcoming_panel(self):
+        """Yaklaşan bakımlar paneli: km kullanımından tahmin edilen bakım tarihleri"""
+        panel = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        header_layout = QHBoxLayout()
+        self.upcoming_info = QLabel("🔧 Km kullanımına göre tahmini bakım tarihleri")
+        self.upcoming_info.setStyleSheet("font-size: 14px; font-weight: bold;")
+        header_layout.addWidget(self.upcoming_info)
+        header_layout.addStretch()
+        export_btn = QPushButton("📤 Excel Dışa Aktar")
+        export_btn.clicked.connect(self.export_excel)
+        header_layout.addWidget(export_btn)
+        layout.addLayout(header_layout)
+        
+        self.upcoming_table = QTableWidget(0, len(self.UPCOMING_HEADERS))
+        self.upcoming_table.setHorizontalHeaderLabels(self.UPCOMING_HEADERS)
+        self.upcoming_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.upcoming_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.upcoming_table.verticalHeader().setVisible(False)
+        self.upcoming_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.upcoming_table)
+        
+        panel.setLayout(layout)
+        return panel
+    
+    def load_upcoming(self):
+        """Yaklaşan bakımları göster; tahmin modeli yoksa arka planda kur"""
+        if self.km_forecaster is None:
+            self.upcoming_info.setText("🔧 Km geçmişi yükleniyor...")
+            self.request_forecast()
+            return
+        self.refresh_upcoming(force=True)
+    
+    def request_forecast(self):
+        """Tahmin modelini arka planda kur (istek, o anki kayıt değişikliği sayacıyla işaretlenir)"""
+        self.db_worker.request('forecast', self.forecast_generation)
+    
+    def on_forecast_loaded(self, result):
+        """Tahmin modeli kurulduğunda yaklaşan bakımları göster; bekleyen dışa aktarımı tamamla"""
+        if result['generation'] != self.forecast_generation:
+            # Model kurulurken kayıtlar değişti; eski geçmişten kurulan model yeniden istenir
+            self.request_forecast()
+            return
+        self.km_forecaster = result['forecaster']
+        self.refresh_upcoming(force=True)
+        file_path, self.pending_export_path = self.pending_export_path, None
+        if file_path:
+            self.write_excel_export(file_path)
+    
+    def on_forecast_failed(self, message):
+        """Tahmin modeli kurulamadı; bekleyen dışa aktarım iptal edilir"""
+        if hasattr(self, 'upcoming_info'):
+            self.upcoming_info.setText(f"🔧 Km tahmini yapılamadı: {message}")
+        file_path, self.pending_export_path = self.pending_export_path, None
+        if file_path:
+            self.status_bar.clearMessage()
+            QMessageBox.critical(self, "Hata", f"Excel dışa aktarım hatası: {message}")
+    
+    def upcoming_rows(self, santiye_id=None):
+        """Şantiyedeki araçların tahmini bakım tarihleri; en yakın bakım önce.
+        Satırlar UPCOMING_HEADERS sırasındadır. Tahmin modeli arka planda kurulur
+        (bkz. load_upcoming); henüz yoksa boş liste döner.
+        """
+        if self.km_forecaster is None:
+            return []
+        vehicles = self.db_manager.get_due_services(santiye_id)
+        # (arac_id, plaka, arac_makine_adi, son_tarih, son_bakim_km, son_sonraki_bakim_km, ...)
+        targets = [parse_display_km(vehicle[5]) for vehicle in vehicles]
+        today = int(date_key_days([int(datetime.now().strftime('%Y%m%d'))])[0])
+        forecasts = self.km_forecaster.forecast([vehicle[1] for vehicle in vehicles], targets, today)
+        rows = []
+        for vehicle, target, (rate, estimated_km, due_day, days_left) in zip(vehicles, targets, forecasts):
+            rows.append((
+                vehicle[1], vehicle[2], vehicle[3], parse_display_km(vehicle[4]), target,
+                round(rate, 1) if rate is not None else None,
+                int(estimated_km) if estimated_km is not None else None,
+                format_day(due_day) if due_day is not None else None,
+                int(days_left) if days_left is not None else None,
+            ))
+        rows.sort(key=lambda row: (row[8] is None, row[8] if row[8] is not None else 0, row[0]))
+        return rows
+    
+    def refresh_upcoming(self, force=False):
+        """Yaklaşan bakımlar tablosunu yeniden doldur (sekme görünmüyorsa açılınca doldurulur)"""
+        if not hasattr(self, 'upcoming_table') or not (force or self.upcoming_panel.isVisible()):
+            return
+        if self.km_forecaster is None:
+            self.load_upcoming()
+            return
+        # Bakım kayıtlarıyla aynı şantiye kapsamı
+        santiye_id = self.current_filters()['santiye_id']
+        rows = self.upcoming_rows(santiye_id)
+        self.upcoming_table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for col, value in enumerate(row):
+                if value is None:
+                    text = "-"
+                elif isinstance(value, (int, float)) and col in (3, 4, 6):
+                    text = format_thousands_dot(int(value))
+                else:
+                    text = str(value)
+                item = QTableWidgetItem(text)
+                if col == 8 and value is not None and value <= DUE_WITHIN_DAYS:
+                    item.setBackground(MaintenanceTableModel.DUE_COLOR)
+                self.upcoming_table.setItem(row_index, col, item)
+        forecast_count = sum(1 for row in rows if row[8] is not None)
+        # Bakımı yaklaşan araç sayısı yalnızca panel açıkken hesaplanır (özet yenilemelerinde değil)
+        due_count = len(self.db_manager.get_due_services(santiye_id, km_threshold=DUE_KM_THRESHOLD,
+                                                         within_days=DUE_WITHIN_DAYS))
+        self.upcoming_info.setText(f"🔧 {len(rows)} araç, {forecast_count} araç için tahmin yapıldı, "
+                                   f"{due_count} aracın bakımı yaklaştı")
+    
     def create_vehicles_panel(self):
         """Araçlar paneli oluştur"""
         panel = QWidget()
@@ -2532,6 +5191,9 @@ class MainWindow(QMainWindow):
         vehicles_layout = QHBoxLayout()
         vehicles_layout.setSpacing(20)
         
+        # Aktif ve arızalı araç tabloları tek modeli durumuna göre süzerek gösterir
+        self.vehicle_model = VehicleTableModel(self)
+        
         # Aktif araçlar bölümü - sol taraf
         active_group = QGroupBox("✅ Aktif Araçlar")
         active_group.setStyleSheet("""
@@ -2555,18 +5217,12 @@ class MainWindow(QMainWindow):
         """)
         active_layout = QVBoxLayout()
         
-        self.active_vehicles_table = QTableWidget(0, 9)
-        self.active_vehicles_table.setHorizontalHeaderLabels([
-            "Sıra", "Araç / Makine Adı", "Plakası", "Makine No", "Markası", "Model", "Model Yılı", "Hesap Adı", "Durum"
-        ])
-        self.active_vehicles_table.setAlternatingRowColors(True)
-        self.active_vehicles_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.active_vehicles_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.active_vehicles_table = VehicleTableView(self.vehicle_model, saglam=True, status_header="Durum")
         self.active_vehicles_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.active_vehicles_table.customContextMenuRequested.connect(self.show_vehicle_context_menu)
-        self.active_vehicles_table.cellDoubleClicked.connect(self.show_vehicle_details)
-        # Otomatik satır numaralarını gizle
-        self.active_vehicles_table.verticalHeader().setVisible(False)
+        self.active_vehicles_table.doubleClicked.connect(self.show_vehicle_details)
+        self.active_vehicles_table.verticalScrollBar().valueChanged.connect(
+            lambda value: self.on_vehicle_scrolled('active', value))
         
         # Esnek sütun genişlikleri
         header = self.active_vehicles_table.horizontalHeader()
@@ -2585,7 +5241,7 @@ class MainWindow(QMainWindow):
         self.active_vehicles_table.setMinimumWidth(600)
         
         self.active_vehicles_table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {SECONDARY_BG};
                 color: {PRIMARY_TEXT};
                 border: 1px solid {BORDER_SUCCESS};
@@ -2596,16 +5252,16 @@ class MainWindow(QMainWindow):
                 font-size: 11px;
                 margin: 1px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 10px 8px;
                 border-bottom: 1px solid {BORDER_PRIMARY};
                 border-right: 1px solid {BORDER_PRIMARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {SUCCESS_ACCENT};
                 color: {PRIMARY_TEXT};
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background-color: {TERTIARY_BG};
             }}
             QHeaderView::section {{
@@ -2645,18 +5301,12 @@ class MainWindow(QMainWindow):
         """)
         faulty_layout = QVBoxLayout()
         
-        self.faulty_vehicles_table = QTableWidget(0, 9)
-        self.faulty_vehicles_table.setHorizontalHeaderLabels([
-            "Sıra", "Araç / Makine Adı", "Plakası", "Makine No", "Markası", "Model", "Model Yılı", "Hesap Adı", "Arıza Durumu"
-        ])
-        self.faulty_vehicles_table.setAlternatingRowColors(True)
-        self.faulty_vehicles_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.faulty_vehicles_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.faulty_vehicles_table = VehicleTableView(self.vehicle_model, saglam=False, status_header="Arıza Durumu")
         self.faulty_vehicles_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.faulty_vehicles_table.customContextMenuRequested.connect(self.show_vehicle_context_menu)
-        self.faulty_vehicles_table.cellDoubleClicked.connect(self.show_vehicle_details)
-        # Otomatik satır numaralarını gizle
-        self.faulty_vehicles_table.verticalHeader().setVisible(False)
+        self.faulty_vehicles_table.doubleClicked.connect(self.show_vehicle_details)
+        self.faulty_vehicles_table.verticalScrollBar().valueChanged.connect(
+            lambda value: self.on_vehicle_scrolled('faulty', value))
         
         # Esnek sütun genişlikleri
         header = self.faulty_vehicles_table.horizontalHeader()
@@ -2675,7 +5325,7 @@ class MainWindow(QMainWindow):
         self.faulty_vehicles_table.setMinimumWidth(600)
         
         self.faulty_vehicles_table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {SECONDARY_BG};
                 color: {PRIMARY_TEXT};
                 border: 1px solid {BORDER_ERROR};
@@ -2686,16 +5336,16 @@ class MainWindow(QMainWindow):
                 font-size: 11px;
                 margin: 1px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 10px 8px;
                 border-bottom: 1px solid {BORDER_PRIMARY};
                 border-right: 1px solid {BORDER_PRIMARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {ERROR_ACCENT};
                 color: {PRIMARY_TEXT};
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background-color: {TERTIARY_BG};
             }}
             QHeaderView::section {{
@@ -2720,79 +5370,183 @@ class MainWindow(QMainWindow):
         panel.setLayout(layout)
         return panel
     
-    def load_data(self):
-        """Verileri yükle"""
-        records = self.db_manager.get_all_records()
-        self.all_records_cache = records
-        self.refresh_filters_data(records)
-        # Açılışta tarih filtresi kapalı, tüm kayıtlar gösterilsin
+    def load_data(self, summary=True):
+        """Verileri yükle (arka planda). summary=False ise yalnızca tablo yenilenir;
+        istatistikler, filtre seçenekleri ve sayaçlar yeniden okunmaz.
+        """
+        if hasattr(self, 'status_msg'):
+            self.status_msg.setText("Yükleniyor...")
+        # Veriler değişmiş olabilir; önceki arama sonucu daraltmada kullanılmasın
+        self.search_pipeline.invalidate()
+        # Filtreler sorguya eklenir; yalnızca eşleşen kayıtlar okunur
+        self.db_worker.request('records', RecordFilter(**self.current_filters()), summary)
+    
+    def on_records_loaded(self, result):
+        """İlk kayıt sayfası, istatistikler ve araç sayısı geldiğinde arayüzü güncelle"""
+        records = result['records']
+        self.populate_table(records, result['next_page'], result['filter'])
+        # Sorgudan sonra değişmiş olabilecek filtreleri uygula
+        self.apply_filters()
+        if hasattr(self, 'status_msg'):
+            self.status_msg.setText("Hazır")
+        if 'statistics' not in result:
+            return
+        self.on_summary_loaded(result)
+        STARTUP_TIMER.mark('veriler hazır')
+    
+    def on_summary_loaded(self, result):
+        """Filtre seçenekleri, istatistikler ve kayıt / araç sayıları geldiğinde güncelle"""
+        self.refresh_filters_data(result['filter_options'])
+        # Seçili değer artık yoksa combo "Tümü"ye döner; tablo da buna göre süzülsün
         self.apply_filters()
-        self.update_statistics()
+        stats = result['statistics']
+        self.update_statistics(stats)
         
-        # Toplam araç sayısını al
-        total_vehicles = len(self.db_manager.get_all_araclar())
+        # Toplam kayıt ve araç sayısı (tablo yalnızca ilk sayfayı içerir)
+        total_records = stats.get('toplam_kayit', 0)
+        total_vehicles = result['total_vehicles']
         
-        self.status_bar.showMessage(f"Toplam {len(records)} kayıt, {total_vehicles} araç yüklendi")
+        self.status_bar.showMessage(f"Toplam {total_records} kayıt, {total_vehicles} araç yüklendi")
         if hasattr(self, 'footer_total'):
-            self.footer_total.setText(f"Toplam kayıt: {len(records)} | Toplam araç: {total_vehicles}")
+            self.footer_total.setText(f"Toplam kayıt: {total_records} | Toplam araç: {total_vehicles}")
+    
+    def on_db_change(self, event):
+        """Veritabanı değişikliğini (ChangeEvent) yalnızca etkilenen satırlara uygula"""
+        if event.table == 'bakimlar':
+            # Kurulmakta olan tahmin modeli bu değişikliği görmemiş olabilir
+            self.forecast_generation += 1
+        handler = getattr(self, f"on_{event.table}_changed", None)
+        if handler:
+            handler(event)
+        # Filtre seçenekleri, istatistikler ve sayaçlar arka planda yeniden okunur
+        self.db_worker.request('summary', self.current_filters()['santiye_id'])
+    
+    def on_bakimlar_changed(self, event):
+        """Eklenen / güncellenen / silinen bakım kayıtlarını tabloya işle"""
+        # Önceki arama sonucu artık güncel değil; daraltmada kullanılmasın
+        self.search_pipeline.invalidate()
+        # Etkilenen satırlar bilinmiyorsa ya da çok fazlaysa tablo yeniden okunur
+        if event.ids is None or len(event.ids) > RECORDS_PAGE_SIZE:
+            # Tahmin modeli de baştan kurulur
+            self.km_forecaster = None
+            self.load_data(summary=False)
+            self.refresh_upcoming()
+            return
+        model = self.table.source_model
+        if event.action == 'delete':
+            model.remove_records(event.ids)
+            self.update_forecaster(event)
+            return
+        records = self.db_manager.get_records(event.ids)
+        if event.action == 'insert':
+            model.insert_records(records)
+        else:
+            for record in records:
+                model.update_record(record)
+        self.update_forecaster(event, records)
+    
+    def update_forecaster(self, event, records=()):
+        """Km tahmin modelini değişen kayıtlarla artımlı güncelle"""
+        forecaster = self.km_forecaster
+        if forecaster is not None:
+            if event.action == 'insert':
+                for record in records:
+                    forecaster.add(record[0], record[2], record[12], record[6])
+            else:
+                # Kaydın eski ve yeni plakası geçmişinden yeniden kurulur
+                plates = forecaster.plates_of(event.ids) | {record[2] for record in records}
+                forecaster.refit(plates, self.db_manager.get_km_history(plates))
+        self.refresh_upcoming()
+    
+    def on_araclar_changed(self, event):
+        """Eklenen / güncellenen / silinen araçları araç tablolarına işle"""
+        # Araç eklenmesi, silinmesi, taşınması ya da plakasının değişmesi şantiyenin kayıtlarını değiştirir;
+        # diğer güncellemeler (durum, arıza vb.) bakım kayıtlarını etkilemez
+        if self.current_filters()['santiye_id'] is not None and event.touches('plaka', 'santiye_id'):
+            self.load_data(summary=False)
+        santiye_id = getattr(self, 'vehicles_santiye_id', None)
+        if event.ids is None or len(event.ids) > VEHICLES_PAGE_SIZE:
+            self.load_vehicles_for_santiye(santiye_id)
+            return
+        if event.action == 'delete':
+            for arac_id in event.ids:
+                self.vehicle_model.remove_vehicle(arac_id)
+            return
+        for arac in self.db_manager.get_araclar(event.ids):
+            # Başka şantiyeye taşınan araç listeden çıkar
+            if santiye_id is not None and arac[8] != santiye_id:
+                self.vehicle_model.remove_vehicle(arac[0])
+            # Durumu değişen araç dataChanged ile aktif / arızalı tablosu arasında taşınır
+            elif not self.vehicle_model.update_vehicle(arac) and event.action == 'insert':
+                self.vehicle_model.append_vehicles([arac])
+    
+    def fetch_records_page(self, after, record_filter=None):
+        """Tablonun sonraki kayıt sayfasını iste (arka planda)"""
+        self.db_worker.request('records_page', after, record_filter)
+    
+    def on_records_page_loaded(self, result):
+        """Kaydırmayla istenen kayıt sayfası geldiğinde tabloya ekle"""
+        model = self.table.source_model
+        # Bu arada tablo yeniden yüklendiyse (yenileme, arama) sayfa geçersizdir
+        if not model.fetching or result['after'] != model.next_page:
+            return
+        self.table.append_records(result['records'], result['next_page'])
 
-    def refresh_filters_data(self, records):
-        """Filtre seçeneklerini kayıtlarla senkronize et"""
+    def refresh_filters_data(self, options):
+        """Filtre seçeneklerini veritabanındaki farklı değerlerle (get_filter_options) senkronize et"""
         try:
-            current_bolge = self.filter_bolge.currentText() if hasattr(self, 'filter_bolge') else None
-            current_bakim_yapan = self.filter_bakim_yapan.currentText() if hasattr(self, 'filter_bakim_yapan') else None
-            if hasattr(self, 'filter_bolge'):
-                bolgeler = sorted({ r[4] for r in records if r[4] not in (None, '') })
-                self.filter_bolge.blockSignals(True)
-                self.filter_bolge.clear()
-                self.filter_bolge.addItem("Tümü")
-                for b in bolgeler:
-                    self.filter_bolge.addItem(b)
-                if current_bolge and current_bolge in ["Tümü"] + bolgeler:
-                    self.filter_bolge.setCurrentText(current_bolge)
-                self.filter_bolge.blockSignals(False)
-            if hasattr(self, 'filter_bakim_yapan'):
-                yapanlar = sorted({ r[10] for r in records if r[10] not in (None, '') })
-                self.filter_bakim_yapan.blockSignals(True)
-                self.filter_bakim_yapan.clear()
-                self.filter_bakim_yapan.addItem("Tümü")
-                for y in yapanlar:
-                    self.filter_bakim_yapan.addItem(y)
-                if current_bakim_yapan and current_bakim_yapan in ["Tümü"] + yapanlar:
-                    self.filter_bakim_yapan.setCurrentText(current_bakim_yapan)
-                self.filter_bakim_yapan.blockSignals(False)
+            for field, combo_name in (('bolge', 'filter_bolge'), ('bakim_yapan', 'filter_bakim_yapan')):
+                combo = getattr(self, combo_name, None)
+                if combo is None:
+                    continue
+                values = options.get(field, [])
+                current = combo.currentText()
+                combo.blockSignals(True)
+                combo.clear()
+                combo.addItem("Tümü")
+                combo.addItems(values)
+                if current and current in ["Tümü"] + values:
+                    combo.setCurrentText(current)
+                combo.blockSignals(False)
         except Exception:
             pass
 
-    def apply_filters(self):
-        """Filtreleri uygulayıp tabloyu güncelle"""
-        records = getattr(self, 'all_records_cache', self.db_manager.get_all_records())
-        # Tarih aralığı filtresi
-        def in_date_range(tarih_str):
-            # Tarih filtresi devre dışı ise her kayıt geçer
-            if not getattr(self, 'filter_use_date', None) or not self.filter_use_date.isChecked():
-                return True
-            if not tarih_str:
-                return True
-            disp, key = normalize_date_display(tarih_str)
-            if key == 99999999:
-                return True
+    def current_filters(self):
+        """Filtre çubuğunun durumunu döndür; devre dışı filtreler None olur"""
+        # Tarih aralığı filtresi (devre dışı ise None)
+        date_range = None
+        if getattr(self, 'filter_use_date', None) and self.filter_use_date.isChecked():
             start_key = int(self.filter_start.date().toString('yyyyMMdd')) if hasattr(self, 'filter_start') else 0
-            end_key = int(self.filter_end.date().toString('yyyyMMdd')) if hasattr(self, 'filter_end') else 99999999
-            return start_key <= key <= end_key
+            end_key = int(self.filter_end.date().toString('yyyyMMdd')) if hasattr(self, 'filter_end') else MISSING_DATE_KEY
+            date_range = (start_key, end_key)
         # Bölge ve bakım yapan
         sel_bolge = self.filter_bolge.currentText() if hasattr(self, 'filter_bolge') else 'Tümü'
         sel_yapan = self.filter_bakim_yapan.currentText() if hasattr(self, 'filter_bakim_yapan') else 'Tümü'
-        filtered = []
-        for r in records:
-            if not in_date_range(r[5]):
-                continue
-            if sel_bolge != 'Tümü' and (r[4] or '') != sel_bolge:
-                continue
-            if sel_yapan != 'Tümü' and (r[10] or '') != sel_yapan:
-                continue
-            filtered.append(r)
-        self.populate_table(filtered)
+        return {
+            'bolge': None if sel_bolge == 'Tümü' else sel_bolge,
+            'bakim_yapan': None if sel_yapan == 'Tümü' else sel_yapan,
+            'date_range': date_range,
+            # Şantiye seçiliyse yalnızca o şantiyenin araçlarının kayıtları
+            'santiye_id': getattr(self, 'records_santiye_id', None)
+        }
+    
+    def apply_filters(self):
+        """Filtreleri uygula: yüklü kayıtlar proxy modelde hemen süzülür; tüm kayıtlar
+        bellekte değilse eşleşen kayıtlar veritabanından (indeksle) yeniden okunur.
+        """
+        if not hasattr(self, 'table'):
+            return
+        filters = self.current_filters()
+        self.table.proxy_model.set_filters(**filters)
+        model = self.table.source_model
+        query_filter = model.query_filter
+        # Arama sonuçları ya da aynı filtreyle okunmuş kayıtlar: bellekte süzmek yeterli
+        if query_filter is None or query_filter == RecordFilter(**filters):
+            return
+        # Filtresiz okunmuş ve tamamı yüklü kayıtlar da bellekte süzülür
+        if query_filter.is_empty and model.next_page is None:
+            return
+        self.load_data(summary=False)
 
     def clear_filters(self):
         if hasattr(self, 'filter_bolge'):
@@ -2815,94 +5569,14 @@ class MainWindow(QMainWindow):
             self.filter_end.setEnabled(enabled)
         self.apply_filters()
     
-    def populate_table(self, records):
+    def populate_table(self, records, next_page=None, query_filter=None):
         """Tabloyu doldur"""
-        # Sıralamayı geçici olarak kapat ve içerikleri temizle
-        sorting_prev = self.table.isSortingEnabled()
-        self.table.setSortingEnabled(False)
-        self.table.clearContents()
-        self.table.setRowCount(len(records))
-        # Map: veritabanı kolon indeksleri -> tablo kolon indeksleri
-        # DB: (0)id,(1)s_no,(2)plaka,(3)kapi_no,(4)bolge,(5)tarih,(6)bakim_km,(7)sonraki_km,(8)yapilan,(9)diger,(10)bakim_yapan,(11)kayit_tarihi
-        # UI: [Sıra], [ID gizli], PLAKA, KAPI NO, BÖLGE, TARİH, BAKIM KM, SONRAKI KM, YAPILAN İŞLEM, DİĞER, BAKIMI YAPAN
-        db_to_ui = {2:2, 3:3, 4:4, 5:5, 6:6, 7:7, 8:8, 9:9, 10:10}
-        for row, record in enumerate(records):
-            # Sıra numarası sütunu
-            sira_item = QTableWidgetItem(str(row + 1))
-            sira_item.setFlags(sira_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 0, sira_item)
-            
-            # Gizli ID sütununu doldur (seçim ve işlemler için gerekli)
-            id_item = QTableWidgetItem(str(record[0]))
-            id_item.setData(Qt.ItemDataRole.UserRole, record[0])
-            # ID hücresi düzenlenebilir olmasın
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 1, id_item)
-            for db_index, ui_col in db_to_ui.items():
-                value = record[db_index]
-                # KM kolonları: 6 ve 7 (UI)
-                if ui_col in (6, 7):
-                    numeric = None
-                    if isinstance(value, (int, float)):
-                        numeric = int(value)
-                    else:
-                        try:
-                            numeric = int(str(value).replace(" ", "").replace(".", "").replace(",", "")) if value not in (None, "", "-") else None
-                        except Exception:
-                            numeric = None
-                    # Boş, 0 veya negatif ise '-' göster; sıralama değeri 0
-                    if numeric is None or numeric <= 0:
-                        display_value = "-"
-                        sort_role_value = 0
-                    else:
-                        display_value = format_thousands_dot(numeric)
-                        sort_role_value = numeric
-                    # Sıralama için sayısal rol ata
-                else:
-                    display_value = str(value) if value not in (None, "") else "-"
-                    sort_role_value = display_value
-                    # Tarih kolonunda (UI 4) doğru sıralama için yyyymmdd anahtarı ata
-                    if ui_col == 4:
-                        disp, key = normalize_date_display(value)
-                        display_value = disp
-                        sort_role_value = key
-                item = QTableWidgetItem()
-                # Görüntüyü açıkça string olarak ayarla (dd.MM.yyyy ve noktalı binlik)
-                item.setText(display_value)
-                item.setData(Qt.ItemDataRole.DisplayRole, display_value)
-                item.setData(Qt.ItemDataRole.UserRole, record[0])
-                # EditRole'ü görüntü metniyle aynı tutarak ham sayıların görünmesini engelle
-                item.setData(Qt.ItemDataRole.EditRole, display_value)
-                # Görüntüleme tutarlılığı için hücreleri düzenlenemez yap
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                # Sütun hizalamaları
-                if ui_col in (2, 3, 4, 5):
-                    item.setTextAlignment(int(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter))
-                elif ui_col in (6, 7):
-                    item.setTextAlignment(int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter))
-                else:
-                    item.setTextAlignment(int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter))
-                # Uzun metinler için tooltip
-                if ui_col in (8, 9) and display_value not in (None, "-"):
-                    item.setToolTip(str(display_value))
-                # Sonraki bakım KM yaklaşınca satır renklendir (ör. fark <= 1000 km)
-                if ui_col == 7:
-                    try:
-                        current_km = int(str(self.table.item(row, 6).text()).replace('.', '')) if self.table.item(row, 6) else None
-                        next_km = int(str(item.text()).replace('.', '')) if item.text() not in ('-', '') else None
-                        if current_km and next_km and next_km - current_km <= 1000:
-                            for c in range(self.table.columnCount()):
-                                if self.table.item(row, c):
-                                    self.table.item(row, c).setBackground(QColor('#fff3cd'))  # soft yellow
-                    except Exception:
-                        pass
-                self.table.setItem(row, ui_col, item)
-        # Önceki sıralama durumunu geri yükle
-        self.table.setSortingEnabled(sorting_prev)
-    
-    def update_statistics(self):
+        self.table.set_records(records, next_page, query_filter)
+    
+    def update_statistics(self, stats=None):
         """İstatistikleri güncelle"""
-        stats = self.db_manager.get_statistics()
+        if stats is None:
+            stats = self.db_manager.get_statistics(self.current_filters()['santiye_id'])
         
         stats_text = f"""
         📊 Toplam Kayıt: {stats.get('toplam_kayit', 0)}
@@ -2919,16 +5593,25 @@ class MainWindow(QMainWindow):
             self.stats_label.setText(stats_text)
     
     def search_records(self, text=None):
-        """Kayıt ara"""
-        search_text = (text if isinstance(text, str) else self.search_edit.text()).strip()
-        
-        if not search_text:
-            self.load_data()
-            return
-        
-        records = self.db_manager.search_records(search_text)
+        """Kayıt ara (beklemeden)"""
+        self.search_pipeline.set_text(text if isinstance(text, str) else self.search_edit.text())
+        self.search_pipeline.run()
+    
+    def on_search_loaded(self, result):
+        """Arka planda çalışan arama sonucu (SearchPipeline eski sonuçları ayıklar)"""
+        self.search_pipeline.handle_result(result)
+    
+    def on_search_cleared(self):
+        """Arama kutusu boşaltıldı: yalnızca tablo yeniden yüklenir"""
+        self.load_data(summary=False)
+    
+    def on_search_results(self, search_text, records):
+        """Arama sonucunu tabloya tek seferde yaz"""
         self.populate_table(records)
-        self.status_bar.showMessage(f"'{search_text}' için {len(records)} kayıt bulundu")
+        if len(records) >= SEARCH_RESULT_LIMIT:
+            self.status_bar.showMessage(f"'{search_text}' için en alakalı {len(records)} kayıt gösteriliyor")
+        else:
+            self.status_bar.showMessage(f"'{search_text}' için {len(records)} kayıt bulundu")
     
     def add_record(self):
         """Yeni kayıt ekle"""
@@ -2942,42 +5625,24 @@ class MainWindow(QMainWindow):
             
             # s_no None ise otomatik sırayı ata (mevcut max + 1)
             if data[0] is None:
-                try:
-                    cursor = self.db_manager.conn.cursor()
-                    cursor.execute("SELECT COALESCE(MAX(s_no), 0) + 1 FROM bakimlar")
-                    next_no = cursor.fetchone()[0]
-                    data = (next_no,) + data[1:]
-                except Exception:
-                    data = (None,) + data[1:]
+                data = (self.db_manager.next_s_no(),) + data[1:]
 
             record_id = self.db_manager.add_record(data)
             if record_id:
                 self.show_information("Başarılı", "Kayıt başarıyla eklendi!")
-                self.load_data()
             else:
                 self.show_critical("Hata", "Kayıt eklenirken hata oluştu!")
     
     def edit_record(self):
         """Kayıt düzenle"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        # Seçili kaydın ID'sini al
+        record_id = self.table.current_record_id()
+        if record_id is None:
             self.show_warning("Uyarı", "Lütfen düzenlenecek kaydı seçin!")
             return
         
-        # Seçili kaydın ID'sini al (ID sütunu index 1'de)
-        item = self.table.item(current_row, 1)
-        if not item:
-            return
-        
-        record_id = item.data(Qt.ItemDataRole.UserRole)
-        
         # Kaydı veritabanından getir
-        records = self.db_manager.get_all_records()
-        record_data = None
-        for record in records:
-            if record[0] == record_id:
-                record_data = record
-                break
+        record_data = self.db_manager.get_record(record_id)
         
         if not record_data:
             self.show_critical("Hata", "Kayıt bulunamadı!")
@@ -2993,31 +5658,23 @@ class MainWindow(QMainWindow):
             
             if self.db_manager.update_record(record_id, data):
                 self.show_information("Başarılı", "Kayıt başarıyla güncellendi!")
-                self.load_data()
             else:
                 self.show_critical("Hata", "Kayıt güncellenirken hata oluştu!")
     
     def delete_record(self):
         """Kayıt sil"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        # Seçili kaydın ID'sini al
+        record_id = self.table.current_record_id()
+        if record_id is None:
             self.show_warning("Uyarı", "Lütfen silinecek kaydı seçin!")
             return
         
-        # Seçili kaydın ID'sini al (ID sütunu index 1'de)
-        item = self.table.item(current_row, 1)
-        if not item:
-            return
-        
-        record_id = item.data(Qt.ItemDataRole.UserRole)
-        
         # Onay al
         reply = self.show_question("Onay", "Bu kaydı silmek istediğinizden emin misiniz?")
         
         if reply == QMessageBox.StandardButton.Yes:
             if self.db_manager.delete_record(record_id):
                 self.show_information("Başarılı", "Kayıt başarıyla silindi!")
-                self.load_data()
             else:
                 self.show_critical("Hata", "Kayıt silinirken hata oluştu!")
     
@@ -3029,10 +5686,26 @@ class MainWindow(QMainWindow):
         
         if self.db_manager.delete_all():
             self.show_information("Başarılı", "Tüm kayıtlar silindi!")
-            self.load_data()
         else:
             self.show_critical("Hata", "Toplu silme sırasında hata oluştu!")
     
+    def create_import_progress(self, title, total_rows):
+        """Parça parça içe aktarım için iptal edilebilir ilerleme penceresi"""
+        progress = QProgressDialog(f"{title}...", "İptal", 0, total_rows or 0, self)
+        progress.setWindowTitle("Excel İçe Aktarım")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        return progress
+    
+    def update_import_progress(self, progress, total_rows, read_count, success_count):
+        """İlerlemeyi güncelle; kullanıcı iptal ettiyse True döndür"""
+        if total_rows:
+            progress.setValue(min(read_count, total_rows))
+        progress.setLabelText(f"{read_count} satır okundu, {success_count} kayıt aktarıldı")
+        QApplication.processEvents()
+        return progress.wasCanceled()
+    
     def import_excel(self):
         """Excel dosyasından veri aktar"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -3043,69 +5716,41 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            # Excel dosyasını oku (engine otomatik)
-            try:
-                df = pd.read_excel(file_path, engine='openpyxl')
-            except Exception:
-                # openpyxl başarısız olursa varsayılan engine ile dene
-                df = pd.read_excel(file_path)
-            # Sütunları normalize et ve olabildiğince eşleştir
-            df = normalize_columns(df)
-            
-            # Zorunlu sütunlar (minimum)
-            required_min = ['PLAKA']
-            missing_min = [col for col in required_min if col not in df.columns]
-            if missing_min:
-                QMessageBox.critical(
-                    self, "Hata",
-                    "Excel dosyasında zorunlu sütun bulunamadı: PLAKA\n"
-                    "Lütfen dosya başlıklarını kontrol edin."
-                )
-                return
-            
-            # Opsiyonel sütunlar için yoksa oluştur
-            optional_cols = ['S.NO','KAPI NUMARASI','BÖLGE','TARİH','BAKIM ESNASINDA KM','BİR SONRAKİ BAKIM KM',
-                             'YAPILAN İŞLEM','DİĞER','BAKIMI YAPAN']
-            for col in optional_cols:
-                if col not in df.columns:
-                    df[col] = None
-            
-            # Verileri aktar
-            success_count = 0
-            for index, row in df.iterrows():
-                if pd.isna(row['PLAKA']):
-                    continue
-                
-                # Tarih formatını kesin olarak dd.MM.yyyy'ye çevir
-                tarih_raw = row['TARİH'] if 'TARİH' in df.columns else None
-                tarih = ensure_ddmmyyyy(tarih_raw)
-                
-                # KM değerlerini temizle (dayanıklı parser)
-                bakim_km = parse_km(row['BAKIM ESNASINDA KM']) if 'BAKIM ESNASINDA KM' in df.columns else None
-                sonraki_bakim_km = parse_km(row['BİR SONRAKİ BAKIM KM']) if 'BİR SONRAKİ BAKIM KM' in df.columns else None
-                
-                # Veritabanına ekle
-                data = (
-                    None,  # S.NO
-                    str(row['PLAKA']),
-                    str(row['KAPI NUMARASI']) if 'KAPI NUMARASI' in df.columns and pd.notna(row['KAPI NUMARASI']) else None,
-                    str(row['BÖLGE']) if 'BÖLGE' in df.columns and pd.notna(row['BÖLGE']) else None,
-                    tarih,
-                    bakim_km,
-                    sonraki_bakim_km,
-                    str(row['YAPILAN İŞLEM']) if 'YAPILAN İŞLEM' in df.columns and pd.notna(row['YAPILAN İŞLEM']) else None,
-                    str(row['DİĞER']) if 'DİĞER' in df.columns and pd.notna(row['DİĞER']) else None,
-                    str(row['BAKIMI YAPAN']) if 'BAKIMI YAPAN' in df.columns and pd.notna(row['BAKIMI YAPAN']) else None
-                )
+            # Dosyayı parça parça oku; başlıklar normalize edilir.
+            # Değişiklik bildirimleri aktarım sonunda tek olay olarak yayınlanır
+            with self.db_manager.batch(), ExcelChunkReader(file_path, normalize_columns) as reader:
+                # Zorunlu sütunlar (minimum)
+                if 'PLAKA' not in reader.columns:
+                    QMessageBox.critical(
+                        self, "Hata",
+                        "Excel dosyasında zorunlu sütun bulunamadı: PLAKA\n"
+                        "Lütfen dosya başlıklarını kontrol edin."
+                    )
+                    return
                 
-                if self.db_manager.add_record(data):
-                    success_count += 1
+                # Her parçayı sütun bazlı temizle ve tek transaction ile aktar
+                progress = self.create_import_progress("Bakım kayıtları aktarılıyor", reader.total_rows)
+                started = time.perf_counter()
+                read_count = 0
+                success_count = 0
+                cancelled = False
+                for chunk in reader:
+                    success_count += self.db_manager.add_records_bulk(prepare_maintenance_rows(chunk))
+                    read_count += len(chunk)
+                    cancelled = self.update_import_progress(progress, reader.total_rows, read_count, success_count)
+                    if cancelled:
+                        break
+                progress.close()
+                elapsed = time.perf_counter() - started
             
+            rate = success_count / elapsed if elapsed > 0 else 0
+            message = f"{success_count} kayıt başarıyla aktarıldı!\n"
+            if cancelled:
+                message = f"Aktarım iptal edildi. İptalden önce {success_count} kayıt aktarıldı.\n"
             QMessageBox.information(
                 self, "Başarılı", 
-                f"{success_count} kayıt başarıyla aktarıldı!"
+                message + f"Süre: {elapsed:.2f} sn ({format_thousands_dot(int(rate))} satır/sn)"
             )
-            self.load_data()
             
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Excel aktarım hatası: {str(e)}\n\n"
@@ -3120,78 +5765,34 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        if self.km_forecaster is None:
+            # Tahmin sayfası için model arka planda kurulur; dosya model gelince yazılır
+            self.pending_export_path = file_path
+            self.status_bar.showMessage("Km geçmişi yükleniyor, dışa aktarım hazırlanıyor...")
+            self.request_forecast()
+            return
+        self.write_excel_export(file_path)
+    
+    def write_excel_export(self, file_path):
+        """Filtrelenmiş kayıtları ve aynı şantiyenin yaklaşan bakımlarını Excel'e yaz"""
         try:
-            # Mevcut filtrelenmiş kayıtları al
-            records = getattr(self, 'all_records_cache', self.db_manager.get_all_records())
-            if hasattr(self, 'apply_filters'):
-                # Filtreleri uygula ve sonucu al
-                filtered_records = []
-                for r in records:
-                    # Tarih filtresi kontrolü
-                    if hasattr(self, 'filter_use_date') and self.filter_use_date.isChecked():
-                        if not r[5]:  # tarih yoksa geç
-                            continue
-                        disp, key = normalize_date_display(r[5])
-                        if key == 99999999:
-                            continue
-                        start_key = int(self.filter_start.date().toString('yyyyMMdd'))
-                        end_key = int(self.filter_end.date().toString('yyyyMMdd'))
-                        if not (start_key <= key <= end_key):
-                            continue
-                    
-                    # Bölge filtresi
-                    sel_bolge = self.filter_bolge.currentText() if hasattr(self, 'filter_bolge') else 'Tümü'
-                    if sel_bolge != 'Tümü' and (r[4] or '') != sel_bolge:
-                        continue
-                    
-                    # Bakım yapan filtresi
-                    sel_yapan = self.filter_bakim_yapan.currentText() if hasattr(self, 'filter_bakim_yapan') else 'Tümü'
-                    if sel_yapan != 'Tümü' and (r[10] or '') != sel_yapan:
-                        continue
-                    
-                    filtered_records.append(r)
-                records = filtered_records
-            
-            # DataFrame oluştur
-            df_data = []
-            for i, record in enumerate(records, 1):
-                # DB: (0)id,(1)s_no,(2)plaka,(3)kapi_no,(4)bolge,(5)tarih,(6)bakim_km,(7)sonraki_km,(8)yapilan,(9)diger,(10)bakim_yapan,(11)kayit_tarihi
-                df_data.append({
-                    'S.NO': i,  # Otomatik sıra numarası
-                    'PLAKA': record[2] or '',
-                    'KAPI NUMARASI': record[3] or '',
-                    'BÖLGE': record[4] or '',
-                    'TARİH': record[5] or '',
-                    'BAKIM ESNASINDA KM': record[6] or '',
-                    'BİR SONRAKİ BAKIM KM': record[7] or '',
-                    'YAPILAN İŞLEM': record[8] or '',
-                    'DİĞER': record[9] or '',
-                    'BAKIMI YAPAN': record[10] or ''
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # Excel'e yaz
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Bakım Kayıtları', index=False)
-                
-                # Sütun genişliklerini ayarla
-                worksheet = writer.sheets['Bakım Kayıtları']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            filters = self.current_filters()
+            # Filtrelenmiş kayıtlar doğrudan veritabanı cursor'ından akıtılır
+            records = self.db_manager.iter_records(**filters)
+            # DB: (0)id,(1)s_no,(2)plaka,(3)kapi_no,(4)bolge,(5)tarih,(6)bakim_km,(7)sonraki_km,(8)yapilan,(9)diger,(10)bakim_yapan,(11)kayit_tarihi
+            rows = (
+                (i, *(value or None for value in r[2:11]))  # S.NO: otomatik sıra numarası
+                for i, r in enumerate(records, 1)
+            )
+            headers = ['S.NO', 'PLAKA', 'KAPI NUMARASI', 'BÖLGE', 'TARİH', 'BAKIM ESNASINDA KM',
+                       'BİR SONRAKİ BAKIM KM', 'YAPILAN İŞLEM', 'DİĞER', 'BAKIMI YAPAN']
+            # Tahmini bakım tarihleri ayrı sayfaya yazılır
+            upcoming = ('Yaklaşan Bakımlar', self.UPCOMING_HEADERS, self.upcoming_rows(filters['santiye_id']))
+            count = export_rows_to_excel(file_path, 'Bakım Kayıtları', headers, rows, extra_sheets=[upcoming])
             
             QMessageBox.information(
                 self, "Başarılı", 
-                f"{len(records)} kayıt başarıyla Excel dosyasına aktarıldı!\n\nDosya: {file_path}"
+                f"{count} kayıt başarıyla Excel dosyasına aktarıldı!\n\nDosya: {file_path}"
             )
             
         except Exception as e:
@@ -3229,25 +5830,19 @@ class MainWindow(QMainWindow):
         """)
     
     def check_updates_on_startup(self):
-        """Açılışta güncelleme kontrolü"""
+        """Açılışta güncelleme kontrolü (arka planda; kontrol aralığı dolmadıysa ağa çıkılmaz)"""
         try:
-            # Arka planda güncelleme kontrolü
-            import threading
-            thread = threading.Thread(target=self._check_updates_background)
-            thread.daemon = True
-            thread.start()
+            self.update_checker.check()
         except Exception as e:
             print(f"Güncelleme kontrolü başlatılamadı: {e}")
     
-    def _check_updates_background(self):
-        """Arka planda güncelleme kontrolü"""
-        try:
-            has_update, version, description, url = self.update_manager.check_for_updates()
-            if has_update:
-                # UI thread'de dialog göster
-                QTimer.singleShot(1000, lambda: self.show_update_dialog(version, description, url))
-        except Exception as e:
-            print(f"Güncelleme kontrolü hatası: {e}")
+    def on_update_checked(self, result, manual):
+        """Güncelleme kontrolünün sonucu geldiğinde (arayüz thread'inde) kullanıcıya bildir"""
+        has_update, version, description, url = result
+        if has_update:
+            self.show_update_dialog(version, description, url)
+        elif manual:
+            QMessageBox.information(self, "Güncelleme", "Güncel sürümü kullanıyorsunuz!")
     
     def show_update_dialog(self, version, description, url):
         """Güncelleme dialog'unu göster"""
@@ -3259,127 +5854,152 @@ class MainWindow(QMainWindow):
             print(f"Güncelleme dialog hatası: {e}")
     
     def perform_update(self, download_url):
-        """Güncellemeyi gerçekleştir"""
+        """Güncellemeyi arka planda indir; SHA-256 doğrulandıktan sonra kur"""
         try:
-            # İndirme progress dialog'u
-            progress = QMessageBox(self)
+            if self.update_thread is not None:
+                # Süren indirme var
+                return
+            progress = QProgressDialog("Güncelleme indiriliyor...", "İptal", 0, 0, self)
             progress.setWindowTitle("Güncelleme")
-            progress.setText("Güncelleme indiriliyor...")
-            progress.setStandardButtons(QMessageBox.StandardButton.NoButton)
-            progress.show()
-            QApplication.processEvents()
-            
-            # Güncellemeyi indir
-            success, exe_path = self.update_manager.download_update(download_url)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(0)
+            progress.setAutoClose(False)
+            progress.setAutoReset(False)
+            progress.setValue(0)
+            self.update_progress = progress
+            self.update_download_url = download_url
             
-            if success:
-                progress.setText("Güncelleme kuruluyor...")
-                QApplication.processEvents()
-                
-                # Güncellemeyi kur
-                if self.update_manager.install_update(exe_path):
-                    progress.close()
-                    QMessageBox.information(
-                        self, "Güncelleme Tamamlandı", 
-                        "Güncelleme başarıyla tamamlandı!\nProgram yeniden başlatılacak."
+            self.update_thread = QThread(self)
+            self.update_worker = UpdateDownloadWorker(self.update_manager)
+            self.update_worker.moveToThread(self.update_thread)
+            self.update_thread.started.connect(self.update_worker.run)
+            self.update_worker.progress.connect(self.on_update_progress)
+            self.update_worker.finished.connect(self.on_update_downloaded)
+            # Thread bitince işçi ve thread silinir; her indirme denemesi yenilerini kurar
+            self.update_thread.finished.connect(self.update_worker.deleteLater)
+            self.update_thread.finished.connect(self.update_thread.deleteLater)
+            # İptal edilen indirme .part dosyasında kalır; sonraki denemede devam eder
+            progress.canceled.connect(self.cancel_update)
+            self.update_thread.start()
+        except Exception as e:
+            print(f"Güncelleme hatası: {e}")
+            QMessageBox.critical(self, "Hata", f"Güncelleme sırasında hata: {str(e)}")
+    
+    def cancel_update(self):
+        """Süren indirmeyi durdur (işçi thread'i meşgul olduğundan doğrudan çağrılır)"""
+        if self.update_worker is not None:
+            self.update_worker.cancel()
+    
+    def on_update_progress(self, done, total):
+        """İndirme ilerlemesini göster (toplam bilinmiyorsa belirsiz çubuk)"""
+        progress = self.update_progress
+        if total:
+            progress.setMaximum(100)
+            progress.setValue(min(100, done * 100 // total))
+            progress.setLabelText(f"Güncelleme indiriliyor... {done / 1048576:.1f} / {total / 1048576:.1f} MB")
+        else:
+            progress.setLabelText(f"Güncelleme indiriliyor... {done / 1048576:.1f} MB")
+    
+    def on_update_downloaded(self, success, result):
+        """İndirme bittiğinde (doğrulanmış dosyayla) güncellemeyi kur"""
+        self.update_thread.quit()
+        self.update_thread.wait()
+        sha256 = (self.update_worker.asset or {}).get('sha256')
+        progress, download_url = self.update_progress, self.update_download_url
+        self.update_thread = self.update_worker = self.update_progress = None
+        was_canceled = progress.wasCanceled()
+        progress.close()
+        progress.deleteLater()
+        try:
+            if not success:
+                if not was_canceled:
+                    QMessageBox.warning(
+                        self, "İndirme Hatası",
+                        f"Güncelleme indirilemedi!\n{result}\n\nSürümü buradan indirebilirsiniz:\n{download_url}"
                     )
-                    # Programı yeniden başlat
-                    QApplication.quit()
-                else:
-                    progress.close()
-                    QMessageBox.warning(self, "Güncelleme Hatası", "Güncelleme kurulamadı!")
+                return
+            
+            # Güncellemeyi kur
+            if self.update_manager.install_update(result, sha256):
+                QMessageBox.information(
+                    self, "Güncelleme Tamamlandı", 
+                    "Güncelleme başarıyla tamamlandı!\nProgram yeniden başlatılacak."
+                )
+                # Programı yeniden başlat
+                QApplication.quit()
             else:
-                progress.close()
-                QMessageBox.warning(self, "İndirme Hatası", "Güncelleme indirilemedi!")
-                
+                QMessageBox.warning(self, "Güncelleme Hatası", "Güncelleme kurulamadı!")
         except Exception as e:
             print(f"Güncelleme hatası: {e}")
             QMessageBox.critical(self, "Hata", f"Güncelleme sırasında hata: {str(e)}")
     
     def manual_check_updates(self):
-        """Manuel güncelleme kontrolü"""
+        """Manuel güncelleme kontrolü (kontrol aralığı beklenmez; ETag ile koşullu istek)"""
         try:
-            has_update, version, description, url = self.update_manager.check_for_updates()
-            if has_update:
-                self.show_update_dialog(version, description, url)
-            else:
-                QMessageBox.information(self, "Güncelleme", "Güncel sürümü kullanıyorsunuz!")
+            self.status_bar.showMessage("Güncelleme kontrol ediliyor...", 3000)
+            self.update_checker.check(force=True, manual=True)
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Güncelleme kontrolü hatası: {str(e)}")
     
     def load_vehicles_for_santiye(self, santiye_id=None):
-        """Tüm araçları yükle"""
+        """Araçları yükle (arka planda)"""
+        self.db_worker.request('vehicles', santiye_id)
+    
+    def on_vehicles_loaded(self, result):
+        """Araç listelerinin ilk sayfaları geldiğinde tabloları doldur"""
         try:
-            if santiye_id:
-                araclar = self.db_manager.get_araclar_by_santiye(santiye_id)
-            else:
-                araclar = self.db_manager.get_all_araclar()
-            
-            # Aktif araçları filtrele (durum = 'Sağlam')
-            active_vehicles = [arac for arac in araclar if arac[9] == 'Sağlam']
-            # Arızalı araçları filtrele (durum != 'Sağlam')
-            faulty_vehicles = [arac for arac in araclar if arac[9] != 'Sağlam']
-            
-            # Aktif araçlar tablosunu doldur
-            self.active_vehicles_table.setRowCount(len(active_vehicles))
-            for row, arac in enumerate(active_vehicles):
-                # arac: (id, arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum, ariza_durumu, olusturma_tarihi)
-                self.active_vehicles_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))  # Sıra
-                self.active_vehicles_table.setItem(row, 1, QTableWidgetItem(arac[1] or '-'))  # Araç / Makine Adı
-                self.active_vehicles_table.setItem(row, 2, QTableWidgetItem(arac[2] or '-'))  # Plakası
-                self.active_vehicles_table.setItem(row, 3, QTableWidgetItem(arac[3] or '-'))  # Makine No
-                self.active_vehicles_table.setItem(row, 4, QTableWidgetItem(arac[4] or '-'))  # Markası
-                self.active_vehicles_table.setItem(row, 5, QTableWidgetItem(arac[5] or '-'))  # Model
-                self.active_vehicles_table.setItem(row, 6, QTableWidgetItem(str(arac[6]) if arac[6] else '-'))  # Model Yılı
-                self.active_vehicles_table.setItem(row, 7, QTableWidgetItem(arac[7] or '-'))  # Hesap Adı
-                self.active_vehicles_table.setItem(row, 8, QTableWidgetItem(arac[9] or '-'))  # Durum
-                
-                # Araç ID'sini sakla ve sütunları düzenlenemez yap
-                for col in range(9):
-                    item = self.active_vehicles_table.item(row, col)
-                    if item:
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        # Sadece ilk sütuna ID kaydet
-                        if col == 0:
-                            item.setData(Qt.ItemDataRole.UserRole, arac[0])
-                        
-                        # Sütun hizalaması
-                        if col in (0, 2, 3, 6):  # Sıra, Plaka, Makine No, Model Yılı - orta
-                            item.setTextAlignment(int(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter))
-                        elif col in (1, 4, 5, 7, 8):  # Araç Adı, Marka, Model, Hesap Adı, Durum - sol
-                            item.setTextAlignment(int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter))
-            
-            # Arızalı araçlar tablosunu doldur
-            self.faulty_vehicles_table.setRowCount(len(faulty_vehicles))
-            for row, arac in enumerate(faulty_vehicles):
-                self.faulty_vehicles_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))  # Sıra
-                self.faulty_vehicles_table.setItem(row, 1, QTableWidgetItem(arac[1] or '-'))  # Araç / Makine Adı
-                self.faulty_vehicles_table.setItem(row, 2, QTableWidgetItem(arac[2] or '-'))  # Plakası
-                self.faulty_vehicles_table.setItem(row, 3, QTableWidgetItem(arac[3] or '-'))  # Makine No
-                self.faulty_vehicles_table.setItem(row, 4, QTableWidgetItem(arac[4] or '-'))  # Markası
-                self.faulty_vehicles_table.setItem(row, 5, QTableWidgetItem(arac[5] or '-'))  # Model
-                self.faulty_vehicles_table.setItem(row, 6, QTableWidgetItem(str(arac[6]) if arac[6] else '-'))  # Model Yılı
-                self.faulty_vehicles_table.setItem(row, 7, QTableWidgetItem(arac[7] or '-'))  # Hesap Adı
-                self.faulty_vehicles_table.setItem(row, 8, QTableWidgetItem(arac[9] or '-'))  # Durum
-                
-                # Araç ID'sini sakla ve sütunları düzenlenemez yap
-                for col in range(9):
-                    item = self.faulty_vehicles_table.item(row, col)
-                    if item:
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        # Sadece ilk sütuna ID kaydet
-                        if col == 0:
-                            item.setData(Qt.ItemDataRole.UserRole, arac[0])
-                        
-                        # Sütun hizalaması
-                        if col in (0, 2, 3, 6):  # Sıra, Plaka, Makine No, Model Yılı - orta
-                            item.setTextAlignment(int(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter))
-                        elif col in (1, 4, 5, 7, 8):  # Araç Adı, Marka, Model, Hesap Adı, Durum - sol
-                            item.setTextAlignment(int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter))
-                        
+            self.vehicles_santiye_id = result['santiye_id']
+            self.vehicle_next_pages = {}
+            self.vehicle_fetching = set()
+            # Aktif araçlar (durum = 'Sağlam') ve arızalı araçlar (durum != 'Sağlam') ayrı sayfalanır,
+            # ikisi de ortak modele eklenir; tablolar modeli duruma göre süzer
+            self.vehicle_model.set_vehicles(result['active'][0] + result['faulty'][0])
+            for stream in self.vehicle_tables():
+                self.vehicle_next_pages[stream] = result[stream][1]
+                QTimer.singleShot(0, lambda stream=stream: self.fill_vehicle_table(stream))
         except Exception as e:
             print(f"Araç yükleme hatası: {e}")
     
+    def vehicle_tables(self):
+        """Sayfa akışı adı -> araç tablosu"""
+        return {'active': self.active_vehicles_table, 'faulty': self.faulty_vehicles_table}
+    
+    def fetch_more_vehicles(self, stream):
+        """Araç tablosunun sonraki sayfasını iste (arka planda)"""
+        next_page = getattr(self, 'vehicle_next_pages', {}).get(stream)
+        if next_page is None or stream in self.vehicle_fetching:
+            return
+        self.vehicle_fetching.add(stream)
+        self.db_worker.request(f'{stream}_vehicles_page', self.vehicles_santiye_id, next_page)
+    
+    def on_vehicle_scrolled(self, stream, value):
+        """Araç tablosu en alta kaydırıldığında sonraki sayfayı iste"""
+        if value >= self.vehicle_tables()[stream].verticalScrollBar().maximum():
+            self.fetch_more_vehicles(stream)
+    
+    def fill_vehicle_table(self, stream):
+        """Tablo kaydırma çubuğu çıkacak kadar dolmadıysa sonraki sayfayı iste"""
+        table = self.vehicle_tables()[stream]
+        if table.isVisible() and table.verticalScrollBar().maximum() == 0:
+            self.fetch_more_vehicles(stream)
+    
+    def on_vehicles_page_loaded(self, stream, result):
+        """Kaydırmayla istenen araç sayfası geldiğinde tabloya ekle"""
+        # Bu arada liste yeniden yüklendiyse sayfa geçersizdir
+        if stream not in self.vehicle_fetching or result['after'] != self.vehicle_next_pages.get(stream):
+            return
+        self.vehicle_fetching.discard(stream)
+        araclar, next_page = result['page']
+        self.vehicle_model.append_vehicles(araclar)
+        self.vehicle_next_pages[stream] = next_page
+        QTimer.singleShot(0, lambda: self.fill_vehicle_table(stream))
+    
+    def on_active_vehicles_page_loaded(self, result):
+        self.on_vehicles_page_loaded('active', result)
+    
+    def on_faulty_vehicles_page_loaded(self, result):
+        self.on_vehicles_page_loaded('faulty', result)
+    
     
     def add_vehicle(self):
         """Yeni araç ekle"""
@@ -3397,35 +6017,22 @@ class MainWindow(QMainWindow):
             
             if arac_id:
                 QMessageBox.information(self, "Başarılı", "Araç başarıyla eklendi!")
-                self.load_vehicles_for_santiye()
             else:
                 QMessageBox.critical(self, "Hata", "Araç eklenirken hata oluştu!")
     
-    def show_vehicle_details(self, row, col):
+    def show_vehicle_details(self, index):
         """Araç detaylarını göster"""
         # Hangi tablodan geldiğini sender() ile tespit et
-        sender = self.sender()
-        if sender == self.active_vehicles_table:
-            table = self.active_vehicles_table
-        elif sender == self.faulty_vehicles_table:
-            table = self.faulty_vehicles_table
-        else:
+        table = self.sender()
+        if table not in self.vehicle_tables().values():
             return
         
-        # ID'yi herhangi bir sütundan al (tüm sütunlarda ID saklanıyor)
-        item = table.item(row, 0)  # İlk sütundan al
-        if not item:
+        arac_id = table.arac_id_at(index.row())
+        if arac_id is None:
             return
         
-        arac_id = item.data(Qt.ItemDataRole.UserRole)
-        
         # Araç bilgilerini al
-        araclar = self.db_manager.get_all_araclar()
-        arac_data = None
-        for arac in araclar:
-            if arac[0] == arac_id:
-                arac_data = arac
-                break
+        arac_data = self.db_manager.get_arac(arac_id)
         
         if not arac_data:
             return
@@ -3437,20 +6044,16 @@ class MainWindow(QMainWindow):
     def show_vehicle_context_menu(self, position):
         """Araç tablosu için sağ tık menüsü"""
         # Hangi tablodan geldiğini kontrol et
-        sender = self.sender()
-        if sender == self.active_vehicles_table:
-            table = self.active_vehicles_table
-        elif sender == self.faulty_vehicles_table:
-            table = self.faulty_vehicles_table
-        else:
+        table = self.sender()
+        if table not in self.vehicle_tables().values():
             return
         
         # Seçili satırı kontrol et
-        item = table.itemAt(position)
-        if not item:
+        index = table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         
         # Menü oluştur
         menu = QMenu(self)
@@ -3477,43 +6080,28 @@ class MainWindow(QMainWindow):
     
     def edit_vehicle(self, table, row):
         """Araç düzenle"""
-        item = table.item(row, 0)
-        if not item:
+        arac_id = table.arac_id_at(row)
+        if arac_id is None:
             return
         
-        arac_id = item.data(Qt.ItemDataRole.UserRole)
-        
         # Araç bilgilerini al
-        araclar = self.db_manager.get_all_araclar()
-        arac_data = None
-        for arac in araclar:
-            if arac[0] == arac_id:
-                arac_data = arac
-                break
+        arac_data = self.db_manager.get_arac(arac_id)
         
         if not arac_data:
             return
         
         # Araç düzenleme dialog'unu göster
         dialog = VehicleDialog(self, arac_data)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_vehicles_for_santiye()
+        dialog.exec()
     
     def delete_vehicle(self, table, row):
         """Araç sil"""
-        item = table.item(row, 0)
-        if not item:
+        arac_id = table.arac_id_at(row)
+        if arac_id is None:
             return
         
-        arac_id = item.data(Qt.ItemDataRole.UserRole)
-        
         # Araç bilgilerini al
-        araclar = self.db_manager.get_all_araclar()
-        arac_data = None
-        for arac in araclar:
-            if arac[0] == arac_id:
-                arac_data = arac
-                break
+        arac_data = self.db_manager.get_arac(arac_id)
         
         if not arac_data:
             return
@@ -3528,12 +6116,11 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Araç sil
-                cursor = self.db_manager.conn.cursor()
-                cursor.execute("DELETE FROM araclar WHERE id = ?", (arac_id,))
-                self.db_manager.conn.commit()
+                if not self.db_manager.delete_arac(arac_id):
+                    QMessageBox.critical(self, "Hata", "Araç silinirken hata oluştu!")
+                    return
                 
                 QMessageBox.information(self, "Başarılı", "Araç başarıyla silindi!")
-                self.load_vehicles_for_santiye()
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Araç silinirken hata oluştu: {str(e)}")
@@ -3542,8 +6129,7 @@ class MainWindow(QMainWindow):
         """Yeni araç ekle"""
         
         dialog = VehicleDialog(self, None, self.current_santiye_id)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.load_vehicles_for_santiye()
+        dialog.exec()
     
     def manage_santiyeler(self):
         """Şantiye yönetimi dialog'unu aç"""
@@ -3551,6 +6137,20 @@ class MainWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.load_santiyeler()
     
+    def ask_vehicle_merge_rule(self):
+        """Plakası kayıtlı araçların nasıl birleştirileceğini sor (son seçim hatırlanır)"""
+        rules = list(VEHICLE_MERGE_RULES)
+        last = self.settings.value("vehicle_import_merge", 'overwrite')
+        label, ok = QInputDialog.getItem(
+            self, "Araç İçe Aktarım", "Plakası zaten kayıtlı araçlar için:",
+            list(VEHICLE_MERGE_RULES.values()), rules.index(last) if last in rules else 0, False
+        )
+        if not ok:
+            return None
+        merge = rules[list(VEHICLE_MERGE_RULES.values()).index(label)]
+        self.settings.setValue("vehicle_import_merge", merge)
+        return merge
+    
     def import_vehicles_excel(self):
         """Araçları Excel'den içe aktar"""
         
@@ -3561,90 +6161,56 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        merge = self.ask_vehicle_merge_rule()
+        if merge is None:
+            return
+        
         try:
-            # Excel dosyasını oku
-            try:
-                df = pd.read_excel(file_path, engine='openpyxl')
-            except Exception:
-                df = pd.read_excel(file_path)
-            
-            # Sütunları normalize et
-            df = normalize_vehicle_columns(df)
-            
-            # Zorunlu sütunları kontrol et
-            required_cols = ['PLAKA']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                QMessageBox.critical(
-                    self, "Hata",
-                    f"Excel dosyasında zorunlu sütun bulunamadı: {', '.join(missing_cols)}\n"
-                    "Lütfen dosya başlıklarını kontrol edin."
-                )
-                return
-            
-            # Opsiyonel sütunlar için yoksa oluştur
-            optional_cols = ['CINS', 'MARKA', 'MODEL', 'MODEL_YILI', 'YAKIT_ORANI']
-            for col in optional_cols:
-                if col not in df.columns:
-                    df[col] = None
-            
-            # Verileri aktar
-            success_count = 0
-            error_count = 0
-            
-            for index, row in df.iterrows():
-                if pd.isna(row['PLAKA']):
-                    continue
-                
-                try:
-                    # Yakıt oranını temizle
-                    yakit_orani = None
-                    if 'YAKIT_ORANI' in df.columns and pd.notna(row['YAKIT_ORANI']):
-                        try:
-                            yakit_orani = float(row['YAKIT_ORANI'])
-                        except:
-                            yakit_orani = None
-                    
-                    # Model yılını temizle
-                    model_yili = None
-                    if 'MODEL_YILI' in df.columns and pd.notna(row['MODEL_YILI']):
-                        try:
-                            model_yili = int(row['MODEL_YILI'])
-                        except:
-                            model_yili = None
-                    
-                    # Araç ekle
-                    # Durum sütununu kontrol et
-                    durum = str(row['DURUM']) if 'DURUM' in df.columns and pd.notna(row['DURUM']) else 'Sağlam'
-                    
-                    arac_id = self.db_manager.add_arac_with_status(
-                        str(row['ARAC_MAKINE_ADI']) if 'ARAC_MAKINE_ADI' in df.columns and pd.notna(row['ARAC_MAKINE_ADI']) else None,
-                        str(row['PLAKA']),
-                        str(row['MAKINE_NO']) if 'MAKINE_NO' in df.columns and pd.notna(row['MAKINE_NO']) else None,
-                        str(row['MARKA']) if 'MARKA' in df.columns and pd.notna(row['MARKA']) else None,
-                        str(row['MODEL']) if 'MODEL' in df.columns and pd.notna(row['MODEL']) else None,
-                        model_yili,
-                        str(row['HESAP_ADI']) if 'HESAP_ADI' in df.columns and pd.notna(row['HESAP_ADI']) else None,
-                        self.current_santiye_id,
-                        durum
+            # Dosyayı parça parça oku; başlıklar normalize edilir
+            with self.db_manager.batch(), ExcelChunkReader(file_path, normalize_vehicle_columns) as reader:
+                # Zorunlu sütunları kontrol et
+                required_cols = ['PLAKA']
+                missing_cols = [col for col in required_cols if col not in reader.columns]
+                if missing_cols:
+                    QMessageBox.critical(
+                        self, "Hata",
+                        f"Excel dosyasında zorunlu sütun bulunamadı: {', '.join(missing_cols)}\n"
+                        "Lütfen dosya başlıklarını kontrol edin."
                     )
-                    
-                    if arac_id:
-                        success_count += 1
+                    return
+                
+                # Her parça tek transaction ile plakaya göre eklenir / güncellenir
+                progress = self.create_import_progress("Araçlar aktarılıyor", reader.total_rows)
+                read_count = 0
+                counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+                error_count = 0
+                cancelled = False
+                
+                for df in reader:
+                    rows = prepare_vehicle_rows(df)
+                    result = self.db_manager.upsert_araclar(rows, self.current_santiye_id, merge)
+                    if result is None:
+                        error_count += len(rows)
                     else:
-                        error_count += 1
-                        
-                except Exception as e:
-                    error_count += 1
-                    print(f"Araç ekleme hatası (satır {index}): {e}")
+                        for key in counts:
+                            counts[key] += len(result[key])
+                    read_count += len(df)
+                    cancelled = self.update_import_progress(
+                        progress, reader.total_rows, read_count, counts['inserted'] + counts['updated']
+                    )
+                    if cancelled:
+                        break
+                progress.close()
             
             # Sonuç mesajı
-            message = f"{success_count} araç başarıyla aktarıldı!"
+            message = (f"{counts['inserted']} araç eklendi, {counts['updated']} araç güncellendi, "
+                       f"{counts['unchanged']} araç değişmedi.")
+            if cancelled:
+                message = "Aktarım iptal edildi. İptalden önce:\n" + message
             if error_count > 0:
                 message += f"\n{error_count} araç aktarılamadı."
             
             QMessageBox.information(self, "İçe Aktarım Tamamlandı", message)
-            self.load_vehicles_for_santiye()
             
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Excel aktarım hatası: {str(e)}")
@@ -3663,59 +6229,28 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            # Araçları getir
-            araclar = self.db_manager.get_all_araclar()
+            # Araçları cursor üzerinden getir
+            araclar = self.db_manager.iter_araclar()
+            first = next(araclar, None)
             
-            if not araclar:
+            if first is None:
                 QMessageBox.information(self, "Bilgi", "Aktarılacak araç bulunamadı!")
                 return
             
-            # DataFrame oluştur
-            data = []
-            for arac in araclar:
-                # arac: (id, arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum, ariza_durumu, olusturma_tarihi)
-                data.append({
-                    'Sıra': len(data) + 1,
-                    'Araç / Makine Adı': arac[1] or '',
-                    'Plakası': arac[2] or '',
-                    'Makine No': arac[3] or '',
-                    'Markası': arac[4] or '',
-                    'Model': arac[5] or '',
-                    'Model Yılı': arac[6] or '',
-                    'Hesap Adı': arac[7] or '',
-                    'Durum': arac[9] or '',
-                    'Arıza Durumu': arac[10] or '',
-                    'Oluşturma Tarihi': arac[11] or ''
-                })
-            
-            df = pd.DataFrame(data)
-            
-            # Excel'e yaz
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Araçlar', index=False)
-                
-                # Sütun genişliklerini ayarla
-                worksheet = writer.sheets['Araçlar']
-                column_widths = {
-                    'A': 8,   # Sıra
-                    'B': 25,  # Araç / Makine Adı
-                    'C': 15,  # Plakası
-                    'D': 15,  # Makine No
-                    'E': 15,  # Markası
-                    'F': 15,  # Model
-                    'G': 12,  # Model Yılı
-                    'H': 20,  # Hesap Adı
-                    'I': 12,  # Durum
-                    'J': 15,  # Arıza Durumu
-                    'K': 20   # Oluşturma Tarihi
-                }
-                
-                for col, width in column_widths.items():
-                    worksheet.column_dimensions[col].width = width
+            # arac: (id, arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum, ariza_durumu, olusturma_tarihi)
+            rows = (
+                (i, *(value or None for value in arac[1:8]), *(value or None for value in arac[9:12]))
+                for i, arac in enumerate(chain((first,), araclar), 1)
+            )
+            headers = ['Sıra', 'Araç / Makine Adı', 'Plakası', 'Makine No', 'Markası', 'Model',
+                       'Model Yılı', 'Hesap Adı', 'Durum', 'Arıza Durumu', 'Oluşturma Tarihi']
+            # Sıra, Araç / Makine Adı, Plakası, Makine No, Markası, Model, Model Yılı, Hesap Adı, Durum, Arıza Durumu, Oluşturma Tarihi
+            column_widths = [8, 25, 15, 15, 15, 15, 12, 20, 12, 15, 20]
+            count = export_rows_to_excel(file_path, 'Araçlar', headers, rows, widths=column_widths)
             
             QMessageBox.information(
                 self, "Başarılı", 
-                f"{len(araclar)} araç başarıyla Excel dosyasına aktarıldı!\n\nDosya: {file_path}"
+                f"{count} araç başarıyla Excel dosyasına aktarıldı!\n\nDosya: {file_path}"
             )
             
         except Exception as e:
@@ -3741,12 +6276,11 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Tüm araçları sil
-                cursor = self.db_manager.conn.cursor()
-                cursor.execute("DELETE FROM araclar WHERE santiye_id = ?", (self.current_santiye_id,))
-                self.db_manager.conn.commit()
+                if not self.db_manager.delete_araclar_by_santiye(self.current_santiye_id):
+                    QMessageBox.critical(self, "Hata", "Araçlar silinirken hata oluştu!")
+                    return
                 
                 QMessageBox.information(self, "Başarılı", f"{len(araclar)} araç başarıyla silindi!")
-                self.load_vehicles_for_santiye()
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Araçlar silinirken hata oluştu: {str(e)}")
@@ -3770,21 +6304,41 @@ class MainWindow(QMainWindow):
                 fixed_count = self.db_manager.fix_all_vehicle_status(self.current_santiye_id)
                 
                 QMessageBox.information(self, "Başarılı", f"{fixed_count} araçın durumu düzeltildi!")
-                self.load_vehicles_for_santiye()
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Durumlar düzeltilirken hata oluştu: {str(e)}")
 
+    def stop_db_worker(self):
+        """Arka plan veritabanı thread'ini durdur"""
+        if self.db_thread.isRunning():
+            self.db_thread.quit()
+            self.db_thread.wait()
+        self.db_manager.remove_listener(self.db_changes.changed.emit)
+        self.db_manager.close()
+    
     def closeEvent(self, event):
         """Pencere kapanırken temizlik"""
+        if self.update_thread is not None:
+            # Yarım kalan indirme .part dosyasından sonra devam eder
+            self.update_worker.cancel()
+            self.update_thread.quit()
+            self.update_thread.wait()
+        self.stop_db_worker()
         # Normal kapanış işlemi
         event.accept()
 
 # ---------------------- Otomatik Güncelleme Sistemi ----------------------
 class UpdateManager:
-    """Otomatik güncelleme yönetim sınıfı"""
+    """Otomatik güncelleme yönetim sınıfı.
+    update_url: release bilgisinin (GitHub API biçiminde JSON) okunduğu adres;
+    temp_dir: indirilen dosyanın yazıldığı klasör;
+    settings: son kontrolün saklandığı QSettings (verilmezse her kontrol uygulama ayarlarını
+    kendi nesnesiyle açar, böylece kontrol başka thread'de güvenle çalışır);
+    check_interval: iki ağ kontrolü arasındaki en kısa süre (sn).
+    """
     
-    def __init__(self):
+    def __init__(self, update_url=None, temp_dir="temp_update", settings=None,
+                 check_interval=UPDATE_CHECK_INTERVAL_HOURS * 3600):
         # Sürüm bilgisini version.py'den al
         try:
             from version import VERSION
@@ -3793,24 +6347,69 @@ class UpdateManager:
             self.current_version = "1.0.0"
         
         self.github_repo = "The-Yunis/arac_bakim"  # GitHub repository
-        self.update_url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
+        self.update_url = update_url or f"https://api.github.com/repos/{self.github_repo}/releases/latest"
         self.download_url = f"https://github.com/{self.github_repo}/releases/latest"
-        
-    def check_for_updates(self):
-        """Güncelleme kontrolü yap"""
+        self.temp_dir = temp_dir
+        self.settings = settings
+        self.check_interval = check_interval
+        # Son kontrolde okunan release bilgisi; indirilecek dosya ve SHA-256 özeti buradan alınır
+        self.latest_release = None
+    
+    def _settings(self):
+        return self.settings if self.settings is not None else QSettings("OztacPetrol", "SantiyeYonetim")
+    
+    def cached_release(self, settings=None):
+        """QSettings'te saklanan son release bilgisi (yoksa None)"""
+        settings = settings or self._settings()
         try:
-            response = requests.get(self.update_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                latest_version = data['tag_name'].replace('v', '')
-                
-                if self.is_newer_version(latest_version, self.current_version):
-                    return True, latest_version, data['body'], data['html_url']
-                return False, None, None, None
+            data = settings.value("update_check/release", "")
+            return json.loads(data) if data else None
+        except ValueError:
+            return None
+        
+    def check_for_updates(self, force=False):
+        """Güncelleme kontrolü yap.
+        Son yanıt, ETag'i ve zamanı QSettings'te saklanır: check_interval dolmadan ağa çıkılmaz
+        (force=True hariç). İstek If-None-Match ile gönderilir; 304 yanıtında saklanan release
+        kullanılır. Ağ ya da sunucu hatasında (403, 5xx) son bilinen release ile karar verilir.
+        """
+        settings = self._settings()
+        cached = self.cached_release(settings)
+        checked_at = settings.value("update_check/checked_at", 0.0, type=float)
+        elapsed = time.time() - checked_at
+        if cached is not None and not force and 0 <= elapsed < self.check_interval:
+            release = cached
+        else:
+            release = None
+            try:
+                etag = settings.value("update_check/etag", "")
+                headers = {'If-None-Match': etag} if cached is not None and etag else {}
+                response = requests.get(self.update_url, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    release = cached
+                else:
+                    # Hız sınırı (403), sunucu hatası vb. aşağıdaki son bilinen release'e düşer
+                    response.raise_for_status()
+                    release = response.json()
+                    settings.setValue("update_check/release", json.dumps(release))
+                    settings.setValue("update_check/etag", response.headers.get('ETag', ''))
+                if release is not None:
+                    settings.setValue("update_check/checked_at", time.time())
+                    settings.sync()
+            except Exception as e:
+                print(f"Güncelleme kontrolü hatası: {e}")
+                release = cached
+        
+        if release is None:
             return False, None, None, None
-        except Exception as e:
+        self.latest_release = release
+        try:
+            latest_version = release['tag_name'].replace('v', '')
+            if self.is_newer_version(latest_version, self.current_version):
+                return True, latest_version, release['body'], release['html_url']
+        except (KeyError, AttributeError) as e:
             print(f"Güncelleme kontrolü hatası: {e}")
-            return False, None, None, None
+        return False, None, None, None
     
     def is_newer_version(self, latest, current):
         """Sürüm karşılaştırması"""
@@ -3830,35 +6429,125 @@ class UpdateManager:
         except:
             return False
     
-    def download_update(self, download_url):
-        """Güncellemeyi indir"""
+    def release_asset(self, release=None):
+        """Release bilgisinden indirilecek EXE'yi seç: {'name', 'url', 'size', 'sha256'}; EXE yoksa None.
+        release verilmezse son kontrolde okunan (o da yoksa update_url'den okunan) release kullanılır.
+        SHA-256, GitHub'ın asset özetinden (digest: "sha256:...") ya da yanındaki "<ad>.sha256" dosyasından okunur.
+        """
+        if release is None:
+            release = self.latest_release
+        if release is None:
+            response = requests.get(self.update_url, timeout=10)
+            response.raise_for_status()
+            release = self.latest_release = response.json()
+        assets = {asset['name']: asset for asset in release.get('assets', [])}
+        exe = assets.get(UPDATE_EXE_NAME) or next(
+            (asset for name, asset in assets.items() if name.lower().endswith('.exe')), None
+        )
+        if exe is None:
+            return None
+        sha256 = None
+        digest = exe.get('digest') or ''
+        if digest.startswith('sha256:'):
+            sha256 = digest[len('sha256:'):]
+        elif f"{exe['name']}.sha256" in assets:
+            # sha256sum çıktısı: "<özet>  <dosya adı>"
+            response = requests.get(assets[f"{exe['name']}.sha256"]['browser_download_url'], timeout=10)
+            response.raise_for_status()
+            sha256 = next(iter(response.text.split()), None)
+        return {
+            'name': exe['name'],
+            'url': exe['browser_download_url'],
+            'size': exe.get('size'),
+            'sha256': sha256.lower() if sha256 else None
+        }
+    
+    @staticmethod
+    def file_digest(path):
+        """Dosyanın SHA-256 nesnesi (parça parça okunur; dosya yoksa boş özet)"""
+        digest = hashlib.sha256()
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(UPDATE_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        return digest
+    
+    def download_update(self, asset=None, progress=None, cancel=None):
+        """Güncellemeyi parça parça indir ve SHA-256 özetini doğrula.
+        asset: release_asset() sonucu, None ise son release'ten seçilir.
+        Dosya temp_dir içindeki "<ad>.part" dosyasına yazılır; indirme yarıda kalırsa sonraki
+        çağrı HTTP Range ile kaldığı yerden devam eder. progress(indirilen, toplam) her parçada
+        çağrılır (toplam bilinmiyorsa None); cancel() True döndürürse indirme durur.
+        Dönen: (True, exe yolu) ya da (False, hata mesajı)
+        """
         try:
-            # GitHub'dan son release'i indir
-            response = requests.get(download_url, timeout=30)
-            if response.status_code == 200:
-                # İndirilen dosyayı geçici klasöre kaydet
-                temp_dir = "temp_update"
-                if not os.path.exists(temp_dir):
-                    os.makedirs(temp_dir)
-                
-                # EXE dosyasını indir (varsayılan olarak)
-                exe_url = f"https://github.com/{self.github_repo}/releases/latest/download/AracBakimYonetim.exe"
-                exe_response = requests.get(exe_url, timeout=60)
-                
-                if exe_response.status_code == 200:
-                    exe_path = os.path.join(temp_dir, "AracBakimYonetim.exe")
-                    with open(exe_path, 'wb') as f:
-                        f.write(exe_response.content)
-                    return True, exe_path
-                return False, None
-            return False, None
+            if asset is None:
+                asset = self.release_asset()
+            if asset is None:
+                return False, "Release içinde EXE dosyası bulunamadı"
+            if not asset.get('sha256'):
+                # Doğrulanamayan dosya kurulmaz
+                return False, "Release bilgisinde SHA-256 özeti yok"
+            os.makedirs(self.temp_dir, exist_ok=True)
+            exe_path = os.path.join(self.temp_dir, asset['name'])
+            part_path = f"{exe_path}.part"
+            
+            # Önceki indirmeden kalan kısım özete katılır, indirme devamından sürer
+            digest = self.file_digest(part_path)
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            total = asset.get('size')
+            for _ in range(2):
+                headers = {'Range': f"bytes={offset}-"} if offset else {}
+                with requests.get(asset['url'], headers=headers, stream=True, timeout=UPDATE_TIMEOUT) as response:
+                    content_range = response.headers.get('Content-Range', '')
+                    if response.status_code == 416 and offset and offset == total:
+                        # Dosya zaten tamamen inmiş
+                        break
+                    if response.status_code == 206 and content_range.startswith(f"bytes {offset}-"):
+                        mode = 'ab'
+                    elif response.status_code == 200:
+                        # Sunucu Range desteklemiyor: baştan indirilir
+                        mode, offset, digest = 'wb', 0, hashlib.sha256()
+                    elif response.status_code in (206, 416):
+                        # Kalan kısım bu dosyaya ait değil: Range olmadan yeniden istenir
+                        offset, digest = 0, hashlib.sha256()
+                        continue
+                    else:
+                        return False, f"Sunucu yanıtı: HTTP {response.status_code}"
+                    
+                    length = response.headers.get('Content-Length')
+                    if length is not None:
+                        total = offset + int(length)
+                    with open(part_path, mode) as f:
+                        for chunk in response.iter_content(UPDATE_CHUNK_SIZE):
+                            if cancel is not None and cancel():
+                                return False, "İndirme iptal edildi"
+                            f.write(chunk)
+                            digest.update(chunk)
+                            offset += len(chunk)
+                            if progress is not None:
+                                progress(offset, total)
+                break
+            
+            if total is not None and offset != total:
+                return False, "İndirme yarıda kaldı"
+            if digest.hexdigest() != asset['sha256']:
+                # Bozuk dosyadan devam edilmesin
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                return False, "İndirilen dosyanın SHA-256 özeti uyuşmuyor"
+            os.replace(part_path, exe_path)
+            return True, exe_path
         except Exception as e:
             print(f"İndirme hatası: {e}")
-            return False, None
+            return False, str(e)
     
-    def install_update(self, exe_path):
-        """Güncellemeyi kur"""
+    def install_update(self, exe_path, sha256=None):
+        """Güncellemeyi kur. sha256 verilirse dosya kopyalanmadan önce yeniden doğrulanır."""
         try:
+            if sha256 is not None and self.file_digest(exe_path).hexdigest() != sha256:
+                print("Kurulum hatası: güncelleme dosyasının SHA-256 özeti uyuşmuyor")
+                return False
             # Mevcut veritabanını yedekle
             if os.path.exists("bakim_kayitlari.db"):
                 shutil.copy("bakim_kayitlari.db", "bakim_kayitlari.db.backup")
@@ -3873,6 +6562,63 @@ class UpdateManager:
             print(f"Kurulum hatası: {e}")
             return False
 
+class UpdateChecker(QObject):
+    """UpdateManager.check_for_updates'i arka plan thread'inde çalıştırır; sonuç
+    result_ready((var_mı, sürüm, açıklama, adres), manuel_mi) sinyaliyle arayüz thread'ine iletilir.
+    """
+    
+    result_ready = pyqtSignal(object, bool)
+    
+    def __init__(self, update_manager, parent=None):
+        super().__init__(parent)
+        self.update_manager = update_manager
+    
+    def check(self, force=False, manual=False):
+        """Kontrolü başlat; force=True kontrol aralığını yok sayar"""
+        thread = threading.Thread(target=self._run, args=(force, manual), daemon=True)
+        thread.start()
+    
+    def _run(self, force, manual):
+        result = self.update_manager.check_for_updates(force)
+        try:
+            # Sinyal arayüz thread'indeki alıcıya kuyrukla iletilir
+            self.result_ready.emit(result, manual)
+        except RuntimeError:
+            # Pencere bu arada kapandı
+            pass
+
+class UpdateDownloadWorker(QObject):
+    """UpdateManager.download_update'i arayüz thread'i dışında çalıştıran işçi.
+    İlerleme progress(indirilen, toplam), sonuç finished(başarılı, exe yolu / hata mesajı)
+    sinyaliyle iletilir; cancel() indirmeyi bir sonraki parçada durdurur.
+    """
+    
+    progress = pyqtSignal(object, object)
+    finished = pyqtSignal(bool, str)
+    
+    def __init__(self, update_manager, asset=None):
+        super().__init__()
+        self.update_manager = update_manager
+        self.asset = asset
+        self._cancelled = threading.Event()
+    
+    @pyqtSlot()
+    def run(self):
+        try:
+            # Release bilgisi (ve .sha256 dosyası) da bu thread'de okunur
+            if self.asset is None:
+                self.asset = self.update_manager.release_asset()
+        except Exception as e:
+            self.finished.emit(False, str(e))
+            return
+        success, result = self.update_manager.download_update(
+            self.asset, progress=self.progress.emit, cancel=self._cancelled.is_set
+        )
+        self.finished.emit(success, result or '')
+    
+    def cancel(self):
+        self._cancelled.set()
+
 class UpdateDialog(QDialog):
     """Güncelleme dialog'u"""
     
@@ -4107,15 +6853,10 @@ class VehicleDialog(QDialog):
             try:
                 if self.vehicle_data:
                     # Düzenleme modu
-                    cursor = self.parent().db_manager.conn.cursor()
                     data = self.get_data()
-                    cursor.execute('''
-                        UPDATE araclar SET 
-                        arac_makine_adi = ?, plaka = ?, makine_no = ?, 
-                        marka = ?, model = ?, model_yili = ?, hesap_adi = ?
-                        WHERE id = ?
-                    ''', (*data, self.vehicle_data[0]))
-                    self.parent().db_manager.conn.commit()
+                    if not self.parent().db_manager.update_arac(self.vehicle_data[0], *data):
+                        QMessageBox.critical(self, "Hata", "Araç güncellenirken hata oluştu! Plaka başka bir araçta kayıtlı olabilir.")
+                        return
                     QMessageBox.information(self, "Başarılı", "Araç başarıyla güncellendi!")
                 else:
                     # Ekleme modu
@@ -4123,13 +6864,10 @@ class VehicleDialog(QDialog):
                         QMessageBox.warning(self, "Uyarı", "Şantiye ID bulunamadı!")
                         return
                     
-                    cursor = self.parent().db_manager.conn.cursor()
                     data = self.get_data()
-                    cursor.execute('''
-                        INSERT INTO araclar (arac_makine_adi, plaka, makine_no, marka, model, model_yili, hesap_adi, santiye_id, durum, ariza_durumu, olusturma_tarihi)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'Sağlam', 'Aktif', datetime('now'))
-                    ''', (*data, self.santiye_id))
-                    self.parent().db_manager.conn.commit()
+                    if not self.parent().db_manager.add_arac(*data, self.santiye_id):
+                        QMessageBox.critical(self, "Hata", "Araç eklenirken hata oluştu! Plaka zaten kayıtlı olabilir.")
+                        return
                     QMessageBox.information(self, "Başarılı", "Araç başarıyla eklendi!")
                 
                 super().accept()
@@ -4362,12 +7100,10 @@ class VehicleDetailDialog(QDialog):
             # Veritabanından güncel veriyi al
             main_window = self.parent()
             if main_window and hasattr(main_window, 'db_manager'):
-                araclar = main_window.db_manager.get_all_araclar()
-                for arac in araclar:
-                    if arac[0] == self.arac_data[0]:  # ID eşleşirse
-                        self.arac_data = arac
-                        self.load_data()  # Verileri yeniden yükle
-                        break
+                arac = main_window.db_manager.get_arac(self.arac_data[0])
+                if arac:
+                    self.arac_data = arac
+                    self.load_data()  # Verileri yeniden yükle
         except Exception as e:
             print(f"Veri yenileme hatası: {e}")
     
@@ -4386,7 +7122,6 @@ class VehicleDetailDialog(QDialog):
                 arac_id = self.arac_data[0]
                 if self.parent().db_manager.update_arac_durum(arac_id, 'Arızalı', ariza_data['ariza_detayi']):
                     QMessageBox.information(self, "Başarılı", "Arıza bildirimi kaydedildi! Araç arızalı listesine taşındı.")
-                    self.parent().load_vehicles_for_santiye()  # Listeleri yenile
                     self.close()  # Dialog'u kapat
                 else:
                     QMessageBox.critical(self, "Hata", "Arıza bildirimi kaydedilemedi!")
@@ -4412,7 +7147,6 @@ class VehicleDetailDialog(QDialog):
             # Bakım kaydını ekle
             if self.parent().db_manager.add_record(data):
                 QMessageBox.information(self, "Başarılı", "Bakım kaydı başarıyla eklendi!")
-                self.parent().load_data()  # Ana listeyi yenile
                 self.close()  # Dialog'u kapat
             else:
                 QMessageBox.critical(self, "Hata", "Bakım kaydı eklenirken hata oluştu!")
@@ -4433,9 +7167,6 @@ class VehicleDetailDialog(QDialog):
                 
                 if success:
                     QMessageBox.information(self, "Başarılı", "Araç durumu güncellendi! Araç artık aktif bölümünde görünecek.")
-                    # Ana pencereyi yenile
-                    if hasattr(main_window, 'load_vehicles_for_santiye'):
-                        main_window.load_vehicles_for_santiye()
                     # Dialog verilerini yenile
                     self.refresh_data()
                     # Dialog'u kapatma, kullanıcı güncel veriyi görebilsin
@@ -4677,6 +7408,7 @@ class MaintenanceRecordsDialog(QDialog):
             from PyQt6.QtCore import QTextStream, Qt
             from PyQt6.QtGui import QTextDocument, QTextCursor, QTextCharFormat, QFont, QTextTableFormat, QTextLength, QTextFrameFormat, QTextBlockFormat, QPageLayout
             from PyQt6.QtCore import QMarginsF
+            from PyQt6.QtPrintSupport import QPrinter
             
             # Dosya seçimi
             file_path, _ = QFileDialog.getSaveFileName(
@@ -4876,30 +7608,19 @@ class MaintenanceRecordsDialog(QDialog):
             if not file_path:
                 return
             
-            # Veri hazırla
-            data = []
-            for record in self.records:
-                # Tarih formatını düzelt
-                tarih = record[5] if record[5] else ""
-                if tarih and len(tarih) == 8 and tarih.isdigit():
-                    formatted_date = f"{tarih[4:8]}-{tarih[2:4]}-{tarih[0:2]}"
-                else:
-                    formatted_date = tarih
-                
-                data.append({
-                    'Sıra': record[1] or "",
-                    'Tarih': formatted_date,
-                    'Bakım KM': record[6] or "",
-                    'Sonraki Bakım KM': record[7] or "",
-                    'Yapılan İşlem': record[8] or "",
-                    'Bölge': record[4] or "",
-                    'Kapı No': record[3] or "",
-                    'Bakım Yapan': record[10] or ""
-                })
+            def rows():
+                for record in self.records:
+                    # Tarih formatını düzelt
+                    tarih = record[5] if record[5] else ""
+                    if tarih and len(tarih) == 8 and tarih.isdigit():
+                        formatted_date = f"{tarih[4:8]}-{tarih[2:4]}-{tarih[0:2]}"
+                    else:
+                        formatted_date = tarih
+                    yield (record[1] or None, formatted_date or None, record[6] or None, record[7] or None,
+                           record[8] or None, record[4] or None, record[3] or None, record[10] or None)
             
-            # DataFrame oluştur ve Excel'e yaz
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False, engine='openpyxl')
+            headers = ['Sıra', 'Tarih', 'Bakım KM', 'Sonraki Bakım KM', 'Yapılan İşlem', 'Bölge', 'Kapı No', 'Bakım Yapan']
+            export_rows_to_excel(file_path, 'Bakım Kayıtları', headers, rows())
             
             QMessageBox.information(self, "Başarılı", f"Excel dosyası başarıyla oluşturuldu:\n{file_path}")
             
@@ -5508,14 +8229,18 @@ class ArizaDialog(QDialog):
 
 def main():
     """Ana fonksiyon"""
+    # Modül gövdesi (importlar ve sınıf tanımları) burada tamamlanmış olur
+    STARTUP_TIMER.mark('modüller yüklendi')
     app = QApplication(sys.argv)
     
     # Uygulama ayarları
     app.setApplicationName("Araç Bakım Kayıtları Yönetim Sistemi")
     app.setApplicationVersion("1.0")
+    STARTUP_TIMER.mark('QApplication oluşturuldu')
     
     # Ana pencere
     window = MainWindow()
+    STARTUP_TIMER.mark('pencere oluşturuldu')
     window.show()
     
     sys.exit(app.exec())
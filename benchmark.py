@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Performans ölçüm scripti
+
+Sentetik şantiye / araç / bakım verisi içeren veritabanları ve Excel dosyaları
+üretir, bakim_gui.py'deki sık kullanılan yolları (veritabanı sorguları, tablo
+doldurma, filtreleme, tarih normalleştirme, Excel içe/dışa aktarım) Qt
+offscreen platformunda birkaç ölçek için ölçer ve sonuçları JSON olarak yazar.
+
+Örnek:
+    python benchmark.py --scales 1000,10000,100000 --output sonuc.json
+    python benchmark.py --module eski/bakim_gui.py --output eski.json
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from version import VERSION
+
+BOLGELER = ["MERKEZ", "KUZEY", "GÜNEY", "DOĞU", "BATI", "İSTASYON", "ŞANTİYE SAHASI"]
+BAKIM_YAPANLAR = ["YUNUS AFŞİN", "MEHMET ÖZ", "ALİ ÇELİK", "HASAN IŞIK", "SERVİS"]
+ISLEMLER = [
+    "YAĞ BAKIMI YAPILDI", "YAĞ VE FİLTRE DEĞİŞİMİ", "FREN BALATASI DEĞİŞTİ",
+    "HİDROLİK HORTUM DEĞİŞİMİ", "LASTİK DEĞİŞİMİ", "AKÜ DEĞİŞİMİ", "GENEL KONTROL",
+]
+MAKINELER = ["EKSKAVATÖR", "DOZER", "GREYDER", "KAMYON", "LODER", "SİLİNDİR", "VİNÇ", "PİKAP"]
+MARKALAR = ["CAT", "KOMATSU", "VOLVO", "HİDROMEK", "FORD", "MERCEDES", "JCB"]
+EXCEL_HEADERS = ["S.NO", "PLAKA", "KAPI NUMARASI", "BÖLGE", "TARİH", "BAKIM ESNASINDA KM",
+                 "BİR SONRAKİ BAKIM KM", "YAPILAN İŞLEM", "DİĞER", "BAKIMI YAPAN"]
+
+
+def load_target(module_path):
+    """Ölçülecek bakim_gui.py sürümünü yükle"""
+    spec = importlib.util.spec_from_file_location("bakim_gui", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["bakim_gui"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_plate(rng):
+    """'34 ABC 123' biçiminde plaka üret"""
+    letters = "".join(rng.choice("ABCDEFGHJKLMNPRSTUVYZ") for _ in range(rng.randint(1, 3)))
+    return f"{rng.randint(1, 81):02d} {letters} {rng.randint(10, 9999)}"
+
+
+def random_date_text(rng, day):
+    """Gerçek verideki karışık tarih biçimleri: dd.MM.yyyy, yyyymmdd, ISO ve boş"""
+    roll = rng.random()
+    if roll < 0.60:
+        return day.strftime("%d.%m.%Y")
+    if roll < 0.85:
+        return day.strftime("%Y%m%d")
+    if roll < 0.95:
+        return day.strftime("%Y-%m-%d 00:00:00")
+    return ""
+
+
+def random_km_text(rng, km):
+    """KM değeri: noktalı, düz veya boş"""
+    roll = rng.random()
+    if roll < 0.6:
+        return f"{km:,}".replace(",", ".")
+    if roll < 0.9:
+        return str(km)
+    return ""
+
+
+def generate_rows(rng, plates, count):
+    """(plaka, kapi_no, bolge, tarih (date), bakim_km, sonraki_km, islem, diger, yapan) satırları üret"""
+    start = date(2015, 1, 1)
+    span = (date(2025, 12, 31) - start).days
+    for _ in range(count):
+        day = start + timedelta(days=rng.randint(0, span))
+        km = rng.randint(1_000, 400_000)
+        yield (
+            rng.choice(plates),
+            str(rng.randint(1, 500)) if rng.random() < 0.7 else "",
+            rng.choice(BOLGELER),
+            day,
+            km,
+            km + rng.choice((5_000, 10_000, 15_000)) if rng.random() < 0.8 else None,
+            rng.choice(ISLEMLER),
+            "ACİL" if rng.random() < 0.05 else "",
+            rng.choice(BAKIM_YAPANLAR),
+        )
+
+
+def generate_database(target, path, sites, vehicles, records, seed=42):
+    """Sentetik veritabanı oluştur; şema hedef modülün DatabaseManager'ı ile kurulur"""
+    rng = random.Random(seed)
+    manager = target.DatabaseManager(db_name=path)
+    if hasattr(manager, "close"):
+        manager.close()
+    else:
+        manager.conn.close()
+
+    plates = list({random_plate(rng) for _ in range(vehicles * 2)})[:vehicles]
+    conn = sqlite3.connect(path)
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO santiyeler (santiye_adi, lokasyon, sorumlu) VALUES (?, ?, ?)",
+            [(f"ŞANTİYE {i + 1}", rng.choice(BOLGELER), rng.choice(BAKIM_YAPANLAR)) for i in range(sites)]
+        )
+        site_ids = [row[0] for row in cursor.execute("SELECT id FROM santiyeler")]
+        cursor.executemany(
+            """INSERT INTO araclar (arac_makine_adi, plaka, makine_no, marka, model, model_yili,
+                                    hesap_adi, santiye_id, durum, ariza_durumu)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(rng.choice(MAKINELER), plate, f"M-{i:05d}", rng.choice(MARKALAR), f"MODEL {rng.randint(1, 20)}",
+              rng.randint(1995, 2025), "DEMİRBAŞ", rng.choice(site_ids),
+              "Sağlam" if rng.random() < 0.85 else "Arızalı", "Aktif")
+             for i, plate in enumerate(plates)]
+        )
+        # Ara sıra araç listesinde olmayan plakalar da bakım kaydına girer
+        record_plates = plates + [random_plate(rng) for _ in range(max(1, vehicles // 20))]
+        cursor.executemany(
+            """INSERT INTO bakimlar (plaka, kapi_no, bolge, tarih, bakim_km, sonraki_bakim_km,
+                                     yapilan_islem, diger, bakim_yapan)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            ((plaka, kapi, bolge, random_date_text(rng, day), random_km_text(rng, km),
+              random_km_text(rng, next_km) if next_km else "", islem, diger, yapan)
+             for plaka, kapi, bolge, day, km, next_km, islem, diger, yapan
+             in generate_rows(rng, record_plates, records))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    # Yeniden açılış, eksik tarih anahtarı gibi türetilmiş alanları doldurur
+    manager = target.DatabaseManager(db_name=path)
+    if hasattr(manager, "close"):
+        manager.close()
+    else:
+        manager.conn.close()
+    return plates
+
+
+def generate_excel(path, rows, seed=7):
+    """İçe aktarım için Excel dosyası üret (karışık tarih ve KM biçimleriyle)"""
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    plates = [random_plate(rng) for _ in range(max(10, rows // 50))]
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Bakım Kayıtları")
+    sheet.append(EXCEL_HEADERS)
+    for i, (plaka, kapi, bolge, day, km, next_km, islem, diger, yapan) in enumerate(generate_rows(rng, plates, rows), 1):
+        roll = rng.random()
+        if roll < 0.4:
+            tarih = datetime(day.year, day.month, day.day)  # Excel tarih hücresi
+        elif roll < 0.7:
+            tarih = day.strftime("%d.%m.%Y")
+        elif roll < 0.95:
+            tarih = int(day.strftime("%Y%m%d"))
+        else:
+            tarih = None
+        sheet.append([i, plaka, kapi or None, bolge, tarih, km if rng.random() < 0.5 else random_km_text(rng, km),
+                      next_km, islem, diger or None, yapan])
+    workbook.save(path)
+
+
+class BenchmarkRun:
+    """Bir ölçek noktası için ölçümleri toplar"""
+
+    def __init__(self, scale, repeat):
+        self.scale = scale
+        self.repeat = repeat
+        self.results = []
+
+    def measure(self, name, func, repeat=None, setup=None):
+        """func'ı tekrar tekrar çalıştırıp süreleri kaydet; hedef sürümde yoksa atla"""
+        runs = []
+        try:
+            for _ in range(repeat or self.repeat):
+                if setup:
+                    setup()
+                started = time.perf_counter()
+                func()
+                runs.append(time.perf_counter() - started)
+        except AttributeError as e:
+            self.results.append({"scale": self.scale, "name": name, "status": "skipped", "reason": str(e)})
+            print(f"  {name:<40} atlandı ({e})")
+            return
+        self.results.append({
+            "scale": self.scale,
+            "name": name,
+            "status": "ok",
+            "min": min(runs),
+            "median": statistics.median(runs),
+            "runs": runs,
+        })
+        print(f"  {name:<40} {min(runs) * 1000:10.1f} ms (medyan {statistics.median(runs) * 1000:.1f} ms)")
+
+
+def wait_until(app, condition, timeout=120.0):
+    """Koşul sağlanana kadar Qt olaylarını işle"""
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    app.processEvents()
+
+
+def run_scale(target, app, workdir, scale, args):
+    """Tek bir ölçek noktası: veri üret, ölç, sonuçları döndür"""
+    from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
+    run = BenchmarkRun(scale, args.repeat)
+    vehicles = max(20, scale // args.records_per_vehicle)
+    scale_dir = os.path.join(workdir, f"olcek_{scale}")
+    os.makedirs(scale_dir, exist_ok=True)
+    db_path = os.path.join(scale_dir, "bakim_kayitlari.db")
+
+    print(f"\n=== {scale} bakım kaydı, {vehicles} araç, {args.sites} şantiye ===")
+    started = time.perf_counter()
+    plates = generate_database(target, db_path, args.sites, vehicles, scale)
+    print(f"  veri üretimi: {time.perf_counter() - started:.1f} sn")
+    excel_rows = min(scale, args.excel_max_rows)
+    excel_path = os.path.join(scale_dir, "ice_aktarim.xlsx")
+    generate_excel(excel_path, excel_rows)
+    export_path = os.path.join(scale_dir, "disa_aktarim.xlsx")
+
+    # Veritabanı sorguları
+    db = target.DatabaseManager(db_name=db_path)
+    run.measure("db.get_all_records", db.get_all_records)
+    run.measure("db.get_records_page", lambda: db.get_records_page())
+    run.measure("db.get_statistics", db.get_statistics)
+    run.measure("db.search_records", lambda: db.search_records(plates[0][:5]))
+    run.measure("db.get_vehicle_maintenance_records", lambda: db.get_vehicle_maintenance_records(plates[1]))
+    run.measure("db.get_all_araclar", db.get_all_araclar)
+    run.measure("db.iter_records(bolge)", lambda: sum(1 for _ in db.iter_records(bolge=BOLGELER[0])))
+    records = db.get_all_records()
+    tarihler = [r[5] for r in records]
+    run.measure("normalize_date_display", lambda: [target.normalize_date_display(t) for t in tarihler])
+    if hasattr(db, "close"):
+        db.close()
+
+    # Arayüz: MainWindow veritabanını çalışma dizinindeki varsayılan adla açar
+    previous_cwd = os.getcwd()
+    os.chdir(scale_dir)
+    window = None
+    try:
+        with mock.patch.object(target.MainWindow, "check_updates_on_startup", lambda self: None, create=True):
+            started = time.perf_counter()
+            window = target.MainWindow()
+            window.show()
+            wait_until(app, lambda: window.table.model().rowCount() > 0)
+            elapsed = time.perf_counter() - started
+            run.results.append({"scale": scale, "name": "MainWindow.ilk_yukleme", "status": "ok",
+                                "min": elapsed, "median": elapsed, "runs": [elapsed]})
+            print(f"  {'MainWindow.ilk_yukleme':<40} {elapsed * 1000:10.1f} ms")
+
+            def populate():
+                window.populate_table(records)
+                app.processEvents()
+            run.measure("MainWindow.populate_table", populate)
+
+            def filter_bolge():
+                window.filter_bolge.blockSignals(True)
+                window.filter_bolge.setCurrentText(BOLGELER[1])
+                window.filter_bolge.blockSignals(False)
+                window.apply_filters()
+                app.processEvents()
+
+            def reset_filters():
+                window.filter_bolge.blockSignals(True)
+                window.filter_bolge.setCurrentIndex(0)
+                window.filter_bolge.blockSignals(False)
+                window.apply_filters()
+            run.measure("MainWindow.apply_filters", filter_bolge, setup=reset_filters)
+            reset_filters()
+
+            # Dışa aktarımın tahmin sayfası km tahmin modelini kullanır; model ölçümden önce kurulur
+            if hasattr(window, "load_upcoming"):
+                window.load_upcoming()
+                wait_until(app, lambda: window.km_forecaster is not None)
+
+            def export():
+                window.export_excel()
+                # Model yoksa dosya arka planda kurulan model gelince yazılır
+                wait_until(app, lambda: getattr(window, "pending_export_path", None) is None)
+            with mock.patch.object(QFileDialog, "getSaveFileName", return_value=(export_path, "")), \
+                    mock.patch.object(QMessageBox, "information"), \
+                    mock.patch.object(QMessageBox, "critical") as critical:
+                run.measure("MainWindow.export_excel", export)
+                if critical.called:
+                    print(f"  dışa aktarım hatası: {critical.call_args}")
+
+            # Her içe aktarım boş tabloya yapılır
+            def clear_records():
+                window.db_manager.delete_all()
+            with mock.patch.object(QFileDialog, "getOpenFileName", return_value=(excel_path, "")), \
+                    mock.patch.object(QMessageBox, "information"), \
+                    mock.patch.object(QMessageBox, "critical") as critical:
+                run.measure(f"MainWindow.import_excel({excel_rows} satır)", window.import_excel,
+                            setup=clear_records)
+                if critical.called:
+                    print(f"  içe aktarım hatası: {critical.call_args}")
+    finally:
+        if window is not None:
+            window.close()
+            app.processEvents()
+        os.chdir(previous_cwd)
+    return run.results
+
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="bakim_gui.py performans ölçümleri")
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="Bakım kaydı sayıları, virgülle ayrılmış (varsayılan: 1000,10000,100000)")
+    parser.add_argument("--sites", type=int, default=5, help="Şantiye sayısı (varsayılan: 5)")
+    parser.add_argument("--records-per-vehicle", type=int, default=10,
+                        help="Araç başına ortalama bakım kaydı (varsayılan: 10)")
+    parser.add_argument("--excel-max-rows", type=int, default=50000,
+                        help="İçe aktarım dosyasının en fazla satır sayısı (varsayılan: 50000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı (varsayılan: 3)")
+    parser.add_argument("--module", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "bakim_gui.py"),
+                        help="Ölçülecek bakim_gui.py dosyası")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON sonuç dosyası")
+    parser.add_argument("--keep", action="store_true", help="Üretilen veritabanı ve Excel dosyalarını silme")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    module_path = os.path.abspath(args.module)
+    with open(module_path, "rb") as f:
+        module_hash = hashlib.sha256(f.read()).hexdigest()
+
+    import_started = time.perf_counter()
+    target = load_target(module_path)
+    import_seconds = time.perf_counter() - import_started
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    workdir = tempfile.mkdtemp(prefix="bakim_benchmark_")
+    print(f"🚀 Sürüm {VERSION} ölçülüyor ({module_path})")
+    print(f"Çalışma dizini: {workdir}")
+    results = [{"scale": 0, "name": "modul_yukleme", "status": "ok",
+                "min": import_seconds, "median": import_seconds, "runs": [import_seconds]}]
+    try:
+        for scale in scales:
+            results.extend(run_scale(target, app, workdir, scale, args))
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "version": VERSION,
+        "module": module_path,
+        "module_sha256": module_hash,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "scales": scales,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Sonuçlar kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,9 @@ def build_exe():
             "--hidden-import=PyQt6.QtCore",
             "--hidden-import=PyQt6.QtWidgets", 
             "--hidden-import=PyQt6.QtGui",
+            "--hidden-import=PyQt6.QtPrintSupport",
             "--hidden-import=pandas",
+            "--hidden-import=numpy",
             "--hidden-import=openpyxl",
             "--hidden-import=requests",
             "--exclude-module=PyQt5",
@@ -0,0 +1,128 @@
+"""UpdateManager.download_update testleri.
+Yerel bir ThreadingHTTPServer, release dosyasını HTTP Range desteğiyle (206 / 200 / 416) sunar.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bakim_gui  # noqa: E402
+
+PAYLOAD = os.urandom(300_000)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Sunucunun davranışı server.honor_range ve server.payload ile ayarlanır"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        payload = self.server.payload
+        range_header = self.headers.get('Range')
+        self.server.requests.append(range_header)
+        start = 0
+        if range_header and self.server.honor_range:
+            start = int(range_header.split('=')[1].split('-')[0])
+            if start >= len(payload):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(payload)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(payload) - 1}/{len(payload)}')
+        else:
+            self.send_response(200)
+        data = payload[start:]
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class DownloadUpdateTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.payload = PAYLOAD
+        self.server.honor_range = True
+        self.server.requests = []
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = bakim_gui.UpdateManager(update_url='http://127.0.0.1/yok', temp_dir=self.temp_dir)
+        self.asset = {
+            'name': bakim_gui.UPDATE_EXE_NAME,
+            'url': f'http://127.0.0.1:{self.server.server_address[1]}/exe',
+            'size': len(PAYLOAD),
+            'sha256': hashlib.sha256(PAYLOAD).hexdigest(),
+        }
+        self.exe_path = os.path.join(self.temp_dir, bakim_gui.UPDATE_EXE_NAME)
+        self.part_path = f'{self.exe_path}.part'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_part(self, data):
+        with open(self.part_path, 'wb') as f:
+            f.write(data)
+
+    def read_exe(self):
+        with open(self.exe_path, 'rb') as f:
+            return f.read()
+
+    def test_resumes_with_range_on_206(self):
+        self.write_part(PAYLOAD[:100_000])
+        progress = []
+        result = self.manager.download_update(self.asset, progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(result, (True, self.exe_path))
+        self.assertEqual(self.server.requests, ['bytes=100000-'])
+        self.assertEqual(self.read_exe(), PAYLOAD)
+        self.assertEqual(progress[-1], (len(PAYLOAD), len(PAYLOAD)))
+        self.assertFalse(os.path.exists(self.part_path))
+
+    def test_restarts_when_server_answers_200(self):
+        # Range desteklemeyen sunucu: kalan kısım atılır, dosya baştan yazılır
+        self.server.honor_range = False
+        self.write_part(b'x' * 100_000)
+        result = self.manager.download_update(self.asset)
+        self.assertEqual(result, (True, self.exe_path))
+        self.assertEqual(self.server.requests, ['bytes=100000-'])
+        self.assertEqual(self.read_exe(), PAYLOAD)
+
+    def test_complete_part_on_416(self):
+        self.write_part(PAYLOAD)
+        result = self.manager.download_update(self.asset)
+        self.assertEqual(result, (True, self.exe_path))
+        self.assertEqual(self.server.requests, [f'bytes={len(PAYLOAD)}-'])
+        self.assertEqual(self.read_exe(), PAYLOAD)
+
+    def test_digest_mismatch_removes_part(self):
+        self.server.payload = bytes(len(PAYLOAD))
+        success, message = self.manager.download_update(self.asset)
+        self.assertFalse(success)
+        self.assertIn('SHA-256', message)
+        self.assertFalse(os.path.exists(self.part_path))
+        self.assertFalse(os.path.exists(self.exe_path))
+        # Sonraki deneme bozuk kısımdan devam etmez, baştan ister
+        self.server.payload = PAYLOAD
+        self.assertEqual(self.manager.download_update(self.asset), (True, self.exe_path))
+        self.assertEqual(self.server.requests, [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()